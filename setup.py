@@ -6,18 +6,17 @@ Setup script for NeruCord Archiver
 import subprocess
 import sys
 import os
-from pathlib import Path
 
 
 def run_command(command, description):
-    """Run a command and handle errors."""
+    """Run a command (argv list) and handle errors, streaming its output."""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        subprocess.run(command, check=True)
         print(f"✅ {description} completed successfully")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed: {e.stderr}")
+    except (subprocess.CalledProcessError, OSError) as e:
+        print(f"❌ {description} failed: {e}")
         return False
 
 
@@ -32,27 +31,22 @@ def check_python_version():
 
 def install_dependencies():
     """Install required dependencies."""
-    commands = [
-        ("pip install --upgrade pip", "Upgrading pip"),
-        ("pip install -r requirements.txt", "Installing dependencies"),
-    ]
-    
-    for command, description in commands:
-        if not run_command(command, description):
-            return False
-    return True
+    return run_command(
+        [sys.executable, "-m", "pip", "install", "--upgrade", "pip", "-r", "requirements.txt"],
+        "Upgrading pip and installing dependencies",
+    )
 
 
 def run_tests():
     """Run the test suite."""
-    return run_command("python -m pytest tests/ -v", "Running test suite")
+    return run_command([sys.executable, "-m", "pytest", "tests/", "-v"], "Running test suite")
 
 
 def create_directories():
     """Create necessary directories."""
-    directories = ["downloads", "downloads/audio", "downloads/video"]
-    for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+    # Creating the leaf directories also creates the shared "downloads" parent
+    for directory in ("downloads/audio", "downloads/video"):
+        os.makedirs(directory, exist_ok=True)
     print("✅ Created download directories")
 
 
@@ -2,13 +2,49 @@
 Base CLI components for consistent interface implementation.
 """
 
+import asyncio
 import os
+import re
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from typing import Optional, List, Callable
 from colorama import Fore, Style, init
 
-# Initialize colorama
-init(autoreset=True)
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional
+    uvloop = None
+
+# POSIX terminals understand ANSI codes directly, so colorama's stdout
+# wrapper (an extra write and flush per call) is only installed where codes
+# must be translated (Windows consoles) or stripped (pipes and files).
+if os.name == 'nt' or not sys.stdout.isatty():
+    init(autoreset=True)
+
+# Pre-built message prefixes; each message is emitted as a single write so
+# colorama's autoreset runs once per line rather than after every fragment.
+_HDR = f"\n{Fore.CYAN}{Style.BRIGHT}"
+_RULE = Fore.CYAN
+_PFX = {
+    "ok": f"{Fore.GREEN}✓ ",
+    "err": f"{Fore.RED}✗ ",
+    "warn": f"{Fore.YELLOW}⚠ ",
+    "info": f"{Fore.BLUE}ℹ ",
+}
+# Each line resets its own styling; autoreset is not active on every platform
+_RST = Style.RESET_ALL + "\n"
+_PROGRESS_PFX = {
+    "green": f"\r{Fore.GREEN}[",
+    "yellow": f"\r{Fore.YELLOW}[",
+}
+
+# Selection grammar: comma-separated numbers or "start-end" ranges
+_SELECTION_PART = r"\s*\d+\s*(?:-\s*\d+\s*)?"
+_SELECTION_RE = re.compile(rf"{_SELECTION_PART}(?:,{_SELECTION_PART})*")
+_SELECTION_TOKEN_RE = re.compile(r"(\d+)\s*(?:-\s*(\d+))?")
 
 
 class BaseInterface(ABC):
@@ -19,28 +55,40 @@ class BaseInterface(ABC):
     
     def clear_screen(self):
         """Clear terminal screen."""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        if not sys.stdout.isatty():
+            os.system('clear' if os.name == 'posix' else 'cls')
+            return
+        # colorama translates the escape sequence on Windows consoles
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
     
     def print_header(self, title: str):
         """Print section header."""
-        print(f"\n{Fore.CYAN}{Style.BRIGHT}{title}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{'-' * len(title)}{Style.RESET_ALL}")
+        sys.stdout.write(f"{_HDR}{title}{_RST}{_RULE}{'-' * len(title)}{_RST}")
     
     def print_success(self, message: str):
         """Print success message."""
-        print(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
+        sys.stdout.write(f"{_PFX['ok']}{message}{_RST}")
     
     def print_error(self, message: str):
         """Print error message."""
-        print(f"{Fore.RED}✗ {message}{Style.RESET_ALL}")
+        sys.stdout.write(f"{_PFX['err']}{message}{_RST}")
     
     def print_warning(self, message: str):
         """Print warning message."""
-        print(f"{Fore.YELLOW}⚠ {message}{Style.RESET_ALL}")
+        sys.stdout.write(f"{_PFX['warn']}{message}{_RST}")
     
     def print_info(self, message: str):
         """Print info message."""
-        print(f"{Fore.BLUE}ℹ {message}{Style.RESET_ALL}")
+        sys.stdout.write(f"{_PFX['info']}{message}{_RST}")
+    
+    def _emit(self, lines: List[str]):
+        """Write several lines with a single write.
+        
+        Output is not flushed here; prompts and progress bars flush before
+        waiting on the user.
+        """
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def get_input(self, prompt: str, required: bool = True) -> Optional[str]:
         """Get user input with validation."""
@@ -50,6 +98,32 @@ class BaseInterface(ABC):
                 return value if value else None
             self.print_error("Input cannot be empty. Please try again.")
     
+    async def aget_input(self, prompt: str, required: bool = True) -> Optional[str]:
+        """Get user input without blocking the event loop."""
+        return await self._read_off_loop(self.get_input, prompt, required)
+    
+    async def _read_off_loop(self, read_fn, *args):
+        """Run a blocking prompt without blocking the event loop.
+        
+        The blocking read runs on a daemon thread rather than the loop's
+        default executor, so an interrupted prompt cannot hold up shutdown.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        def read():
+            try:
+                result = (read_fn(*args), None)
+            except BaseException as e:
+                result = (None, e)
+            try:
+                loop.call_soon_threadsafe(_settle, future, *result)
+            except RuntimeError:
+                pass  # Loop already closed
+        
+        threading.Thread(target=read, daemon=True).start()
+        return await future
+    
     def get_choice(self, prompt: str, choices: List[str]) -> str:
         """Get user choice from list of options."""
         while True:
@@ -59,34 +133,148 @@ class BaseInterface(ABC):
             valid_choices = ", ".join(choices)
             self.print_error(f"Invalid choice. Valid options: {valid_choices}")
     
+    def get_single_key(self, prompt: str, choices: List[str]) -> str:
+        """Read a single keypress from choices without waiting for Enter.
+        
+        Falls back to line input when stdin is not an interactive terminal.
+        """
+        if not sys.stdin.isatty():
+            return self.get_choice(prompt, choices)
+        
+        sys.stdout.write(f"{Fore.GREEN}{prompt}")
+        sys.stdout.flush()
+        while True:
+            key = _read_key().lower()
+            if key in ('\x03', '\x04'):
+                raise KeyboardInterrupt
+            if key in choices:
+                sys.stdout.write(f"{key}{_RST}")
+                return key
+    
     def wait_for_continue(self):
         """Wait for user to press Enter."""
         input(f"{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
 
 
+def _settle(future, result, error):
+    """Complete a future from a thread callback unless it was cancelled."""
+    if future.cancelled():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+if os.name == 'nt':
+    import msvcrt
+    
+    def _read_key() -> str:
+        """Read one key from the console without echo."""
+        return msvcrt.getwch()
+else:
+    import termios
+    import tty
+    
+    def _read_key() -> str:
+        """Read one key from the terminal in cbreak mode without echo."""
+        fd = sys.stdin.fileno()
+        old_attrs = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            return sys.stdin.read(1)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+
+
+# All 21 possible 20-character progress bars, indexed by fill level
+_BARS = tuple("█" * filled + "░" * (20 - filled) for filled in range(21))
+
+
 class ProgressDisplay:
-    """Handles progress display for downloads."""
+    """Handles progress display for downloads.
     
-    @staticmethod
-    def show_progress(current: int, total: int, title: str = ""):
+    Redraws are time-gated: a bar is only written when at least
+    ``min_interval`` seconds have passed since the previous one, except for
+    the final update which is always shown.
+    """
+    
+    def __init__(self, min_interval: float = 0.1):
+        self._interval = min_interval
+        self._last = 0.0
+        self._tasks = {}
+    
+    def _should_emit(self, done: bool) -> bool:
+        """Check whether enough time has passed to redraw the bar."""
+        now = time.monotonic()
+        if not done and now - self._last < self._interval:
+            return False
+        self._last = now
+        return True
+    
+    def show_progress(self, current: int, total: int, title: str = ""):
         """Display progress bar."""
-        if total == 0:
+        if total == 0 or not self._should_emit(current >= total):
             return
         
-        percentage = (current / total) * 100
-        filled = int(percentage // 5)
-        bar = "█" * filled + "░" * (20 - filled)
+        bar = _BARS[min(current * 20 // total, 20)]
+        percentage = current * 100.0 / total
         
         # Truncate title if too long
         display_title = title[:40] + "..." if len(title) > 40 else title
-        print(f"\r{Fore.GREEN}[{bar}] {percentage:.1f}% ({current}/{total}) {display_title}", end="")
+        sys.stdout.write(f"{_PROGRESS_PFX['green']}{bar}] {percentage:.1f}% ({current}/{total}) {display_title}{Style.RESET_ALL}")
+        sys.stdout.flush()
     
-    @staticmethod
-    def show_single_progress(progress: float):
+    def show_multi_progress(self, key, current: int, total: int, title: str = ""):
+        """Display combined progress of several concurrent tasks on one bar."""
+        self._tasks[key] = (current, total)
+        done = sum(c for c, _ in self._tasks.values())
+        overall = sum(t for _, t in self._tasks.values())
+        self.show_progress(done, overall, title)
+    
+    def reset_multi_progress(self):
+        """Forget tasks tracked by show_multi_progress."""
+        self._tasks.clear()
+    
+    def show_single_progress(self, progress: float):
         """Display single download progress."""
-        filled = int(progress // 5)
-        bar = "█" * filled + "░" * (20 - filled)
-        print(f"\r{Fore.YELLOW}[{bar}] {progress:.1f}%", end="")
+        if not self._should_emit(progress >= 100):
+            return
+        bar = _BARS[min(max(int(progress) // 5, 0), 20)]
+        sys.stdout.write(f"{_PROGRESS_PFX['yellow']}{bar}] {progress:.1f}%{Style.RESET_ALL}")
+        sys.stdout.flush()
+
+
+def run_async(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if uvloop is None:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
+@contextmanager
+def buffered_stdout():
+    """Disable line buffering on stdout for the duration of the block.
+    
+    The underlying stream is reconfigured in place (rather than replaced)
+    so colorama's wrapper keeps working; output is flushed and the original
+    buffering mode restored on exit.
+    """
+    reconfigure = getattr(sys.stdout, 'reconfigure', None)
+    line_buffering = getattr(sys.stdout, 'line_buffering', False)
+    if reconfigure is None or not line_buffering:
+        yield
+        return
+    reconfigure(line_buffering=False)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        reconfigure(line_buffering=True)
 
 
 class ValidationHelper:
@@ -95,34 +283,25 @@ class ValidationHelper:
     @staticmethod
     def parse_selection(selection: str, max_count: int) -> Optional[List[int]]:
         """Parse selection string into list of indices."""
-        try:
-            indices = []
-            for part in selection.split(','):
-                part = part.strip()
-                if '-' in part:
-                    start, end = part.split('-')
-                    start = int(start) - 1
-                    end = int(end) - 1
-                    if start < 0 or end >= max_count or start > end:
-                        return None
-                    indices.extend(range(start, end + 1))
-                else:
-                    index = int(part) - 1
-                    if index < 0 or index >= max_count:
-                        return None
-                    indices.append(index)
-            
-            return sorted(list(set(indices)))
-        except ValueError:
+        if not _SELECTION_RE.fullmatch(selection):
             return None
+        
+        selected = bytearray(max_count)
+        for match in _SELECTION_TOKEN_RE.finditer(selection):
+            start = int(match.group(1)) - 1
+            end = int(match.group(2)) - 1 if match.group(2) else start
+            if start < 0 or end >= max_count or start > end:
+                return None
+            selected[start:end + 1] = b'\x01' * (end - start + 1)
+        
+        return [index for index, flag in enumerate(selected) if flag]
     
     @staticmethod
     def format_duration(seconds: int) -> str:
         """Format duration in seconds to mm:ss format."""
         if seconds is None:
             return "Unknown"
-        minutes = seconds // 60
-        seconds = seconds % 60
+        minutes, seconds = divmod(seconds, 60)
         return f"{minutes}:{seconds:02d}"
     
     @staticmethod
@@ -130,4 +309,6 @@ class ValidationHelper:
         """Format count with thousand separators."""
         if count is None:
             return "Unknown"
+        if count < 1000:
+            return str(count)
         return f"{count:,}"
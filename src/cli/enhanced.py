@@ -4,14 +4,14 @@ Enhanced CLI commands for batch operations and configuration management.
 
 import click
 import asyncio
-import json
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 from colorama import Fore, Style
 from ..domain.entities import DownloadType
-from ..infrastructure.youtube_repository import YouTubeVideoRepository
-from ..infrastructure.downloader_repository import YTDLPDownloaderRepository
-from ..infrastructure.file_repository import FileSystemRepository
 from ..use_cases.download_use_cases import (
     GetVideoInfoUseCase,
     GetPlaylistInfoUseCase,
@@ -22,17 +22,53 @@ from ..use_cases.download_use_cases import (
     DownloadChannelUseCase
 )
 from ..config.settings import Config
-from ..config.constants import APP_NAME, DEFAULT_DOWNLOAD_PATH
+from ..config.constants import APP_NAME, IO_THREAD_POOL_SIZE, get_default_download_path
+from ..utils.json_io import read_json, write_json
+from .base import ProgressDisplay, buffered_stdout, run_async
+
+_SEP60 = "=" * 60
+_PLAYLIST_RE = re.compile(r"[?&]list=|/playlist\b")
+_BANNER_PFX = f"{Fore.CYAN}{Style.BRIGHT}"
+_MAX_PROGRESS_UPDATES = 200
+
+
+class _Coalesce:
+    """Forward progress callbacks only every ``step`` items or ``interval`` seconds."""
+    
+    def __init__(self, cb, step: int = 0, interval: float = 0.1):
+        self.cb = cb
+        self.step = step
+        self.interval = interval
+        self._last_t = 0.0
+        self._last_i = -1
+    
+    def __call__(self, current: int, total: int, title: str = ""):
+        step = self.step or max(1, total // _MAX_PROGRESS_UPDATES)
+        now = time.monotonic()
+        if (current - self._last_i < step and current != total
+                and now - self._last_t < self.interval):
+            return
+        self._last_i = current
+        self._last_t = now
+        self.cb(current, total, title)
 
 
 class BatchDownloader:
     """Extended CLI interface for batch operations."""
     
     def __init__(self):
+        from ..infrastructure.youtube_repository import YouTubeVideoRepository
+        from ..infrastructure.downloader_repository import YTDLPDownloaderRepository
+        from ..infrastructure.file_repository import FileSystemRepository
+        
         self.config = Config()
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=IO_THREAD_POOL_SIZE, thread_name_prefix='nerucord-io'
+        )
         self.file_repository = FileSystemRepository()
-        self.video_repository = YouTubeVideoRepository()
-        self.downloader_repository = YTDLPDownloaderRepository(self.file_repository)
+        self.video_repository = YouTubeVideoRepository(self._io_pool)
+        self.downloader_repository = YTDLPDownloaderRepository(self.file_repository, self._io_pool)
+        self.progress = ProgressDisplay()
         
         # Initialize use cases
         self.get_video_info_use_case = GetVideoInfoUseCase(self.video_repository)
@@ -45,84 +81,103 @@ class BatchDownloader:
             self.downloader_repository, self.file_repository
         )
         self.download_playlist_use_case = DownloadPlaylistUseCase(
-            self.video_repository, self.downloader_repository, self.file_repository
+            self.video_repository, self.downloader_repository, self.file_repository,
+            self.config.get_max_concurrent_downloads()
         )
         self.download_channel_use_case = DownloadChannelUseCase(
-            self.video_repository, self.downloader_repository, self.file_repository
+            self.video_repository, self.downloader_repository, self.file_repository,
+            self.config.get_max_concurrent_downloads()
         )
+        
+        # Per-type dispatch: (download type, default output path getter, single-URL download)
+        self._download_fns = {
+            'video': (DownloadType.VIDEO, self.config.get_video_path, self.download_video_use_case.execute_url),
+            'audio': (DownloadType.AUDIO, self.config.get_audio_path, self.download_audio_use_case.execute_url),
+        }
     
     def print_banner(self):
         """Print application banner."""
-        click.echo(f"{Fore.CYAN}{Style.BRIGHT}{'='*60}")
-        click.echo(f"{Fore.CYAN}{Style.BRIGHT}{APP_NAME} - Batch Operations")
-        click.echo(f"{Fore.CYAN}{Style.BRIGHT}{'='*60}")
+        click.echo(f"{_BANNER_PFX}{_SEP60}{Style.RESET_ALL}")
+        click.echo(f"{_BANNER_PFX}{APP_NAME} - Batch Operations{Style.RESET_ALL}")
+        click.echo(f"{_BANNER_PFX}{_SEP60}{Style.RESET_ALL}")
         click.echo()
     
     def print_progress(self, current: int, total: int, item_name: str = ""):
         """Print download progress for playlist."""
-        progress_bar = "█" * (current * 20 // total) + "░" * (20 - (current * 20 // total))
-        percentage = (current / total) * 100
-        click.echo(f"\r{Fore.GREEN}[{progress_bar}] {percentage:.1f}% ({current}/{total}) {item_name}", nl=False)
+        self.progress.show_progress(current, total, item_name)
     
     async def download_from_file(self, file_path: str, download_type: str, output_path: str = None):
         """Download videos from a file containing URLs."""
+        # click.Choice(case_sensitive=False) already yields the canonical
+        # lowercase value; normalize here once for programmatic callers.
+        dt = download_type.lower()
+        with buffered_stdout():
+            await self._download_from_file(file_path, dt, output_path)
+    
+    async def _download_from_file(self, file_path: str, dt: str, output_path: str = None):
         try:
-            with open(file_path, 'r') as f:
-                urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+            raw = Path(file_path).read_bytes().decode('utf-8', 'replace')
+            urls = [
+                line for line in (ln.strip() for ln in raw.splitlines())
+                if line and not line.startswith('#')
+            ]
             
             if not urls:
-                click.echo(f"{Fore.RED}❌ No valid URLs found in file")
+                click.echo(f"{Fore.RED}❌ No valid URLs found in file{Style.RESET_ALL}")
                 return
             
-            click.echo(f"{Fore.BLUE}📋 Found {len(urls)} URLs to download")
+            click.echo(f"{Fore.BLUE}📋 Found {len(urls)} URLs to download{Style.RESET_ALL}")
             click.echo()
             
-            dtype = DownloadType.VIDEO if download_type.lower() == 'video' else DownloadType.AUDIO
-            output_dir = output_path or (self.config.get_video_path() if download_type.lower() == 'video' else self.config.get_audio_path())
+            # Resolve the per-type download path once instead of re-testing it per URL
+            dtype, default_path, download_single = self._download_fns[dt]
+            output_dir = output_path or default_path()
             
-            success_count = 0
-            failed_urls = []
+            semaphore = asyncio.Semaphore(self.config.get_max_concurrent_downloads())
+            total = len(urls)
+            processing_fmt = f"{Fore.YELLOW}[{{}}/{total}] Processing: {{}}{Style.RESET_ALL}"
             
-            for i, url in enumerate(urls, 1):
-                try:
-                    click.echo(f"{Fore.YELLOW}[{i}/{len(urls)}] Processing: {url[:50]}...")
-                    
-                    # Check if it's a playlist
-                    if 'playlist' in url or 'list=' in url:
-                        await self.download_playlist_use_case.execute(
-                            url, dtype, output_dir, 
-                            lambda current, total, title: self.print_progress(current, total, title)
-                        )
-                    else:
-                        video_info = await self.get_video_info_use_case.execute(url)
-                        
-                        if dtype == DownloadType.AUDIO:
-                            await self.download_audio_use_case.execute(video_info, output_dir)
+            async def download_one(index: int, url: str):
+                async with semaphore:
+                    url_short = url if len(url) <= 50 else f"{url[:47]}..."
+                    click.echo(processing_fmt.format(index, url_short))
+                    sys.stdout.flush()
+                    try:
+                        # Check if it's a playlist
+                        if _PLAYLIST_RE.search(url):
+                            await self.download_playlist_use_case.execute(
+                                url, dtype, output_dir, _Coalesce(self.print_progress)
+                            )
                         else:
-                            await self.download_video_use_case.execute(video_info, output_dir)
+                            await download_single(url, output_dir)
+                    except Exception as e:
+                        click.echo(f"{Fore.RED}❌ [{index}/{total}] Failed: {str(e)}{Style.RESET_ALL}")
+                        sys.stdout.flush()
+                        return url, str(e)
                     
-                    success_count += 1
-                    click.echo(f"{Fore.GREEN}✅ Completed")
-                    
-                except Exception as e:
-                    failed_urls.append((url, str(e)))
-                    click.echo(f"{Fore.RED}❌ Failed: {str(e)}")
-                
-                click.echo()
+                    click.echo(f"{Fore.GREEN}✅ [{index}/{total}] Completed{Style.RESET_ALL}")
+                    sys.stdout.flush()
+                    return url, None
+            
+            results = await asyncio.gather(
+                *(download_one(i, url) for i, url in enumerate(urls, 1))
+            )
+            failed_urls = [(url, error) for url, error in results if error is not None]
+            success_count = total - len(failed_urls)
+            click.echo()
             
             # Summary
-            click.echo(f"{Fore.CYAN}{'='*60}")
-            click.echo(f"{Fore.GREEN}✅ Successfully downloaded: {success_count}/{len(urls)}")
+            click.echo(f"{Fore.CYAN}{_SEP60}{Style.RESET_ALL}")
+            click.echo(f"{Fore.GREEN}✅ Successfully downloaded: {success_count}/{total}{Style.RESET_ALL}")
             
             if failed_urls:
-                click.echo(f"{Fore.RED}❌ Failed downloads: {len(failed_urls)}")
-                for url, error in failed_urls:
-                    click.echo(f"{Fore.RED}   {url}: {error}")
+                click.echo(f"{Fore.RED}❌ Failed downloads: {len(failed_urls)}{Style.RESET_ALL}")
+                click.echo("\n".join(f"{Fore.RED}   {url}: {error}{Style.RESET_ALL}" for url, error in failed_urls))
             
         except FileNotFoundError:
-            click.echo(f"{Fore.RED}❌ File not found: {file_path}")
+            click.echo(f"{Fore.RED}❌ File not found: {file_path}{Style.RESET_ALL}")
         except Exception as e:
-            click.echo(f"{Fore.RED}❌ Error reading file: {str(e)}")
+            click.echo(f"{Fore.RED}❌ Error reading file: {str(e)}{Style.RESET_ALL}")
 
 
 @click.command()
@@ -136,7 +191,7 @@ def batch(file_path: str, download_type: str, output: str):
     downloader = BatchDownloader()
     downloader.print_banner()
     
-    asyncio.run(downloader.download_from_file(file_path, download_type, output))
+    run_async(downloader.download_from_file(file_path, download_type, output))
 
 
 @click.command()
@@ -154,42 +209,41 @@ def config(quality: str, format: str, video_quality: str, output_dir: str, show:
     current_config = {}
     if config_file.exists():
         try:
-            with open(config_file, 'r') as f:
-                current_config = json.load(f)
-        except:
+            current_config = read_json(config_file)
+        except (OSError, ValueError):
             pass
     
     if show:
-        click.echo(f"{Fore.CYAN}Current Configuration:")
-        click.echo(f"{Fore.GREEN}  Audio Quality: {current_config.get('audio_quality', '192')} kbps")
-        click.echo(f"{Fore.GREEN}  Audio Format: {current_config.get('audio_format', 'mp3')}")
-        click.echo(f"{Fore.GREEN}  Video Quality: {current_config.get('video_quality', '720p')}")
-        click.echo(f"{Fore.GREEN}  Output Directory: {current_config.get('output_dir', DEFAULT_DOWNLOAD_PATH)}")
+        click.echo(f"{Fore.CYAN}Current Configuration:{Style.RESET_ALL}")
+        click.echo(f"{Fore.GREEN}  Audio Quality: {current_config.get('audio_quality', '192')} kbps{Style.RESET_ALL}")
+        click.echo(f"{Fore.GREEN}  Audio Format: {current_config.get('audio_format', 'mp3')}{Style.RESET_ALL}")
+        click.echo(f"{Fore.GREEN}  Video Quality: {current_config.get('video_quality', '720p')}{Style.RESET_ALL}")
+        click.echo(f"{Fore.GREEN}  Output Directory: {current_config.get('output_dir', get_default_download_path())}{Style.RESET_ALL}")
+        return
+    
+    if not any([quality, format, video_quality, output_dir]):
         return
     
     # Update config
     if quality:
         current_config['audio_quality'] = quality
-        click.echo(f"{Fore.GREEN}✓ Audio quality set to: {quality} kbps")
+        click.echo(f"{Fore.GREEN}✓ Audio quality set to: {quality} kbps{Style.RESET_ALL}")
     
     if format:
         current_config['audio_format'] = format
-        click.echo(f"{Fore.GREEN}✓ Audio format set to: {format}")
+        click.echo(f"{Fore.GREEN}✓ Audio format set to: {format}{Style.RESET_ALL}")
     
     if video_quality:
         current_config['video_quality'] = video_quality
-        click.echo(f"{Fore.GREEN}✓ Video quality set to: {video_quality}")
+        click.echo(f"{Fore.GREEN}✓ Video quality set to: {video_quality}{Style.RESET_ALL}")
     
     if output_dir:
         current_config['output_dir'] = output_dir
-        click.echo(f"{Fore.GREEN}✓ Output directory set to: {output_dir}")
+        click.echo(f"{Fore.GREEN}✓ Output directory set to: {output_dir}{Style.RESET_ALL}")
     
     # Save config
-    with open(config_file, 'w') as f:
-        json.dump(current_config, f, indent=2)
-    
-    if any([quality, format, video_quality, output_dir]):
-        click.echo(f"{Fore.CYAN}Configuration saved to: {config_file}")
+    write_json(config_file, current_config)
+    click.echo(f"{Fore.CYAN}Configuration saved to: {config_file}{Style.RESET_ALL}")
 
 
 # Register new commands with the main CLI
@@ -4,26 +4,59 @@ Provides a professional menu-driven interface for users.
 """
 
 import asyncio
+import re
+import sys
+from functools import cached_property, partial
+from pathlib import Path
 from typing import Optional, List
 
-from .base import BaseInterface, ProgressDisplay, ValidationHelper
-from .interface import CLIInterface
+from .base import BaseInterface, ProgressDisplay, ValidationHelper, buffered_stdout, run_async
 from ..config.constants import APP_NAME, APP_VERSION
+from ..config.settings import Config
 from ..domain.entities import DownloadType
+from ..domain.value_objects import make_youtube_url
 
+# Playlist URLs: a list= query parameter or a /playlist path segment
+_PLAYLIST_RE = re.compile(r"[?&]list=|/playlist\b")
 
-class InteractiveCLI(BaseInterface):
-    """Interactive command-line interface for NeruCord Archiver."""
-    
-    def __init__(self):
-        super().__init__()
-        self.cli_interface = CLIInterface()
+# One non-blank, non-comment line of a batch file, without surrounding whitespace
+_URL_LINE_RE = re.compile(r'^[ \t]*([^\s#][^\r\n]*?)[ \t]*\r?$', re.MULTILINE)
+
+# Single-video download flavours: header, status line, use case and default path attribute
+_SINGLE_DOWNLOADS = {
+    DownloadType.VIDEO: ("DOWNLOAD VIDEO", "Downloading video...",
+                         "download_video_use_case", "video_path"),
+    DownloadType.AUDIO: ("DOWNLOAD AUDIO", "Downloading and converting to audio...",
+                         "download_audio_use_case", "audio_path"),
+}
+
+def _fmt_video_row(index: int, title: str, duration: str, view_count: str, views: bool = True) -> str:
+    """Format one numbered line of a video listing."""
+    parts = [f"  {index:2d}. ", title]
+    if duration:
+        parts += (" (", duration, ")")
+    if views and view_count:
+        parts += (" | ", view_count, " views")
+    return "".join(parts)
+
+
+def _format_channel_preview(videos, total: int, views: bool = True) -> str:
+    """Render a numbered channel listing.
     
-    def print_welcome(self):
-        """Print welcome message and banner."""
-        self.clear_screen()
-        
-        print(f"""
+    ``videos`` may be a leading slice of the channel's ``total`` videos, in
+    which case a trailing "... and N more" line is added.
+    """
+    lines = [
+        _fmt_video_row(i, video.title, video.duration_fmt, video.view_count_fmt, views=views)
+        for i, video in enumerate(videos, 1)
+    ]
+    if total > len(videos):
+        lines.append(f"  ... and {total - len(videos)} more videos")
+    return "\n".join(lines)
+
+
+# Static screens are built once at import time
+_WELCOME_BANNER = f"""
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                                                                              ║
 ║  ███╗   ██╗███████╗██████╗ ██╗   ██╗ ██████╗ ██████╗ ██████╗ ██████╗       ║
@@ -37,11 +70,12 @@ class InteractiveCLI(BaseInterface):
 ║  Professional tool for media archival and conversion                        ║
 ║                                                                              ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
-""")
-    
-    def print_main_menu(self):
-        """Print the main menu options."""
-        print("""
+
+"""
+
+_WELCOME_BYTES = _WELCOME_BANNER.encode('utf-8')
+
+_MAIN_MENU = """
 ┌─ MAIN MENU ─────────────────────────────────────────────────────────────────┐
 │                                                                             │
 │  1. Download Video                                                          │
@@ -56,22 +90,129 @@ class InteractiveCLI(BaseInterface):
 │  0. Exit                                                                    │
 │                                                                             │
 └─────────────────────────────────────────────────────────────────────────────┘
-""")
+
+"""
+
+_HELP_TEXT = """
+┌─ HELP & EXAMPLES ───────────────────────────────────────────────────────────┐
+│                                                                             │
+│  Supported URL formats:                                                     │
+│                                                                             │
+│  Videos:                                                                    │
+│    • https://youtube.com/watch?v=VIDEO_ID                                  │
+│    • https://youtu.be/VIDEO_ID                                             │
+│                                                                             │
+│  Playlists:                                                                 │
+│    • https://youtube.com/playlist?list=PLAYLIST_ID                         │
+│                                                                             │
+│  Channels:                                                                  │
+│    • https://youtube.com/@channelname/videos                               │
+│    • https://youtube.com/channel/CHANNEL_ID/videos                         │
+│    • https://youtube.com/user/USERNAME/videos                              │
+│                                                                             │
+│  YouTube Music:                                                             │
+│    • https://music.youtube.com/watch?v=VIDEO_ID                            │
+│    • https://music.youtube.com/playlist?list=PLAYLIST_ID                   │
+│                                                                             │
+│  Tips:                                                                      │
+│    • Use Browse Channel first to see available videos                      │
+│    • Selection format: 1,3,5 or 1-10 or 1,3,5-10,15                       │
+│    • Default downloads go to ~/Downloads/NeruCord/                          │
+│    • Some videos may fail if they're private or members-only               │
+│                                                                             │
+└─────────────────────────────────────────────────────────────────────────────┘
+
+"""
+
+
+class _SessionSettings:
+    """Per-session cache of configuration values read by the menu handlers."""
+    
+    _FIELDS = ('audio_path', 'video_path', 'audio_quality', 'video_quality')
+    
+    def __init__(self, config):
+        self._config = config
+    
+    @cached_property
+    def audio_path(self) -> str:
+        """Default audio output directory."""
+        return self._config.get_audio_path()
+    
+    @cached_property
+    def video_path(self) -> str:
+        """Default video output directory."""
+        return self._config.get_video_path()
+    
+    @cached_property
+    def audio_quality(self) -> str:
+        """Default audio bitrate in kbps."""
+        return self._config.get_audio_quality()
+    
+    @cached_property
+    def video_quality(self) -> str:
+        """Default video quality."""
+        return self._config.get_video_quality()
+    
+    def path_for(self, download_type: str) -> str:
+        """Get the default output path for 'video' or 'audio'."""
+        return self.video_path if download_type == 'video' else self.audio_path
+    
+    def refresh(self):
+        """Drop cached values so the next access re-reads the config."""
+        for name in self._FIELDS:
+            self.__dict__.pop(name, None)
+
+
+class InteractiveCLI(BaseInterface):
+    """Interactive command-line interface for NeruCord Archiver."""
+    
+    def __init__(self, use_cache: bool = True):
+        super().__init__()
+        self.progress = ProgressDisplay()
+        self.settings = _SessionSettings(Config())
+        self._menu_dirty = True
+        self._use_cache = use_cache
+    
+    @cached_property
+    def cli_interface(self):
+        """Use-case container, built on first use so menu-only screens stay cheap."""
+        from .interface import _get_interface
+        return _get_interface(self._use_cache)
+    
+    def print_welcome(self):
+        """Print welcome message and banner."""
+        self.clear_screen()
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None or (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
+            sys.stdout.write(_WELCOME_BANNER)
+            return
+        # Pre-encoded banner goes straight to the byte layer; flush pending
+        # text first so it stays in order.
+        sys.stdout.flush()
+        buffer.write(_WELCOME_BYTES)
+    
+    def print_main_menu(self):
+        """Print the main menu options."""
+        sys.stdout.write(_MAIN_MENU)
     
     def get_download_type(self) -> str:
         """Get download type choice from user."""
         print("Download type:")
         print("  1. Audio (MP3)")
         print("  2. Video (MP4)")
-        choice = self.get_choice("Choose type (1-2): ", ['1', '2'])
+        choice = self.get_single_key("Choose type (1-2): ", ['1', '2'])
         return 'audio' if choice == '1' else 'video'
     
+    async def aget_download_type(self) -> str:
+        """Get download type choice without blocking the event loop."""
+        return await self._read_off_loop(self.get_download_type)
+    
     def get_selection_input(self, max_videos: int) -> Optional[List[int]]:
         """Get video selection from user."""
         print("Selection options:")
         print("  1. Download all videos")
         print("  2. Select specific videos")
-        choice = self.get_choice("Choose option (1-2): ", ['1', '2'])
+        choice = self.get_single_key("Choose option (1-2): ", ['1', '2'])
         
         if choice == '1':
             return None  # Download all
@@ -80,72 +221,46 @@ class InteractiveCLI(BaseInterface):
     
     def get_specific_selection(self, max_videos: int) -> List[int]:
         """Get specific video selection from user."""
+        self._emit([
+            "Selection format examples:",
+            "  • Single videos: 1,3,5",
+            "  • Ranges: 1-10",
+            "  • Mixed: 1,3,5-10,15",
+        ])
+        prompt = f"Enter selection (1-{max_videos}): "
         while True:
-            print("Selection format examples:")
-            print("  • Single videos: 1,3,5")
-            print("  • Ranges: 1-10")
-            print("  • Mixed: 1,3,5-10,15")
-            
-            selection = self.get_input(f"Enter selection (1-{max_videos}): ")
+            selection = self.get_input(prompt)
             indices = ValidationHelper.parse_selection(selection, max_videos)
             if indices is not None:
                 return indices
-            self.print_error("Invalid selection format or range. Please try again.")
+            self.print_error(f"Invalid selection, use numbers 1-{max_videos} (e.g. 1,3,5-10).")
     
     def print_help(self):
         """Print help and examples."""
-        print("""
-┌─ HELP & EXAMPLES ───────────────────────────────────────────────────────────┐
-│                                                                             │
-│  Supported URL formats:                                                     │
-│                                                                             │
-│  Videos:                                                                    │
-│    • https://youtube.com/watch?v=VIDEO_ID                                  │
-│    • https://youtu.be/VIDEO_ID                                             │
-│                                                                             │
-│  Playlists:                                                                 │
-│    • https://youtube.com/playlist?list=PLAYLIST_ID                         │
-│                                                                             │
-│  Channels:                                                                  │
-│    • https://youtube.com/@channelname/videos                               │
-│    • https://youtube.com/channel/CHANNEL_ID/videos                         │
-│    • https://youtube.com/user/USERNAME/videos                              │
-│                                                                             │
-│  YouTube Music:                                                             │
-│    • https://music.youtube.com/watch?v=VIDEO_ID                            │
-│    • https://music.youtube.com/playlist?list=PLAYLIST_ID                   │
-│                                                                             │
-│  Tips:                                                                      │
-│    • Use Browse Channel first to see available videos                      │
-│    • Selection format: 1,3,5 or 1-10 or 1,3,5-10,15                       │
-│    • Default downloads go to ~/Downloads/NeruCord/                          │
-│    • Some videos may fail if they're private or members-only               │
-│                                                                             │
-└─────────────────────────────────────────────────────────────────────────────┘
-""")
+        sys.stdout.write(_HELP_TEXT)
     
-    async def handle_download_video(self):
-        """Handle video download option."""
-        self.print_header("DOWNLOAD VIDEO")
+    async def _handle_single(self, kind: DownloadType):
+        """Prompt for a URL, show its details and download it as video or audio."""
+        header, action, use_case_name, path_name = _SINGLE_DOWNLOADS[kind]
+        self.print_header(header)
         
-        url = self.get_input("Enter video URL: ")
-        output_path = self.get_input("Output directory (press Enter for default): ", required=False)
+        url = await self.aget_input("Enter video URL: ")
+        output_path = await self.aget_input("Output directory (press Enter for default): ", required=False)
         
         try:
             self.print_info("Getting video information...")
             video_info = await self.cli_interface.get_video_info_use_case.execute(url)
             
-            output_dir = output_path or self.cli_interface.config.get_video_path()
+            output_dir = output_path or getattr(self.settings, path_name)
             
             self.print_success(f"Title: {video_info.title}")
             self.print_success(f"Uploader: {video_info.uploader}")
             if video_info.duration:
-                duration = ValidationHelper.format_duration(video_info.duration)
-                self.print_success(f"Duration: {duration}")
+                self.print_success(f"Duration: {video_info.duration_fmt}")
             
-            print("\nDownloading video...")
-            file_path = await self.cli_interface.download_video_use_case.execute(
-                video_info, output_dir, ProgressDisplay.show_single_progress
+            print(f"\n{action}")
+            file_path = await getattr(self.cli_interface, use_case_name).execute(
+                video_info, output_dir, self.progress.show_single_progress
             )
             
             print("\n")
@@ -155,48 +270,28 @@ class InteractiveCLI(BaseInterface):
         except Exception as e:
             self.print_error(f"Error: {str(e)}")
     
+    async def handle_download_video(self):
+        """Handle video download option."""
+        await self._handle_single(DownloadType.VIDEO)
+    
     async def handle_download_audio(self):
         """Handle audio download option."""
-        self.print_header("DOWNLOAD AUDIO")
-        
-        url = self.get_input("Enter video URL: ")
-        output_path = self.get_input("Output directory (press Enter for default): ", required=False)
-        
-        try:
-            self.print_info("Getting video information...")
-            video_info = await self.cli_interface.get_video_info_use_case.execute(url)
-            
-            output_dir = output_path or self.cli_interface.config.get_audio_path()
-            
-            self.print_success(f"Title: {video_info.title}")
-            self.print_success(f"Uploader: {video_info.uploader}")
-            if video_info.duration:
-                duration = ValidationHelper.format_duration(video_info.duration)
-                self.print_success(f"Duration: {duration}")
-            
-            print("\nDownloading and converting to audio...")
-            file_path = await self.cli_interface.download_audio_use_case.execute(
-                video_info, output_dir, ProgressDisplay.show_single_progress
-            )
-            
-            print("\n")
-            self.print_success("Download completed successfully!")
-            print(f"File saved: {file_path}")
-            
-        except Exception as e:
-            self.print_error(f"Error: {str(e)}")
+        await self._handle_single(DownloadType.AUDIO)
     
     async def handle_download_playlist(self):
         """Handle playlist download option."""
         self.print_header("DOWNLOAD PLAYLIST")
         
-        url = self.get_input("Enter playlist URL: ")
-        download_type = self.get_download_type()
-        output_path = self.get_input("Output directory (press Enter for default): ", required=False)
+        url = await self.aget_input("Enter playlist URL: ")
+        # Fetch playlist details while the remaining prompts are answered
+        info_task = asyncio.create_task(self.cli_interface.get_playlist_info_use_case.execute(url))
         
         try:
+            download_type = await self.aget_download_type()
+            output_path = await self.aget_input("Output directory (press Enter for default): ", required=False)
+            
             self.print_info("Getting playlist information...")
-            playlist_info = await self.cli_interface.get_playlist_info_use_case.execute(url)
+            playlist_info = await info_task
             
             self.print_success(f"Playlist: {playlist_info.title}")
             self.print_success(f"Videos: {len(playlist_info.videos)}")
@@ -204,15 +299,15 @@ class InteractiveCLI(BaseInterface):
             
             if download_type == 'video':
                 dtype = DownloadType.VIDEO
-                output_dir = output_path or self.cli_interface.config.get_video_path()
+                output_dir = output_path or self.settings.video_path
             else:
                 dtype = DownloadType.AUDIO
-                output_dir = output_path or self.cli_interface.config.get_audio_path()
+                output_dir = output_path or self.settings.audio_path
             
             print(f"\nDownloading playlist as {download_type}...")
             
             downloaded_files = await self.cli_interface.download_playlist_use_case.execute(
-                url, dtype, output_dir, ProgressDisplay.show_progress
+                url, dtype, output_dir, self.progress.show_progress
             )
             
             print("\n")
@@ -221,34 +316,32 @@ class InteractiveCLI(BaseInterface):
             
         except Exception as e:
             self.print_error(f"Error: {str(e)}")
+        finally:
+            info_task.cancel()
     
     async def handle_browse_channel(self):
         """Handle channel browsing option."""
         self.print_header("BROWSE CHANNEL")
         
-        url = self.get_input("Enter channel URL: ")
+        url = await self.aget_input("Enter channel URL: ")
         
         try:
             self.print_info("Getting channel information...")
             channel_info = await self.cli_interface.get_channel_info_use_case.execute(url)
             
+            videos = channel_info.videos
+            total = len(videos)
             self.print_success(f"Channel: {channel_info.title}")
-            self.print_success(f"Videos: {len(channel_info.videos)}")
+            self.print_success(f"Videos: {total}")
             if channel_info.subscriber_count:
                 subscriber_count = ValidationHelper.format_count(channel_info.subscriber_count)
                 self.print_success(f"Subscribers: {subscriber_count}")
             
-            print("\nAvailable Videos:")
-            for i, video in enumerate(channel_info.videos, 1):
-                duration = ""
-                if video.duration:
-                    duration = f" ({ValidationHelper.format_duration(video.duration)})"
-                views = ""
-                if video.view_count:
-                    views = f" | {ValidationHelper.format_count(video.view_count)} views"
-                print(f"  {i:2d}. {video.title}{duration}{views}")
-            
-            print("\nUse 'Download from Channel' option to download selected videos.")
+            self._emit([
+                "\nAvailable Videos:",
+                _format_channel_preview(videos, total),
+                "\nUse 'Download from Channel' option to download selected videos.",
+            ])
             
         except Exception as e:
             self.print_error(f"Error: {str(e)}")
@@ -257,42 +350,44 @@ class InteractiveCLI(BaseInterface):
         """Handle channel download option."""
         self.print_header("DOWNLOAD FROM CHANNEL")
         
-        url = self.get_input("Enter channel URL: ")
+        url = await self.aget_input("Enter channel URL: ")
+        # Fetch channel details while type and output directory are chosen
+        info_task = asyncio.create_task(self.cli_interface.get_channel_info_use_case.execute(url))
         
         try:
+            download_type = await self.aget_download_type()
+            output_path = await self.aget_input("Output directory (press Enter for default): ", required=False)
+            
             self.print_info("Getting channel information...")
-            channel_info = await self.cli_interface.get_channel_info_use_case.execute(url)
+            channel_info = await info_task
             
+            videos = channel_info.videos
+            total = len(videos)
             self.print_success(f"Channel: {channel_info.title}")
-            self.print_success(f"Videos: {len(channel_info.videos)}")
+            self.print_success(f"Videos: {total}")
             
             # Show first 10 videos for reference
-            print("\nAvailable Videos (showing first 10):")
-            for i, video in enumerate(channel_info.videos[:10], 1):
-                duration = ""
-                if video.duration:
-                    duration = f" ({ValidationHelper.format_duration(video.duration)})"
-                print(f"  {i:2d}. {video.title}{duration}")
-            
-            if len(channel_info.videos) > 10:
-                print(f"  ... and {len(channel_info.videos) - 10} more videos")
+            self._emit([
+                "\nAvailable Videos (showing first 10):",
+                _format_channel_preview(
+                    videos[:10], total, views=False
+                ),
+            ])
             
             # Get selection
-            selected_indices = self.get_selection_input(len(channel_info.videos))
-            download_type = self.get_download_type()
-            output_path = self.get_input("Output directory (press Enter for default): ", required=False)
+            selected_indices = self.get_selection_input(total)
             
             if download_type == 'video':
                 dtype = DownloadType.VIDEO
-                output_dir = output_path or self.cli_interface.config.get_video_path()
+                output_dir = output_path or self.settings.video_path
             else:
                 dtype = DownloadType.AUDIO
-                output_dir = output_path or self.cli_interface.config.get_audio_path()
+                output_dir = output_path or self.settings.audio_path
             
             print(f"\nDownloading channel videos as {download_type}...")
             
             downloaded_files = await self.cli_interface.download_channel_use_case.execute(
-                url, dtype, output_dir, selected_indices, ProgressDisplay.show_progress
+                url, dtype, output_dir, selected_indices, self.progress.show_progress
             )
             
             print("\n")
@@ -301,18 +396,21 @@ class InteractiveCLI(BaseInterface):
             
         except Exception as e:
             self.print_error(f"Error: {str(e)}")
+        finally:
+            info_task.cancel()
     
     async def handle_batch_download(self):
         """Handle batch download option."""
         self.print_header("BATCH DOWNLOAD")
         
-        file_path = self.get_input("Enter file path containing URLs: ")
-        download_type = self.get_download_type()
-        output_path = self.get_input("Output directory (press Enter for default): ", required=False)
+        file_path = await self.aget_input("Enter file path containing URLs: ")
+        download_type = await self.aget_download_type()
+        output_path = await self.aget_input("Output directory (press Enter for default): ", required=False)
         
         try:
-            with open(file_path, 'r') as f:
-                urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(None, Path(file_path).read_text)
+            urls = _URL_LINE_RE.findall(data)
             
             if not urls:
                 self.print_error("No valid URLs found in file")
@@ -321,40 +419,56 @@ class InteractiveCLI(BaseInterface):
             self.print_info(f"Found {len(urls)} URLs to download")
             
             dtype = DownloadType.VIDEO if download_type == 'video' else DownloadType.AUDIO
-            output_dir = output_path or (
-                self.cli_interface.config.get_video_path() if download_type == 'video' 
-                else self.cli_interface.config.get_audio_path()
-            )
+            output_dir = output_path or self.settings.path_for(download_type)
             
-            success_count = 0
-            failed_urls = []
+            cli = self.cli_interface
+            semaphore = asyncio.Semaphore(cli.config.get_max_concurrent_downloads())
+            total = len(urls)
             
-            for i, url in enumerate(urls, 1):
-                try:
-                    print(f"\n[{i}/{len(urls)}] Processing: {url[:50]}...")
-                    
-                    if 'playlist' in url or 'list=' in url:
-                        await self.cli_interface.download_playlist_use_case.execute(
-                            url, dtype, output_dir, ProgressDisplay.show_progress
-                        )
-                    else:
-                        video_info = await self.cli_interface.get_video_info_use_case.execute(url)
+            # Bind per-URL callables once rather than resolving them for every URL
+            download_playlist = cli.download_playlist_use_case.execute
+            download_single = (
+                cli.download_audio_use_case.execute_url if dtype == DownloadType.AUDIO
+                else cli.download_video_use_case.execute_url
+            )
+            show_progress = self.progress.show_multi_progress
+            print_success = self.print_success
+            print_error = self.print_error
+            flush = sys.stdout.flush
+            self.progress.reset_multi_progress()
+            
+            async def download_one(index: int, url: str):
+                async with semaphore:
+                    try:
+                        print(f"\n[{index}/{total}] Processing: {url[:50]}...")
+                        # stdout is block-buffered for the batch; show status lines at once
+                        flush()
                         
-                        if dtype == DownloadType.AUDIO:
-                            await self.cli_interface.download_audio_use_case.execute(video_info, output_dir)
+                        if _PLAYLIST_RE.search(url):
+                            await download_playlist(
+                                url, dtype, output_dir, partial(show_progress, index)
+                            )
                         else:
-                            await self.cli_interface.download_video_use_case.execute(video_info, output_dir)
-                    
-                    success_count += 1
-                    self.print_success("Completed")
-                    
-                except Exception as e:
-                    failed_urls.append(url)
-                    self.print_error(f"Failed: {str(e)}")
+                            await download_single(url, output_dir)
+                        
+                        print_success(f"[{index}/{total}] Completed")
+                        flush()
+                        return url, None
+                        
+                    except Exception as e:
+                        print_error(f"[{index}/{total}] Failed: {str(e)}")
+                        flush()
+                        return url, e
+            
+            results = await asyncio.gather(
+                *(download_one(i, url) for i, url in enumerate(urls, 1))
+            )
+            failed_urls = [url for url, error in results if error is not None]
+            success_count = total - len(failed_urls)
             
             print("\n")
             self.print_success("Batch download completed!")
-            print(f"Successfully downloaded: {success_count}/{len(urls)} files")
+            print(f"Successfully downloaded: {success_count}/{total} files")
             
             if failed_urls:
                 self.print_warning(f"Failed URLs: {len(failed_urls)}")
@@ -370,36 +484,40 @@ class InteractiveCLI(BaseInterface):
         """Handle get info option."""
         self.print_header("GET INFO")
         
-        url = self.get_input("Enter video/playlist URL: ")
+        url = await self.aget_input("Enter video/playlist URL: ")
         
         try:
-            # Try to get video info first
-            try:
+            # Route with the video use case's own check, so playlists (including
+            # watch?v=...&list=... and music albums) cost one lookup instead of two
+            if make_youtube_url(url).is_playlist():
+                playlist_info = await self.cli_interface.get_playlist_info_use_case.execute(url)
+                total = len(playlist_info.videos)
+                lines = [
+                    "\nPlaylist Information:",
+                    f"  Title: {playlist_info.title}",
+                    f"  URL: {playlist_info.url}",
+                    f"  Uploader: {playlist_info.uploader}",
+                    f"  Videos: {total}",
+                    "\n  Video List (first 10):",
+                ]
+                lines.extend(
+                    f"    {i}. {video.title}"
+                    for i, video in enumerate(playlist_info.videos[:10], 1)
+                )
+                if total > 10:
+                    lines.append(f"    ... and {total - 10} more videos")
+                self._emit(lines)
+            else:
                 video_info = await self.cli_interface.get_video_info_use_case.execute(url)
                 print("\nVideo Information:")
                 print(f"  Title: {video_info.title}")
                 print(f"  URL: {video_info.url}")
                 print(f"  Uploader: {video_info.uploader}")
                 if video_info.duration:
-                    duration = ValidationHelper.format_duration(video_info.duration)
-                    print(f"  Duration: {duration}")
+                    print(f"  Duration: {video_info.duration_fmt}")
                 if video_info.view_count:
                     views = ValidationHelper.format_count(video_info.view_count)
                     print(f"  Views: {views}")
-                
-            except:
-                # If video info fails, try playlist info
-                playlist_info = await self.cli_interface.get_playlist_info_use_case.execute(url)
-                print("\nPlaylist Information:")
-                print(f"  Title: {playlist_info.title}")
-                print(f"  URL: {playlist_info.url}")
-                print(f"  Uploader: {playlist_info.uploader}")
-                print(f"  Videos: {len(playlist_info.videos)}")
-                print("\n  Video List (first 10):")
-                for i, video in enumerate(playlist_info.videos[:10], 1):
-                    print(f"    {i}. {video.title}")
-                if len(playlist_info.videos) > 10:
-                    print(f"    ... and {len(playlist_info.videos) - 10} more videos")
             
         except Exception as e:
             self.print_error(f"Error: {str(e)}")
@@ -408,11 +526,13 @@ class InteractiveCLI(BaseInterface):
         """Handle settings option."""
         self.print_header("SETTINGS & CONFIGURATION")
         
+        settings = self.settings
+        settings.refresh()
         print("\nCurrent Configuration:")
-        print(f"  Audio Path: {self.cli_interface.config.get_audio_path()}")
-        print(f"  Video Path: {self.cli_interface.config.get_video_path()}")
-        print(f"  Audio Quality: {self.cli_interface.config.get_audio_quality()} kbps")
-        print(f"  Video Quality: {self.cli_interface.config.get_video_quality()}")
+        print(f"  Audio Path: {settings.audio_path}")
+        print(f"  Video Path: {settings.video_path}")
+        print(f"  Audio Quality: {settings.audio_quality} kbps")
+        print(f"  Video Quality: {settings.video_quality}")
         
         print("\nTo change settings, use the command line:")
         print("  python main.py config --show")
@@ -420,14 +540,27 @@ class InteractiveCLI(BaseInterface):
         print("  python main.py config --video-quality 1080p")
         print("  python main.py config --output-dir /path/to/downloads")
     
+    def wait_for_continue(self):
+        """Wait for user to press Enter; the screen has scrolled, so redraw the menu."""
+        super().wait_for_continue()
+        self._menu_dirty = True
+    
     async def run(self):
         """Main interactive loop."""
+        # Stay block-buffered for the whole session; input() and the
+        # progress/key helpers flush before anything waits on the user.
+        with buffered_stdout():
+            await self._run()
+    
+    async def _run(self):
         while self.running:
-            self.print_welcome()
-            self.print_main_menu()
+            if self._menu_dirty:
+                self.print_welcome()
+                self.print_main_menu()
+                self._menu_dirty = False
             
-            choice = self.get_choice("Enter your choice (0-9): ", 
-                                   ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9'])
+            choice = self.get_single_key("Enter your choice (0-9): ", 
+                                         ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9'])
             
             try:
                 if choice == '0':
@@ -455,6 +588,7 @@ class InteractiveCLI(BaseInterface):
                 
                 if choice != '0':
                     print()
+                    sys.stdout.flush()
                     self.wait_for_continue()
                     
             except KeyboardInterrupt:
@@ -468,7 +602,7 @@ class InteractiveCLI(BaseInterface):
 def main():
     """Main entry point for the interactive CLI."""
     interactive_cli = InteractiveCLI()
-    asyncio.run(interactive_cli.run())
+    run_async(interactive_cli.run())
 
 
 if __name__ == "__main__":
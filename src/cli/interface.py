@@ -18,12 +18,14 @@ Command Line Interface for the YouTube         self.get_video_info_use_case = Ge
 
 import click
 import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, List
-from colorama import Fore, Style, init
+from colorama import Fore, Style
 from ..domain.entities import DownloadType
-from ..infrastructure.youtube_repository import YouTubeVideoRepository
-from ..infrastructure.downloader_repository import YTDLPDownloaderRepository
-from ..infrastructure.file_repository import FileSystemRepository
+from ..domain.value_objects import make_youtube_url
 from ..use_cases.download_use_cases import (
     GetVideoInfoUseCase,
     GetPlaylistInfoUseCase,
@@ -35,23 +37,59 @@ from ..use_cases.download_use_cases import (
 )
 from ..config.settings import Config
 from ..config.constants import (
-    APP_NAME, APP_VERSION, APP_DESCRIPTION,
+    APP_NAME, APP_VERSION, APP_DESCRIPTION, IO_THREAD_POOL_SIZE,
     SUCCESS_DOWNLOAD_COMPLETE, PROGRESS_DOWNLOADING, PROGRESS_CONVERTING
 )
+from .base import _BARS, ValidationHelper, run_async
 from .enhanced import register_enhanced_commands
 
-# Initialize colorama for cross-platform colored output
-init(autoreset=True)
+
+# One row of the browse listing: index, title, duration, views
+_BROWSE_ROW = f"{Fore.YELLOW}  %2d. %s%s%s"
+
+_BANNER = (
+    f"{Fore.CYAN}{Style.BRIGHT}{'='*60}{Style.RESET_ALL}\n"
+    f"{Fore.CYAN}{Style.BRIGHT}{APP_NAME} v{APP_VERSION}{Style.RESET_ALL}\n"
+    f"{Fore.CYAN}{APP_DESCRIPTION}{Style.RESET_ALL}\n"
+    f"{Fore.CYAN}{Style.BRIGHT}{'='*60}{Style.RESET_ALL}\n"
+)
+
+# Progress redraws are dropped once this many writes are waiting; the UI
+# writer joins at most _UI_BATCH queued writes into one stdout write
+_UI_QUEUE_LIMIT = 256
+_UI_BATCH = 64
 
 
 class CLIInterface:
     """Command Line Interface for YouTube Archiver."""
     
-    def __init__(self):
+    __slots__ = (
+        'config', '_io_pool',
+        'file_repository', 'video_repository', 'downloader_repository',
+        'get_video_info_use_case', 'get_playlist_info_use_case', 'get_channel_info_use_case',
+        'download_video_use_case', 'download_audio_use_case',
+        'download_playlist_use_case', 'download_channel_use_case',
+        '_last_pct', '_last_ts', '_ui_queue', '_ui_loop',
+    )
+    
+    def __init__(self, use_cache: bool = True):
+        # Imported here so --help and argument errors don't pay for yt-dlp
+        from ..infrastructure.youtube_repository import YouTubeVideoRepository
+        from ..infrastructure.cached_video_repository import CachedVideoRepository
+        from ..infrastructure.downloader_repository import YTDLPDownloaderRepository
+        from ..infrastructure.file_repository import FileSystemRepository
+        
         self.config = Config()
+        # Shared by both repositories so metadata lookups and downloads run
+        # off the event loop
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=IO_THREAD_POOL_SIZE, thread_name_prefix='nerucord-io'
+        )
         self.file_repository = FileSystemRepository()
-        self.video_repository = YouTubeVideoRepository()
-        self.downloader_repository = YTDLPDownloaderRepository(self.file_repository)
+        self.video_repository = YouTubeVideoRepository(self._io_pool)
+        if use_cache:
+            self.video_repository = CachedVideoRepository(self.video_repository)
+        self.downloader_repository = YTDLPDownloaderRepository(self.file_repository, self._io_pool)
         
         # Initialize use cases
         self.get_video_info_use_case = GetVideoInfoUseCase(self.video_repository)
@@ -64,76 +102,183 @@ class CLIInterface:
             self.downloader_repository, self.file_repository
         )
         self.download_playlist_use_case = DownloadPlaylistUseCase(
-            self.video_repository, self.downloader_repository, self.file_repository
+            self.video_repository, self.downloader_repository, self.file_repository,
+            self.config.get_max_concurrent_downloads()
         )
         self.download_channel_use_case = DownloadChannelUseCase(
-            self.video_repository, self.downloader_repository, self.file_repository
+            self.video_repository, self.downloader_repository, self.file_repository,
+            self.config.get_max_concurrent_downloads()
         )
+        
+        # Last drawn progress bucket and time, used to coalesce redraws
+        self._last_pct = -1
+        self._last_ts = 0.0
+        
+        # Output queue, set while run_with_ui is active
+        self._ui_queue: Optional[asyncio.Queue] = None
+        self._ui_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def run_with_ui(self, coro):
+        """Run a command coroutine while a background task writes its output.
+        
+        Output from echo() is queued and written in batches, so the
+        coroutine never blocks on stdout; everything queued is written
+        before this returns. If writing fails (e.g. a closed pipe), the
+        error is raised here instead of waiting on output that will never
+        be written.
+        """
+        self._ui_loop = asyncio.get_running_loop()
+        self._ui_queue = asyncio.Queue()
+        ui_task = asyncio.create_task(self._drain_ui(self._ui_queue))
+        try:
+            return await coro
+        finally:
+            join_task = asyncio.create_task(self._ui_queue.join())
+            await asyncio.wait({join_task, ui_task}, return_when=asyncio.FIRST_COMPLETED)
+            join_task.cancel()
+            ui_task.cancel()
+            self._ui_queue = None
+            if ui_task.done() and not ui_task.cancelled() and ui_task.exception() is not None:
+                raise ui_task.exception()
+    
+    @staticmethod
+    async def _drain_ui(queue: asyncio.Queue):
+        """Write queued output, joining whatever is pending into one write."""
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _UI_BATCH and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                sys.stdout.write("".join(batch))
+                sys.stdout.flush()
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    def echo(self, message: str = "", nl: bool = True):
+        """Print a message, through the UI writer when one is running.
+        
+        Safe to call from download threads. Progress redraws (nl=False) are
+        dropped rather than queued once the writer falls behind.
+        """
+        # Each message resets its own styling: batched messages share one
+        # write, and colorama's autoreset is not installed on POSIX terminals
+        text = f"{message}{Style.RESET_ALL}"
+        if self._ui_queue is None:
+            click.echo(text, nl=nl)
+            return
+        if nl:
+            text += "\n"
+        try:
+            on_loop = asyncio.get_running_loop() is self._ui_loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._enqueue(text, not nl)
+        else:
+            self._ui_loop.call_soon_threadsafe(self._enqueue, text, not nl)
+    
+    def _enqueue(self, text: str, droppable: bool):
+        """Queue text for the UI writer on the event loop thread."""
+        queue = self._ui_queue
+        if queue is None or (droppable and queue.qsize() >= _UI_QUEUE_LIMIT):
+            return
+        queue.put_nowait(text)
+    
+    def _should_redraw(self, bucket: int, done: bool) -> bool:
+        """Check whether a progress update changes the bar enough to redraw."""
+        now = time.monotonic()
+        if not done and bucket == self._last_pct and now - self._last_ts <= 0.1:
+            return False
+        self._last_pct = bucket
+        self._last_ts = now
+        return True
     
     def print_banner(self):
         """Print application banner."""
-        click.echo(f"{Fore.CYAN}{Style.BRIGHT}{'='*60}")
-        click.echo(f"{Fore.CYAN}{Style.BRIGHT}{APP_NAME} v{APP_VERSION}")
-        click.echo(f"{Fore.CYAN}{APP_DESCRIPTION}")
-        click.echo(f"{Fore.CYAN}{Style.BRIGHT}{'='*60}")
-        click.echo()
+        click.echo(_BANNER)
     
     def print_progress(self, current: int, total: int, item_name: str = ""):
         """Print download progress for playlist."""
-        progress_bar = "█" * (current * 20 // total) + "░" * (20 - (current * 20 // total))
-        percentage = (current / total) * 100
-        click.echo(f"\r{Fore.GREEN}[{progress_bar}] {percentage:.1f}% ({current}/{total}) {item_name}", nl=False)
+        if not self._should_redraw(current, current >= total):
+            return
+        progress_bar = _BARS[min(current * 20 // total, 20)]
+        percentage = current * 100.0 / total
+        self.echo(f"\r{Fore.GREEN}[{progress_bar}] {percentage:.1f}% ({current}/{total}) {item_name}", nl=False)
     
     def print_single_progress(self, progress: float):
         """Print download progress for single item."""
-        progress_bar = "█" * int(progress // 5) + "░" * (20 - int(progress // 5))
-        click.echo(f"\r{Fore.YELLOW}[{progress_bar}] {progress:.1f}%", nl=False)
+        # Half-percent buckets: yt-dlp reports far finer deltas than that
+        if not self._should_redraw(int(progress * 2), progress >= 100):
+            return
+        progress_bar = _BARS[min(max(int(progress) // 5, 0), 20)]
+        self.echo(f"\r{Fore.YELLOW}[{progress_bar}] {progress:.1f}%", nl=False)
 
 
 @click.group()
 @click.version_option(version=APP_VERSION, prog_name=APP_NAME)
-def cli():
+@click.option('--no-cache', is_flag=True, help='Always fetch fresh metadata from YouTube')
+def cli(no_cache: bool):
     """NeruCord Archiver - YouTube Video and Audio Downloader."""
     pass
 
 
+def _use_cache() -> bool:
+    """Check whether the current invocation may use cached metadata."""
+    return not click.get_current_context().find_root().params.get('no_cache', False)
+
+
+@lru_cache(maxsize=256)
+def _short_title(title: str) -> str:
+    """Truncate a title for the progress line."""
+    return title[:40] + "..." if len(title) > 40 else title
+
+
+@lru_cache(maxsize=None)
+def _get_interface(use_cache: bool = True) -> CLIInterface:
+    """Get the shared CLIInterface, building it on first use."""
+    return CLIInterface(use_cache)
+
+
 @cli.command()
 @click.argument('url')
 @click.option('--output', '-o', default=None, help='Output directory path')
 def video(url: str, output: Optional[str]):
     """Download YouTube video."""
-    interface = CLIInterface()
+    interface = _get_interface(_use_cache())
     interface.print_banner()
     
     async def download_video():
         try:
-            click.echo(f"{Fore.BLUE}📹 Getting video information...")
+            interface.echo(f"{Fore.BLUE}📹 Getting video information...")
             video_info = await interface.get_video_info_use_case.execute(url)
             
             output_path = output or interface.config.get_video_path()
             
-            click.echo(f"{Fore.GREEN}✓ Title: {video_info.title}")
-            click.echo(f"{Fore.GREEN}✓ Uploader: {video_info.uploader}")
+            lines = [
+                f"{Fore.GREEN}✓ Title: {video_info.title}",
+                f"{Fore.GREEN}✓ Uploader: {video_info.uploader}",
+            ]
             if video_info.duration:
-                duration = f"{video_info.duration // 60}:{video_info.duration % 60:02d}"
-                click.echo(f"{Fore.GREEN}✓ Duration: {duration}")
-            click.echo()
+                lines.append(f"{Fore.GREEN}✓ Duration: {video_info.duration_fmt}")
+            lines.append("")
+            interface.echo("\n".join(lines))
             
-            click.echo(f"{Fore.YELLOW}{PROGRESS_DOWNLOADING}...")
+            interface.echo(f"{Fore.YELLOW}{PROGRESS_DOWNLOADING}...")
             file_path = await interface.download_video_use_case.execute(
                 video_info, 
                 output_path,
                 interface.print_single_progress
             )
-            click.echo()  # New line after progress bar
+            interface.echo()  # New line after progress bar
             
-            click.echo(f"{Fore.GREEN}✅ {SUCCESS_DOWNLOAD_COMPLETE}")
-            click.echo(f"{Fore.CYAN}📁 File saved: {file_path}")
+            interface.echo(f"{Fore.GREEN}✅ {SUCCESS_DOWNLOAD_COMPLETE}")
+            interface.echo(f"{Fore.CYAN}📁 File saved: {file_path}")
             
         except Exception as e:
-            click.echo(f"{Fore.RED}❌ Error: {str(e)}")
+            interface.echo(f"{Fore.RED}❌ Error: {str(e)}")
     
-    asyncio.run(download_video())
+    run_async(interface.run_with_ui(download_video()))
 
 
 @cli.command()
@@ -141,38 +286,40 @@ def video(url: str, output: Optional[str]):
 @click.option('--output', '-o', default=None, help='Output directory path')
 def audio(url: str, output: Optional[str]):
     """Download and convert YouTube video to MP3."""
-    interface = CLIInterface()
+    interface = _get_interface(_use_cache())
     interface.print_banner()
     
     async def download_audio():
         try:
-            click.echo(f"{Fore.BLUE}🎵 Getting video information...")
+            interface.echo(f"{Fore.BLUE}🎵 Getting video information...")
             video_info = await interface.get_video_info_use_case.execute(url)
             
             output_path = output or interface.config.get_audio_path()
             
-            click.echo(f"{Fore.GREEN}✓ Title: {video_info.title}")
-            click.echo(f"{Fore.GREEN}✓ Uploader: {video_info.uploader}")
+            lines = [
+                f"{Fore.GREEN}✓ Title: {video_info.title}",
+                f"{Fore.GREEN}✓ Uploader: {video_info.uploader}",
+            ]
             if video_info.duration:
-                duration = f"{video_info.duration // 60}:{video_info.duration % 60:02d}"
-                click.echo(f"{Fore.GREEN}✓ Duration: {duration}")
-            click.echo()
+                lines.append(f"{Fore.GREEN}✓ Duration: {video_info.duration_fmt}")
+            lines.append("")
+            interface.echo("\n".join(lines))
             
-            click.echo(f"{Fore.YELLOW}{PROGRESS_DOWNLOADING} and converting...")
+            interface.echo(f"{Fore.YELLOW}{PROGRESS_DOWNLOADING} and converting...")
             file_path = await interface.download_audio_use_case.execute(
                 video_info, 
                 output_path,
                 interface.print_single_progress
             )
-            click.echo()  # New line after progress bar
+            interface.echo()  # New line after progress bar
             
-            click.echo(f"{Fore.GREEN}✅ {SUCCESS_DOWNLOAD_COMPLETE}")
-            click.echo(f"{Fore.CYAN}📁 File saved: {file_path}")
+            interface.echo(f"{Fore.GREEN}✅ {SUCCESS_DOWNLOAD_COMPLETE}")
+            interface.echo(f"{Fore.CYAN}📁 File saved: {file_path}")
             
         except Exception as e:
-            click.echo(f"{Fore.RED}❌ Error: {str(e)}")
+            interface.echo(f"{Fore.RED}❌ Error: {str(e)}")
     
-    asyncio.run(download_audio())
+    run_async(interface.run_with_ui(download_audio()))
 
 
 @cli.command()
@@ -183,18 +330,19 @@ def audio(url: str, output: Optional[str]):
 @click.option('--output', '-o', default=None, help='Output directory path')
 def playlist(url: str, download_type: str, output: Optional[str]):
     """Download entire YouTube playlist."""
-    interface = CLIInterface()
+    interface = _get_interface(_use_cache())
     interface.print_banner()
     
     async def download_playlist():
         try:
-            click.echo(f"{Fore.BLUE}📋 Getting playlist information...")
+            interface.echo(f"{Fore.BLUE}📋 Getting playlist information...")
             playlist_info = await interface.get_playlist_info_use_case.execute(url)
             
-            click.echo(f"{Fore.GREEN}✓ Playlist: {playlist_info.title}")
-            click.echo(f"{Fore.GREEN}✓ Videos: {len(playlist_info.videos)}")
-            click.echo(f"{Fore.GREEN}✓ Uploader: {playlist_info.uploader}")
-            click.echo()
+            interface.echo(
+                f"{Fore.GREEN}✓ Playlist: {playlist_info.title}\n"
+                f"{Fore.GREEN}✓ Videos: {len(playlist_info.videos)}\n"
+                f"{Fore.GREEN}✓ Uploader: {playlist_info.uploader}\n"
+            )
             
             if download_type.lower() == 'video':
                 dtype = DownloadType.VIDEO
@@ -203,107 +351,121 @@ def playlist(url: str, download_type: str, output: Optional[str]):
                 dtype = DownloadType.AUDIO
                 output_path = output or interface.config.get_audio_path()
             
-            click.echo(f"{Fore.YELLOW}📥 Downloading playlist as {download_type}...")
+            interface.echo(f"{Fore.YELLOW}📥 Downloading playlist as {download_type}...")
             
             def playlist_progress(current: int, total: int, title: str):
-                interface.print_progress(current, total, title[:40] + "..." if len(title) > 40 else title)
+                interface.print_progress(current, total, _short_title(title))
             
             downloaded_files = await interface.download_playlist_use_case.execute(
                 url, dtype, output_path, playlist_progress
             )
             
-            click.echo()  # New line after progress bar
-            click.echo(f"{Fore.GREEN}✅ Playlist download completed!")
-            click.echo(f"{Fore.CYAN}📁 Downloaded {len(downloaded_files)} files to: {output_path}")
+            interface.echo()  # New line after progress bar
+            interface.echo(f"{Fore.GREEN}✅ Playlist download completed!")
+            interface.echo(f"{Fore.CYAN}📁 Downloaded {len(downloaded_files)} files to: {output_path}")
             
         except Exception as e:
-            click.echo(f"{Fore.RED}❌ Error: {str(e)}")
+            interface.echo(f"{Fore.RED}❌ Error: {str(e)}")
     
-    asyncio.run(download_playlist())
+    run_async(interface.run_with_ui(download_playlist()))
 
 
 @cli.command()
 @click.argument('url')
 def info(url: str):
     """Get information about YouTube video or playlist."""
-    interface = CLIInterface()
+    interface = _get_interface(_use_cache())
     interface.print_banner()
     
     async def get_info():
         try:
-            # Try to get video info first
-            try:
-                video_info = await interface.get_video_info_use_case.execute(url)
-                click.echo(f"{Fore.BLUE}📹 Video Information:")
-                click.echo(f"{Fore.GREEN}  Title: {video_info.title}")
-                click.echo(f"{Fore.GREEN}  URL: {video_info.url}")
-                click.echo(f"{Fore.GREEN}  Uploader: {video_info.uploader}")
+            # URLs the video use case would reject as playlists (including
+            # watch?v=...&list=... and music albums) go straight to the
+            # playlist lookup; anything else is tried as a video first
+            video_info = None
+            if not make_youtube_url(url).is_playlist():
+                try:
+                    video_info = await interface.get_video_info_use_case.execute(url)
+                except RuntimeError:
+                    pass  # Not a single video (e.g. an album); try it as a playlist
+            
+            if video_info is not None:
+                lines = [
+                    f"{Fore.BLUE}📹 Video Information:",
+                    f"{Fore.GREEN}  Title: {video_info.title}",
+                    f"{Fore.GREEN}  URL: {video_info.url}",
+                    f"{Fore.GREEN}  Uploader: {video_info.uploader}",
+                ]
                 if video_info.duration:
-                    duration = f"{video_info.duration // 60}:{video_info.duration % 60:02d}"
-                    click.echo(f"{Fore.GREEN}  Duration: {duration}")
+                    lines.append(f"{Fore.GREEN}  Duration: {video_info.duration_fmt}")
                 if video_info.view_count:
-                    click.echo(f"{Fore.GREEN}  Views: {video_info.view_count:,}")
-                
-            except:
-                # If video info fails, try playlist info
+                    lines.append(f"{Fore.GREEN}  Views: {video_info.view_count_fmt}")
+            else:
                 playlist_info = await interface.get_playlist_info_use_case.execute(url)
-                click.echo(f"{Fore.BLUE}📋 Playlist Information:")
-                click.echo(f"{Fore.GREEN}  Title: {playlist_info.title}")
-                click.echo(f"{Fore.GREEN}  URL: {playlist_info.url}")
-                click.echo(f"{Fore.GREEN}  Uploader: {playlist_info.uploader}")
-                click.echo(f"{Fore.GREEN}  Videos: {len(playlist_info.videos)}")
-                click.echo()
-                click.echo(f"{Fore.CYAN}  Video List:")
+                lines = [
+                    f"{Fore.BLUE}📋 Playlist Information:",
+                    f"{Fore.GREEN}  Title: {playlist_info.title}",
+                    f"{Fore.GREEN}  URL: {playlist_info.url}",
+                    f"{Fore.GREEN}  Uploader: {playlist_info.uploader}",
+                    f"{Fore.GREEN}  Videos: {len(playlist_info.videos)}",
+                    "",
+                    f"{Fore.CYAN}  Video List:",
+                ]
                 for i, video in enumerate(playlist_info.videos[:10], 1):  # Show first 10
-                    click.echo(f"{Fore.YELLOW}    {i}. {video.title}")
+                    lines.append(f"{Fore.YELLOW}    {i}. {video.title}")
                 if len(playlist_info.videos) > 10:
-                    click.echo(f"{Fore.YELLOW}    ... and {len(playlist_info.videos) - 10} more videos")
+                    lines.append(f"{Fore.YELLOW}    ... and {len(playlist_info.videos) - 10} more videos")
+            
+            interface.echo("\n".join(lines))
             
         except Exception as e:
-            click.echo(f"{Fore.RED}❌ Error: {str(e)}")
+            interface.echo(f"{Fore.RED}❌ Error: {str(e)}")
     
-    asyncio.run(get_info())
+    run_async(interface.run_with_ui(get_info()))
 
 
 @cli.command()
 @click.argument('url')
-def browse(url: str):
+@click.option('--limit', '-l', default=50, show_default=True, type=click.IntRange(min=1),
+              help='Maximum number of videos to list')
+def browse(url: str, limit: int):
     """Browse YouTube channel videos with interactive selection."""
-    interface = CLIInterface()
+    interface = _get_interface(_use_cache())
     interface.print_banner()
     
     async def browse_channel():
         try:
-            click.echo(f"{Fore.BLUE}📺 Getting channel information...")
-            channel_info = await interface.get_channel_info_use_case.execute(url)
+            interface.echo(f"{Fore.BLUE}📺 Getting channel information...")
+            channel_info, videos = await interface.get_channel_info_use_case.stream(url, limit)
             
-            click.echo(f"{Fore.GREEN}✓ Channel: {channel_info.title}")
-            click.echo(f"{Fore.GREEN}✓ Videos: {len(channel_info.videos)}")
+            lines = [f"{Fore.GREEN}✓ Channel: {channel_info.title}"]
             if channel_info.subscriber_count:
-                click.echo(f"{Fore.GREEN}✓ Subscribers: {int(channel_info.subscriber_count):,}")
-            click.echo()
-            
-            # Display video list
-            click.echo(f"{Fore.CYAN}📋 Available Videos:")
-            for i, video in enumerate(channel_info.videos, 1):
-                duration = ""
-                if video.duration:
-                    duration_mins = int(video.duration // 60)
-                    duration_secs = int(video.duration % 60)
-                    duration = f" ({duration_mins}:{duration_secs:02d})"
-                views = ""
-                if video.view_count:
-                    views = f" | {int(video.view_count):,} views"
-                click.echo(f"{Fore.YELLOW}  {i:2d}. {video.title}{duration}{views}")
-            
-            click.echo()
-            click.echo(f"{Fore.CYAN}💡 Use the 'channel' command to download all or selected videos.")
-            click.echo(f"{Fore.CYAN}   Example: python main.py channel \"{url}\" --select 1,3,5")
+                lines.append(f"{Fore.GREEN}✓ Subscribers: {channel_info.subscriber_count:,}")
+            lines.append("")
+            lines.append(f"{Fore.CYAN}📋 Available Videos:")
+            interface.echo("\n".join(lines))
+            
+            # Rows are printed as yt-dlp resolves them
+            count = 0
+            async for video in videos:
+                count += 1
+                interface.echo(_BROWSE_ROW % (
+                    count,
+                    video.title,
+                    f" ({video.duration_fmt})" if video.duration else "",
+                    f" | {video.view_count_fmt} views" if video.view_count else "",
+                ))
+            
+            interface.echo(
+                f"\n{Fore.GREEN}✓ Videos: {count}\n\n"
+                f"{Fore.CYAN}💡 Use the 'channel' command to download all or selected videos.\n"
+                f"{Fore.CYAN}   Example: python main.py channel \"{url}\" --select 1,3,5"
+            )
             
         except Exception as e:
-            click.echo(f"{Fore.RED}❌ Error: {str(e)}")
+            interface.echo(f"{Fore.RED}❌ Error: {str(e)}")
     
-    asyncio.run(browse_channel())
+    run_async(interface.run_with_ui(browse_channel()))
 
 
 @cli.command()
@@ -316,35 +478,35 @@ def browse(url: str):
 @click.option('--all', '-a', is_flag=True, help='Download all videos from the channel')
 def channel(url: str, download_type: str, output: Optional[str], select: Optional[str], all: bool):
     """Download videos from a YouTube channel."""
-    interface = CLIInterface()
+    interface = _get_interface(_use_cache())
     interface.print_banner()
     
     async def download_channel():
         try:
-            click.echo(f"{Fore.BLUE}📺 Getting channel information...")
+            interface.echo(f"{Fore.BLUE}📺 Getting channel information...")
             channel_info = await interface.get_channel_info_use_case.execute(url)
             
-            click.echo(f"{Fore.GREEN}✓ Channel: {channel_info.title}")
-            click.echo(f"{Fore.GREEN}✓ Videos: {len(channel_info.videos)}")
+            interface.echo(f"{Fore.GREEN}✓ Channel: {channel_info.title}")
+            interface.echo(f"{Fore.GREEN}✓ Videos: {len(channel_info.videos)}")
             if channel_info.subscriber_count:
-                click.echo(f"{Fore.GREEN}✓ Subscribers: {int(channel_info.subscriber_count):,}")
-            click.echo()
+                interface.echo(f"{Fore.GREEN}✓ Subscribers: {channel_info.subscriber_count:,}")
+            interface.echo()
             
             # Parse selection
             selected_indices = None
             if select and not all:
                 selected_indices = parse_selection(select, len(channel_info.videos))
                 if not selected_indices:
-                    click.echo(f"{Fore.RED}❌ Invalid selection format or range")
+                    interface.echo(f"{Fore.RED}❌ Invalid selection format or range")
                     return
                 
-                click.echo(f"{Fore.CYAN}📋 Selected videos:")
+                interface.echo(f"{Fore.CYAN}📋 Selected videos:")
                 for i in selected_indices:
                     video = channel_info.videos[i]
-                    click.echo(f"{Fore.YELLOW}  {i+1}. {video.title}")
-                click.echo()
+                    interface.echo(f"{Fore.YELLOW}  {i+1}. {video.title}")
+                interface.echo()
             elif not all and not select:
-                click.echo(f"{Fore.RED}❌ Please specify --all to download all videos or --select to choose specific videos")
+                interface.echo(f"{Fore.RED}❌ Please specify --all to download all videos or --select to choose specific videos")
                 return
             
             if download_type.lower() == 'video':
@@ -354,58 +516,37 @@ def channel(url: str, download_type: str, output: Optional[str], select: Optiona
                 dtype = DownloadType.AUDIO
                 output_path = output or interface.config.get_audio_path()
             
-            click.echo(f"{Fore.YELLOW}📥 Downloading channel videos as {download_type}...")
+            interface.echo(f"{Fore.YELLOW}📥 Downloading channel videos as {download_type}...")
             
             def channel_progress(current: int, total: int, title: str):
-                interface.print_progress(current, total, title[:40] + "..." if len(title) > 40 else title)
+                interface.print_progress(current, total, _short_title(title))
             
             downloaded_files = await interface.download_channel_use_case.execute(
                 url, dtype, output_path, selected_indices, channel_progress
             )
             
-            click.echo()  # New line after progress bar
-            click.echo(f"{Fore.GREEN}✅ Channel download completed!")
-            click.echo(f"{Fore.CYAN}📁 Downloaded {len(downloaded_files)} files to: {output_path}")
+            interface.echo()  # New line after progress bar
+            interface.echo(f"{Fore.GREEN}✅ Channel download completed!")
+            interface.echo(f"{Fore.CYAN}📁 Downloaded {len(downloaded_files)} files to: {output_path}")
             
         except Exception as e:
-            click.echo(f"{Fore.RED}❌ Error: {str(e)}")
+            interface.echo(f"{Fore.RED}❌ Error: {str(e)}")
     
-    asyncio.run(download_channel())
+    run_async(interface.run_with_ui(download_channel()))
 
 
 def parse_selection(selection: str, max_count: int) -> Optional[List[int]]:
     """Parse selection string into list of indices."""
-    try:
-        indices = []
-        for part in selection.split(','):
-            part = part.strip()
-            if '-' in part:
-                # Handle range like "1-5"
-                start, end = part.split('-')
-                start = int(start) - 1  # Convert to 0-based
-                end = int(end) - 1
-                if start < 0 or end >= max_count or start > end:
-                    return None
-                indices.extend(range(start, end + 1))
-            else:
-                # Handle single number
-                index = int(part) - 1  # Convert to 0-based
-                if index < 0 or index >= max_count:
-                    return None
-                indices.append(index)
-        
-        return sorted(list(set(indices)))  # Remove duplicates and sort
-    except ValueError:
-        return None
+    return ValidationHelper.parse_selection(selection, max_count)
 
 
 @cli.command()
 def interactive():
     """Launch interactive mode with menu-driven interface."""
     from .interactive import InteractiveCLI
-    interface = InteractiveCLI()
+    interface = InteractiveCLI(_use_cache())
     try:
-        asyncio.run(interface.run())
+        run_async(interface.run())
     except KeyboardInterrupt:
         click.echo(f"\n\n{Fore.YELLOW}👋 Goodbye!{Style.RESET_ALL}")
 
@@ -2,7 +2,14 @@
 Configuration package initialization.
 """
 
+from . import constants
 from .constants import *
 from .settings import Config
 
+
+def __getattr__(name):
+    """Forward the lazily resolved download path constants."""
+    return getattr(constants, name)
+
+
 __all__ = ['Config']
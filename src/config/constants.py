@@ -4,30 +4,57 @@ Global configuration constants for the YouTube Archiver application.
 This module contains all configurable values used throughout the application.
 """
 
+import locale
 import os
+import re
+import unicodedata
+from functools import lru_cache
 from pathlib import Path
+from typing import Final, FrozenSet, Tuple
 
+# Localized Downloads folder names, keyed by locale language code
+_LOCALIZED_DOWNLOADS = {
+    "fr": "Téléchargements",  # French
+    "es": "Descargas",        # Spanish
+    "zh": "下载",              # Chinese
+    "ja": "ダウンロード",        # Japanese
+}
+
+
+@lru_cache(maxsize=None)
 def get_default_download_path():
-    """Get the default Downloads folder for the current platform."""
+    """Get the default Downloads folder for the current platform.
+    
+    The lookup runs once, on first use, and lists the home directory with
+    a single scandir instead of probing each candidate name. English names
+    win, then the localized name for the user's locale, then the others.
+    """
     # Get user's home directory
     home = Path.home()
     
-    # Try to find Downloads folder (handles different languages/localizations)
-    downloads_candidates = [
-        home / "Downloads",
-        home / "downloads", 
-        home / "Download",
-        home / "download",
-        home / "Téléchargements",  # French
-        home / "Descargas",       # Spanish
-        home / "下载",             # Chinese
-        home / "ダウンロード",        # Japanese
-    ]
+    # Candidate names (handles different languages/localizations), in order
+    # of preference
+    names = ["Downloads", "downloads", "Download", "download"]
+    language = (locale.getlocale()[0] or "").split("_")[0].lower()
+    if language in _LOCALIZED_DOWNLOADS:
+        names.append(_LOCALIZED_DOWNLOADS[language])
+    names.extend(name for name in _LOCALIZED_DOWNLOADS.values() if name not in names)
+    
+    # Existing candidate folders, by NFC name (macOS may report NFD names)
+    found = {}
+    try:
+        with os.scandir(home) as entries:
+            for entry in entries:
+                name = unicodedata.normalize("NFC", entry.name)
+                if name in names and entry.is_dir():
+                    found[name] = entry.name
+    except OSError:
+        pass
     
     # Return the first existing Downloads folder, or create Downloads if none exist
-    for downloads_path in downloads_candidates:
-        if downloads_path.exists() and downloads_path.is_dir():
-            return str(downloads_path / "NeruCord")
+    for name in names:
+        if name in found:
+            return str(home / found[name] / "NeruCord")
     
     # Fallback: create Downloads folder if it doesn't exist
     downloads_path = home / "Downloads" / "NeruCord"
@@ -38,10 +65,31 @@ APP_NAME = "NeruCord Archiver"
 APP_VERSION = "1.1.0"
 APP_DESCRIPTION = "A powerful YouTube video and audio downloader with playlist support"
 
-# Download Paths
-DEFAULT_DOWNLOAD_PATH = get_default_download_path()
-AUDIO_DOWNLOAD_PATH = os.path.join(DEFAULT_DOWNLOAD_PATH, "audio")
-VIDEO_DOWNLOAD_PATH = os.path.join(DEFAULT_DOWNLOAD_PATH, "video")
+# Download Paths (DEFAULT_DOWNLOAD_PATH, AUDIO_DOWNLOAD_PATH and
+# VIDEO_DOWNLOAD_PATH) are resolved lazily by __getattr__ below
+_DOWNLOAD_SUBDIRS = {
+    "DEFAULT_DOWNLOAD_PATH": "",
+    "AUDIO_DOWNLOAD_PATH": "audio",
+    "VIDEO_DOWNLOAD_PATH": "video",
+}
+
+
+def __getattr__(name):
+    """Resolve the download path constants on first access (PEP 562)."""
+    if name not in _DOWNLOAD_SUBDIRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    subdir = _DOWNLOAD_SUBDIRS[name]
+    path = get_default_download_path()
+    value = os.path.join(path, subdir) if subdir else path
+    globals()[name] = value
+    return value
+
+
+# Metadata Cache
+METADATA_CACHE_PATH = str(Path.home() / ".nerucord" / "cache")
+METADATA_CACHE_TTL = 6 * 60 * 60  # seconds
+SESSION_INFO_CACHE_TTL = 10 * 60  # seconds extraction results are reused in-process
+SESSION_INFO_CACHE_SIZE = 256
 
 # File Formats
 AUDIO_FORMAT = "mp3"
@@ -68,11 +116,11 @@ PROGRESS_CONVERTING = "Converting to audio"
 PROGRESS_FETCHING_INFO = "Fetching video information"
 
 # File Extensions
-SUPPORTED_AUDIO_FORMATS = ["mp3", "wav", "flac", "aac"]
-SUPPORTED_VIDEO_FORMATS = ["mp4", "webm", "mkv", "avi"]
+SUPPORTED_AUDIO_FORMATS: Final[FrozenSet[str]] = frozenset(("mp3", "wav", "flac", "aac"))
+SUPPORTED_VIDEO_FORMATS: Final[FrozenSet[str]] = frozenset(("mp4", "webm", "mkv", "avi"))
 
 # URL Patterns
-YOUTUBE_URL_PATTERNS = [
+YOUTUBE_URL_PATTERNS: Final[Tuple[str, ...]] = (
     r"youtube\.com/watch",
     r"youtu\.be/",
     r"youtube\.com/playlist",
@@ -85,7 +133,11 @@ YOUTUBE_URL_PATTERNS = [
     r"music\.youtube\.com/playlist",
     r"music\.youtube\.com/album",
     r"music\.youtube\.com/browse"
-]
+)
+# All patterns as one alternation, compiled once at import
+YOUTUBE_URL_REGEX: Final[re.Pattern] = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in YOUTUBE_URL_PATTERNS)
+)
 
 # Timeouts
 DOWNLOAD_TIMEOUT = 300  # seconds
@@ -93,4 +145,10 @@ NETWORK_TIMEOUT = 30  # seconds
 
 # Limits
 MAX_PLAYLIST_SIZE = 1000
+MAX_CONCURRENT_DOWNLOADS = 4
+IO_THREAD_POOL_SIZE = 8  # threads running blocking yt-dlp calls
+MAX_CONCURRENT_EXTRACTIONS = 8  # per-video metadata lookups in flight at once
+METADATA_SOCKET_TIMEOUT = 15  # seconds before a stalled metadata request fails
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 2.0  # seconds, doubled on each retry
 MAX_FILENAME_LENGTH = 200
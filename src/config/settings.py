@@ -3,10 +3,18 @@ Configuration settings for the YouTube Archiver application.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from . import constants
 from .constants import *
 
 
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str):
+    """Create a directory (and parents) once per process."""
+    Path(path).mkdir(parents=True, exist_ok=True)
+
+
 class Config:
     """Application configuration class."""
     
@@ -16,24 +24,31 @@ class Config:
         self.video_quality = VIDEO_QUALITY
         self.audio_format = AUDIO_FORMAT
         self.video_format = VIDEO_FORMAT
+        self.max_concurrent_downloads = MAX_CONCURRENT_DOWNLOADS
         
     def _get_download_path(self) -> str:
         """Get the download path, create if doesn't exist."""
-        download_dir = Path(DEFAULT_DOWNLOAD_PATH)
-        download_dir.mkdir(parents=True, exist_ok=True)
-        
-        audio_dir = Path(AUDIO_DOWNLOAD_PATH)
-        audio_dir.mkdir(parents=True, exist_ok=True)
-        
-        video_dir = Path(VIDEO_DOWNLOAD_PATH)
-        video_dir.mkdir(parents=True, exist_ok=True)
-        
-        return str(download_dir)
+        _ensure_dir(constants.DEFAULT_DOWNLOAD_PATH)
+        _ensure_dir(constants.AUDIO_DOWNLOAD_PATH)
+        _ensure_dir(constants.VIDEO_DOWNLOAD_PATH)
+        return str(Path(constants.DEFAULT_DOWNLOAD_PATH))
     
     def get_audio_path(self) -> str:
         """Get the audio download path."""
-        return AUDIO_DOWNLOAD_PATH
+        return constants.AUDIO_DOWNLOAD_PATH
     
     def get_video_path(self) -> str:
         """Get the video download path."""
-        return VIDEO_DOWNLOAD_PATH
+        return constants.VIDEO_DOWNLOAD_PATH
+    
+    def get_audio_quality(self) -> str:
+        """Get the default audio bitrate in kbps."""
+        return self.audio_quality
+    
+    def get_video_quality(self) -> str:
+        """Get the default video quality."""
+        return self.video_quality
+    
+    def get_max_concurrent_downloads(self) -> int:
+        """Get the number of downloads allowed to run at once."""
+        return self.max_concurrent_downloads
@@ -3,7 +3,7 @@ Domain package initialization.
 """
 
 from .entities import VideoInfo, PlaylistInfo, DownloadTask, DownloadType, DownloadStatus
-from .value_objects import YouTubeURL, FilePath, Quality
+from .value_objects import YouTubeURL, FilePath, Quality, make_youtube_url
 
 __all__ = [
     'VideoInfo',
@@ -13,5 +13,6 @@ __all__ = [
     'DownloadStatus',
     'YouTubeURL',
     'FilePath',
-    'Quality'
+    'Quality',
+    'make_youtube_url'
 ]
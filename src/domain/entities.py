@@ -2,10 +2,29 @@
 Domain entities for the YouTube Archiver application.
 """
 
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, List
 from enum import Enum
 
+# Entities are created once per video; use __slots__ where dataclasses
+# support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=4096)
+def _fmt_duration(seconds: int) -> str:
+    """Format whole seconds as m:ss."""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_count(count: int) -> str:
+    """Format a count with thousand separators."""
+    return f"{count:,}"
+
 
 class DownloadType(Enum):
     """Enumeration for download types."""
@@ -23,7 +42,7 @@ class DownloadStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class VideoInfo:
     """Entity representing video information."""
     title: str
@@ -38,9 +57,28 @@ class VideoInfo:
             raise ValueError("URL cannot be empty")
         if not self.title:
             raise ValueError("Title cannot be empty")
+        # Flat playlist and channel entries report these as floats
+        if self.duration is not None:
+            self.duration = int(self.duration)
+        if self.view_count is not None:
+            self.view_count = int(self.view_count)
+    
+    @property
+    def duration_fmt(self) -> str:
+        """Duration as m:ss, or an empty string when unknown."""
+        if not self.duration:
+            return ""
+        return _fmt_duration(self.duration)
+    
+    @property
+    def view_count_fmt(self) -> str:
+        """View count with thousand separators, or an empty string when unknown."""
+        if not self.view_count:
+            return ""
+        return _fmt_count(self.view_count)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PlaylistInfo:
     """Entity representing playlist information."""
     title: str
@@ -58,7 +96,7 @@ class PlaylistInfo:
             self.video_count = len(self.videos)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ChannelInfo:
     """Entity representing channel information."""
     title: str
@@ -75,9 +113,11 @@ class ChannelInfo:
             raise ValueError("Channel title cannot be empty")
         if self.video_count is None:
             self.video_count = len(self.videos)
+        if self.subscriber_count is not None:
+            self.subscriber_count = int(self.subscriber_count)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DownloadTask:
     """Entity representing a download task."""
     video_info: VideoInfo
@@ -2,92 +2,175 @@
 Value objects for the YouTube Archiver application.
 """
 
+import os
 import re
-from dataclasses import dataclass
-from typing import Union
-from ..config.constants import YOUTUBE_URL_PATTERNS
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, Union
+from urllib.parse import SplitResult, urlsplit, urlunsplit
+from ..config.constants import YOUTUBE_URL_REGEX
 
+# See domain.entities: __slots__ where dataclasses support it
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+# Host -> path prefixes that are always valid; used to accept common URLs
+# without running the full pattern regex
+_YOUTUBE_PATHS = ("/watch", "/playlist", "/channel", "/user", "/c/", "/@")
+_FAST_PATH_PREFIXES = {
+    "youtube.com": _YOUTUBE_PATHS,
+    "www.youtube.com": _YOUTUBE_PATHS,
+    "m.youtube.com": _YOUTUBE_PATHS,
+    "music.youtube.com": _YOUTUBE_PATHS + ("/album", "/browse"),
+    "youtu.be": ("/",),
+}
+
+# URL classification, each a single scan of the URL. Playlist: "playlist"
+# or "list=" anywhere, or a music.youtube.com album. Channel: "channel",
+# "user" or "c/" anywhere, or "@" or "/videos" on a youtube.com/ URL.
+_PLAYLIST_RE = re.compile(
+    r"playlist|list=|album.*music\.youtube\.com|music\.youtube\.com.*album", re.S
+)
+_CHANNEL_RE = re.compile(
+    r"channel|user|c/|@.*youtube\.com/|youtube\.com/.*@"
+    r"|/videos.*youtube\.com/|youtube\.com(?:/.*)?/videos",
+    re.S
+)
+
+# Canonical 11-character video ID after a watch, short-link, shorts, embed
+# or live marker
+_VIDEO_ID_RE = re.compile(
+    r"(?:v=|youtu\.be/|/shorts/|/embed/|/live/)([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"
+)
+
+# Query parameters added by share links and trackers, dropped on normalization
+_TRACKING_PARAMS = frozenset({"si", "feature", "fbclid"})
+
+
+def _is_tracking_param(key: str) -> bool:
+    """Check whether a query parameter name is a tracking parameter."""
+    return key in _TRACKING_PARAMS or key.startswith("utm_")
+
+
+@dataclass(frozen=True, **_SLOTS)
 class YouTubeURL:
     """Value object representing a YouTube URL."""
     url: str
+    # Classification cached by __post_init__; not part of the value
+    _is_playlist: bool = field(init=False, repr=False, compare=False)
+    _is_channel: bool = field(init=False, repr=False, compare=False)
+    _is_music: bool = field(init=False, repr=False, compare=False)
+    _normalized: str = field(init=False, repr=False, compare=False)
+    _video_id: Optional[str] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        if not self._is_valid_youtube_url(self.url):
+        # Split once; validation and normalization both use the parts
+        try:
+            parts = urlsplit(self.url)
+        except ValueError:
+            parts = None  # Malformed URL
+        if not self._is_valid_youtube_url(self.url, parts):
             raise ValueError(f"Invalid YouTube URL: {self.url}")
+        # The URL is immutable, so classify it once; the predicates below
+        # just return these
+        object.__setattr__(self, "_is_playlist", self._check_playlist())
+        object.__setattr__(self, "_is_channel", self._check_channel())
+        object.__setattr__(self, "_is_music", "music.youtube.com" in self.url)
+        object.__setattr__(self, "_normalized", self._normalize(parts))
+        match = _VIDEO_ID_RE.search(self.url)
+        object.__setattr__(self, "_video_id", match.group(1) if match else None)
     
-    def _is_valid_youtube_url(self, url: str) -> bool:
+    def _is_valid_youtube_url(self, url: str, parts: Optional[SplitResult]) -> bool:
         """Validate if the URL is a valid YouTube URL."""
-        return any(re.search(pattern, url) for pattern in YOUTUBE_URL_PATTERNS)
+        if parts is not None:  # Malformed URLs are left to the regex
+            prefixes = _FAST_PATH_PREFIXES.get(parts.netloc.lower())
+            if prefixes is not None and parts.path.startswith(prefixes):
+                return True
+        # Unusual hosts or paths (e.g. /<name>/videos, scheme-less URLs)
+        return YOUTUBE_URL_REGEX.search(url) is not None
     
     def is_playlist(self) -> bool:
         """Check if the URL is a playlist URL."""
-        return any([
-            "playlist" in self.url,
-            "list=" in self.url,
-            "album" in self.url and "music.youtube.com" in self.url,
-            "&list=" in self.url
-        ])
+        return self._is_playlist
     
     def is_channel(self) -> bool:
         """Check if the URL is a channel URL."""
-        return any([
-            "channel" in self.url,
-            "user" in self.url,
-            "c/" in self.url,
-            "@" in self.url and "youtube.com/" in self.url,
-            "/videos" in self.url and "youtube.com/" in self.url
-        ])
+        return self._is_channel
 
     def is_music_youtube(self) -> bool:
         """Check if the URL is from music.youtube.com."""
-        return "music.youtube.com" in self.url
+        return self._is_music
     
     def normalize_url(self) -> str:
         """Normalize the URL for better compatibility."""
-        url = self.url
-        
-        # Remove tracking parameters
-        tracking_params = ['si=', 'feature=', 'utm_', 'fbclid=']
-        for param in tracking_params:
-            if param in url:
-                # Find the parameter and remove it along with its value
-                param_start = url.find(param)
-                if param_start != -1:
-                    # Find the next & or end of string
-                    param_end = url.find('&', param_start)
-                    if param_end == -1:
-                        param_end = len(url)
-                    # Remove the parameter
-                    before = url[:param_start]
-                    after = url[param_end:]
-                    url = before + after
-                    # Clean up double &s or trailing &
-                    url = url.replace('&&', '&').rstrip('&').rstrip('?')
-        
-        return url
-
-
-@dataclass(frozen=True)
+        return self._normalized
+    
+    def normalized(self) -> "YouTubeURL":
+        """The normalized URL as a YouTubeURL; self when already normalized."""
+        if self._normalized == self.url:
+            return self
+        return make_youtube_url(self._normalized)
+    
+    @property
+    def video_id(self) -> Optional[str]:
+        """The 11-character video ID, or None for URLs without one."""
+        return self._video_id
+    
+    def _check_playlist(self) -> bool:
+        """Classify the URL as a playlist URL."""
+        return _PLAYLIST_RE.search(self.url) is not None
+    
+    def _check_channel(self) -> bool:
+        """Classify the URL as a channel URL."""
+        return _CHANNEL_RE.search(self.url) is not None
+
+    def _normalize(self, parts: Optional[SplitResult]) -> str:
+        """Strip tracking parameters from the URL."""
+        if parts is None:
+            return self.url
+        # Filter the raw "key=value" pairs so kept values stay encoded
+        # exactly as they were given
+        params = [p for p in parts.query.split('&') if p]
+        kept = [p for p in params if not _is_tracking_param(p.partition('=')[0])]
+        if len(kept) == len(params):
+            return self.url
+        return urlunsplit(parts._replace(query='&'.join(kept)))
+
+
+@lru_cache(maxsize=4096)
+def make_youtube_url(url: str) -> YouTubeURL:
+    """Build a YouTubeURL, reusing the instance for a URL seen before.
+    
+    YouTubeURL is immutable, so one validated instance can be shared by
+    every caller; invalid URLs still raise ValueError on each call.
+    """
+    return YouTubeURL(url)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class FilePath:
     """Value object representing a file path."""
     path: str
+    _filename: str = field(init=False, repr=False, compare=False)
+    _extension: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.path or not self.path.strip():
             raise ValueError("File path cannot be empty")
+        # Split once; the path is immutable
+        object.__setattr__(self, "_filename", os.path.basename(self.path))
+        object.__setattr__(self, "_extension", os.path.splitext(self.path)[1][1:])
     
     def get_extension(self) -> str:
         """Get file extension."""
-        return self.path.split('.')[-1] if '.' in self.path else ""
+        return self._extension
     
     def get_filename(self) -> str:
         """Get filename without path."""
-        return self.path.split('/')[-1] if '/' in self.path else self.path
+        return self._filename
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Quality:
     """Value object representing quality settings."""
     value: Union[str, int]
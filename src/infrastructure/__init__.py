@@ -3,7 +3,8 @@ Infrastructure package initialization.
 """
 
 from .youtube_repository import YouTubeVideoRepository
+from .cached_video_repository import CachedVideoRepository
 from .downloader_repository import YTDLPDownloaderRepository
 from .file_repository import FileSystemRepository
 
-__all__ = ['YouTubeVideoRepository', 'YTDLPDownloaderRepository', 'FileSystemRepository']
+__all__ = ['YouTubeVideoRepository', 'CachedVideoRepository', 'YTDLPDownloaderRepository', 'FileSystemRepository']
@@ -0,0 +1,78 @@
+"""
+Disk-cached video repository decorator.
+"""
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Tuple
+from ..repositories.interfaces import IVideoRepository
+from ..domain.entities import VideoInfo, PlaylistInfo, ChannelInfo
+from ..domain.value_objects import YouTubeURL
+from ..config.constants import METADATA_CACHE_PATH, METADATA_CACHE_TTL
+
+try:
+    from diskcache import Cache
+except ImportError:  # pragma: no cover - diskcache is optional
+    Cache = None
+
+
+class CachedVideoRepository(IVideoRepository):
+    """Video repository that caches another repository's results on disk.
+    
+    Entries are keyed by kind and URL (the video ID for videos) and expire
+    after ``ttl`` seconds. Without diskcache installed every call goes
+    straight to the wrapped repository.
+    """
+    
+    def __init__(
+        self,
+        repository: IVideoRepository,
+        cache_path: str = METADATA_CACHE_PATH,
+        ttl: int = METADATA_CACHE_TTL
+    ):
+        self._repository = repository
+        self._cache = Cache(cache_path) if Cache is not None else None
+        self._ttl = ttl
+    
+    async def _cached(
+        self,
+        kind: str,
+        url: YouTubeURL,
+        fetch: Callable[[YouTubeURL], Awaitable[Any]],
+        key_id: Optional[str] = None
+    ):
+        """Return the cached entry for url, fetching and storing it on a miss.
+        
+        ``key_id`` replaces the URL in the cache key when given, so
+        different URLs for the same item share one entry.
+        """
+        if self._cache is None:
+            return await fetch(url)
+        
+        key = (kind, key_id or url.url)
+        result = self._cache.get(key)
+        if result is None:
+            result = await fetch(url)
+            self._cache.set(key, result, expire=self._ttl)
+        return result
+    
+    async def get_video_info(self, url: YouTubeURL, fast: bool = True) -> VideoInfo:
+        """Get video information, from the cache when available.
+        
+        Only fast (metadata-only) lookups are cached.
+        """
+        if not fast:
+            return await self._repository.get_video_info(url, fast=False)
+        return await self._cached('video', url, self._repository.get_video_info, url.video_id)
+    
+    async def get_playlist_info(self, url: YouTubeURL) -> PlaylistInfo:
+        """Get playlist information, from the cache when available."""
+        return await self._cached('playlist', url, self._repository.get_playlist_info)
+    
+    async def get_channel_info(self, url: YouTubeURL) -> ChannelInfo:
+        """Get channel information, from the cache when available."""
+        return await self._cached('channel', url, self._repository.get_channel_info)
+    
+    async def stream_channel_info(
+        self, url: YouTubeURL, limit: int
+    ) -> Tuple[ChannelInfo, AsyncIterator[VideoInfo]]:
+        """Stream channel information; streamed listings are not cached."""
+        return await self._repository.stream_channel_info(url, limit)
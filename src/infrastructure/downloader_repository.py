@@ -2,168 +2,392 @@
 Downloader repository implementation using yt-dlp.
 """
 
-import yt_dlp
+import asyncio
 import os
-from typing import Optional, Callable
+import time
+from concurrent.futures import Executor
+from functools import partial
+from typing import Optional, Callable, Dict, Any, List, Tuple, Union
 from pathlib import Path
+from types import MappingProxyType
 from ..repositories.interfaces import IDownloaderRepository, IFileRepository
-from ..domain.entities import DownloadTask, DownloadType
+from ..domain.entities import DownloadTask, DownloadType, VideoInfo
 from ..config.constants import AUDIO_FORMAT, VIDEO_FORMAT, AUDIO_QUALITY
-from ..utils.quality_manager import QualityManager, get_video_format_options, get_audio_format_options
+from ..utils.quality_manager import get_quality_manager, get_video_format_options, get_audio_format_options
+
+# yt_dlp is imported lazily, as in youtube_repository
+
+
+# yt-dlp client settings shared by metadata extraction and downloads. These
+# are read-only templates; each YoutubeDL gets its own copy because yt-dlp
+# writes normalized values back into the params dict it is given.
+_CLIENT_OPTS = MappingProxyType({
+    'http_headers': {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+    },
+    'extractor_args': {
+        'youtube': {
+            'skip': ['dash', 'hls'],
+            'player_client': ['android', 'web']
+        }
+    },
+    'socket_timeout': 60,
+    'retries': 3,
+})
+
+# Metadata-only pass for download_from_url; uses the same client settings as
+# the download itself so the extracted formats are valid for it
+_EXTRACT_OPTS = MappingProxyType({
+    **_CLIENT_OPTS,
+    'quiet': True,
+    'no_warnings': True,
+})
+
+# Static part of the download options; format, output template, hooks and
+# postprocessors are added per download
+_DOWNLOAD_OPTS = MappingProxyType({
+    **_CLIENT_OPTS,
+    'fragment_retries': 5,
+    'sleep_interval': 1,
+    'max_sleep_interval': 5,
+})
+
+
+# Minimum change (percent) or time (seconds) between forwarded progress updates
+_PROGRESS_STEP = 1.0
+_PROGRESS_INTERVAL = 0.1
+
+_SEPARATORS = tuple(sep for sep in (os.sep, os.altsep) if sep)
+
+
+def _join(directory: str, name: str) -> str:
+    """Join a directory and a sanitized file name.
+    
+    File names never contain separators, so plain concatenation is enough;
+    os.path.join is only needed for an empty directory or one that already
+    ends in a separator.
+    """
+    if not directory or directory.endswith(_SEPARATORS):
+        return os.path.join(directory, name)
+    return f"{directory}{os.sep}{name}"
+
+
+def _on_loop(callback: Callable[[float], None]) -> Callable[[float], None]:
+    """Wrap a progress callback so yt-dlp's worker thread calls it on the event loop.
+    
+    yt-dlp reports every received chunk; updates are only forwarded when
+    progress moved by at least _PROGRESS_STEP percent or _PROGRESS_INTERVAL
+    seconds passed since the last one. The first update and completion
+    (100%) are always forwarded.
+    """
+    loop = asyncio.get_running_loop()
+    last_progress: Optional[float] = None
+    last_time = 0.0
+    
+    def call(progress: float):
+        nonlocal last_progress, last_time
+        now = time.monotonic()
+        if (last_progress is not None and progress < 100
+                and abs(progress - last_progress) < _PROGRESS_STEP
+                and now - last_time < _PROGRESS_INTERVAL):
+            return
+        last_progress, last_time = progress, now
+        loop.call_soon_threadsafe(callback, progress)
+    
+    return call
 
 
 class YTDLPDownloaderRepository(IDownloaderRepository):
     """Implementation of downloader repository using yt-dlp."""
     
-    def __init__(self, file_repository: IFileRepository):
+    def __init__(self, file_repository: IFileRepository, executor: Optional[Executor] = None):
         self._file_repository = file_repository
-        self._quality_manager = QualityManager()
+        self._quality_manager = get_quality_manager()
+        # Blocking yt-dlp calls run here (None: the loop's default executor)
+        self._executor = executor
+    
+    async def _run_io(self, fn, *args):
+        """Run a blocking yt-dlp call off the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+    
+    @staticmethod
+    def _extract(url: str) -> Optional[Dict[str, Any]]:
+        """Extract metadata for a URL without downloading."""
+        import yt_dlp
+        with yt_dlp.YoutubeDL(dict(_EXTRACT_OPTS)) as ydl:
+            return ydl.extract_info(url, download=False)
+    
+    @staticmethod
+    def _run(ydl_opts: Dict[str, Any], url: str, info: Optional[Dict[str, Any]] = None):
+        """Run a yt-dlp download, reusing pre-extracted info when given."""
+        import yt_dlp
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            if info is None:
+                ydl.download([url])
+            else:
+                ydl.process_ie_result(info, download=True)
+    
+    @staticmethod
+    def _record_output(output: Dict[str, str], d: Dict[str, Any]):
+        """Remember the file named by a finished progress or postprocessor hook."""
+        if d.get('status') != 'finished':
+            return
+        path = (d.get('info_dict') or {}).get('filepath') or d.get('filename')
+        if path:
+            output['path'] = path
+    
+    @staticmethod
+    def _find_output(directory: str, prefix: str, suffix: str = "") -> Optional[str]:
+        """Return the first file in directory named prefix...suffix, if any.
+        
+        Uses os.scandir so the scan stops at the first match and needs no
+        per-entry stat.
+        """
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.name.endswith(suffix):
+                    return entry.path
+        return None
+    
+    async def download_from_url(
+        self,
+        url: str,
+        download_type: DownloadType,
+        output_path: str,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> str:
+        """Extract metadata once and download from the same info dict."""
+        info = await self._run_io(self._extract, url)
+        if not info:
+            raise RuntimeError("Could not extract video information")
+        
+        task = DownloadTask(
+            video_info=VideoInfo(
+                title=info.get('title') or 'Unknown Title',
+                url=info.get('webpage_url') or url,
+                duration=info.get('duration'),
+                thumbnail=info.get('thumbnail'),
+                uploader=info.get('uploader'),
+                view_count=info.get('view_count')
+            ),
+            download_type=download_type,
+            output_path=output_path
+        )
+        if download_type == DownloadType.AUDIO:
+            return await self.download_audio(task, progress_callback, info)
+        return await self.download_video(task, progress_callback, info)
     
     async def download_video(
         self, 
         task: DownloadTask, 
-        progress_callback: Optional[Callable[[float], None]] = None
+        progress_callback: Optional[Callable[[float], None]] = None,
+        info: Optional[Dict[str, Any]] = None
     ) -> str:
-        """Download video file using yt-dlp."""
+        """Download video file using yt-dlp.
+        
+        When ``info`` holds an already extracted yt-dlp info dict it is
+        processed directly instead of extracting the URL again.
+        """
+        
+        output: Dict[str, str] = {}
+        on_progress = _on_loop(progress_callback) if progress_callback else None
         
         def progress_hook(d):
-            if progress_callback and d['status'] == 'downloading':
+            self._record_output(output, d)
+            if on_progress and d['status'] == 'downloading':
                 if 'total_bytes' in d and d['total_bytes']:
                     progress = (d['downloaded_bytes'] / d['total_bytes']) * 100
-                    progress_callback(progress)
+                    on_progress(progress)
                 elif 'total_bytes_estimate' in d and d['total_bytes_estimate']:
                     progress = (d['downloaded_bytes'] / d['total_bytes_estimate']) * 100
-                    progress_callback(progress)
-        
-        filename = self._file_repository.format_video_filename(
-            task.video_info.title, 
-            task.video_info.uploader
-        )
-        filename_without_ext = filename.rsplit('.', 1)[0]  # Remove extension for template
-        output_template = os.path.join(task.output_path, f"{filename_without_ext}.%(ext)s")
-        
-        video_quality = self._quality_manager.get_video_quality()
-        format_string = get_video_format_options(video_quality)
+                    on_progress(progress)
         
-        ydl_opts = {
-            'format': format_string,
-            'outtmpl': output_template,
-            'progress_hooks': [progress_hook] if progress_callback else [],
-            'http_headers': {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-            },
-            'extractor_args': {
-                'youtube': {
-                    'skip': ['dash', 'hls'],
-                    'player_client': ['android', 'web']
-                }
-            },
-            'socket_timeout': 60,
-            'retries': 3,
-            'fragment_retries': 5,
-            'sleep_interval': 1,
-            'max_sleep_interval': 5,
-        }
+        filename, output_template = self._output_template(task)
+        ydl_opts = self._download_opts(DownloadType.VIDEO, progress_hook, output)
+        ydl_opts['outtmpl'] = output_template
         
-        try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([task.video_info.url])
-        except Exception as e:
-            # If specific format fails, try with video+audio merge approach
-            if "Requested format is not available" in str(e) or "format" in str(e).lower():
-                ydl_opts['format'] = 'bestvideo+bestaudio/best'
-                try:
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        ydl.download([task.video_info.url])
-                except Exception as e2:
-                    # If that fails too, let yt-dlp auto-select without format restrictions
-                    del ydl_opts['format']
-                    try:
-                        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                            ydl.download([task.video_info.url])
-                    except Exception as e3:
-                        raise e3
-            else:
-                raise e
-        
-        # Find the downloaded file
-        expected_path = os.path.join(task.output_path, filename)
-        if os.path.exists(expected_path):
-            return expected_path
-        
-        # If exact path doesn't exist, find the actual downloaded file
-        for file in os.listdir(task.output_path):
-            if file.startswith(filename_without_ext):
-                return os.path.join(task.output_path, file)
-        
-        raise RuntimeError("Downloaded file not found")
+        await self._run_io(self._run_video, ydl_opts, task.video_info.url, info)
+        return self._resolve_output(task, filename, output.get('path'))
     
     async def download_audio(
         self, 
         task: DownloadTask, 
-        progress_callback: Optional[Callable[[float], None]] = None
+        progress_callback: Optional[Callable[[float], None]] = None,
+        info: Optional[Dict[str, Any]] = None
     ) -> str:
-        """Download and convert to audio file using yt-dlp."""
+        """Download and convert to audio file using yt-dlp.
+        
+        ``info`` has the same meaning as in :meth:`download_video`.
+        """
+        
+        output: Dict[str, str] = {}
+        on_progress = _on_loop(progress_callback) if progress_callback else None
         
         def progress_hook(d):
-            if progress_callback:
+            self._record_output(output, d)
+            if on_progress:
                 if d['status'] == 'downloading':
                     if 'total_bytes' in d and d['total_bytes']:
                         progress = (d['downloaded_bytes'] / d['total_bytes']) * 50  # 50% for download
-                        progress_callback(progress)
+                        on_progress(progress)
                     elif 'total_bytes_estimate' in d and d['total_bytes_estimate']:
                         progress = (d['downloaded_bytes'] / d['total_bytes_estimate']) * 50
-                        progress_callback(progress)
+                        on_progress(progress)
                 elif d['status'] == 'finished':
-                    progress_callback(75)  # 75% after download, before conversion
+                    on_progress(75)  # 75% after download, before conversion
         
-        filename = self._file_repository.format_audio_filename(
-            task.video_info.title, 
-            task.video_info.uploader
-        )
-        filename_without_ext = filename.rsplit('.', 1)[0]  # Remove extension for template
-        output_template = os.path.join(task.output_path, f"{filename_without_ext}.%(ext)s")
+        filename, output_template = self._output_template(task)
+        ydl_opts = self._download_opts(DownloadType.AUDIO, progress_hook, output)
+        ydl_opts['outtmpl'] = output_template
         
-        audio_quality = self._quality_manager.get_audio_quality()
-        audio_format = self._quality_manager.get_audio_format()
-        audio_postprocessor = get_audio_format_options(audio_quality, audio_format)
+        await self._run_io(self._run, ydl_opts, task.video_info.url, info)
         
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'outtmpl': output_template,
-            'progress_hooks': [progress_hook] if progress_callback else [],
-            'postprocessors': [audio_postprocessor],
-            'http_headers': {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-            },
-            'extractor_args': {
-                'youtube': {
-                    'skip': ['dash', 'hls'],
-                    'player_client': ['android', 'web']
-                }
-            },
-            'socket_timeout': 60,
-            'retries': 3,
-            'fragment_retries': 5,
-            'sleep_interval': 1,
-            'max_sleep_interval': 5,
-        }
+        if progress_callback:
+            progress_callback(100)  # 100% after conversion
+        
+        return self._resolve_output(task, filename, output.get('path'))
+    
+    async def download_many(
+        self,
+        tasks: List[DownloadTask],
+        on_complete: Optional[Callable[[int, Union[str, Exception]], None]] = None
+    ) -> List[Union[str, Exception]]:
+        """Download several tasks through one YoutubeDL instance per type.
+        
+        Tasks run one after another on a single worker thread, so yt-dlp's
+        setup and HTTP session are shared between them. Each result is the
+        file path or the exception that task raised; ``on_complete`` is
+        called on the event loop with the task index and result as each
+        task finishes.
+        """
+        loop = asyncio.get_running_loop()
+        results: List[Union[str, Exception]] = [None] * len(tasks)
+        
+        def report(index: int, result: Union[str, Exception]):
+            results[index] = result
+            if on_complete:
+                loop.call_soon_threadsafe(on_complete, index, result)
         
+        by_type: Dict[DownloadType, List[int]] = {}
+        for index, task in enumerate(tasks):
+            by_type.setdefault(task.download_type, []).append(index)
+        for download_type, indices in by_type.items():
+            jobs = [(index, tasks[index]) for index in indices]
+            await self._run_io(self._download_batch, download_type, jobs, report)
+        return results
+    
+    def _download_batch(
+        self,
+        download_type: DownloadType,
+        jobs: List[Tuple[int, DownloadTask]],
+        report: Callable[[int, Union[str, Exception]], None]
+    ):
+        """Download jobs of one type with a shared YoutubeDL (worker thread)."""
+        output: Dict[str, str] = {}
+        ydl_opts = self._download_opts(
+            download_type, partial(self._record_output, output), output
+        )
+        import yt_dlp
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([task.video_info.url])
+            for index, task in jobs:
+                filename, output_template = self._output_template(task)
+                output.clear()
+                # Templates are read per download, so one instance can
+                # write each task under its own name
+                ydl.params['outtmpl']['default'] = output_template
+                try:
+                    try:
+                        ydl.download([task.video_info.url])
+                    except Exception as e:
+                        if download_type == DownloadType.AUDIO or "format" not in str(e).lower():
+                            raise
+                        # The format selector is fixed per instance
+                        self._run_relaxed({**ydl_opts, 'outtmpl': output_template}, task.video_info.url)
+                    result = self._resolve_output(task, filename, output.get('path'))
+                except Exception as e:
+                    result = e
+                report(index, result)
+    
+    def _output_template(self, task: DownloadTask) -> Tuple[str, str]:
+        """Return the expected filename and yt-dlp output template for a task."""
+        if task.download_type == DownloadType.AUDIO:
+            filename = self._file_repository.format_audio_filename(
+                task.video_info.title, 
+                task.video_info.uploader
+            )
+        else:
+            filename = self._file_repository.format_video_filename(
+                task.video_info.title, 
+                task.video_info.uploader
+            )
+        filename_without_ext = filename.rsplit('.', 1)[0]  # Remove extension for template
+        return filename, _join(task.output_path, f"{filename_without_ext}.%(ext)s")
+    
+    def _download_opts(
+        self,
+        download_type: DownloadType,
+        progress_hook: Callable[[Dict[str, Any]], None],
+        output: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Build yt-dlp download options; ``outtmpl`` is set per task."""
+        ydl_opts = {
+            **_DOWNLOAD_OPTS,
+            'progress_hooks': [progress_hook],
+            'postprocessor_hooks': [partial(self._record_output, output)],
+        }
+        if download_type == DownloadType.AUDIO:
+            audio_quality = self._quality_manager.get_audio_quality()
+            audio_format = self._quality_manager.get_audio_format()
+            ydl_opts['format'] = 'bestaudio/best'
+            ydl_opts['postprocessors'] = [get_audio_format_options(audio_quality, audio_format)]
+        else:
+            video_quality = self._quality_manager.get_video_quality()
+            ydl_opts['format'] = get_video_format_options(video_quality)
+        return ydl_opts
+    
+    def _run_video(self, ydl_opts: Dict[str, Any], url: str, info: Optional[Dict[str, Any]] = None):
+        """Run a video download, relaxing the format if it is unavailable."""
+        try:
+            self._run(ydl_opts, url, info)
+        except Exception as e:
+            # If specific format fails, try with video+audio merge approach
+            if "Requested format is not available" in str(e) or "format" in str(e).lower():
+                self._run_relaxed(ydl_opts, url, info)
+            else:
+                raise e
+    
+    def _run_relaxed(self, ydl_opts: Dict[str, Any], url: str, info: Optional[Dict[str, Any]] = None):
+        """Retry a video download with progressively looser format selection."""
+        try:
+            self._run({**ydl_opts, 'format': 'bestvideo+bestaudio/best'}, url, info)
+        except Exception:
+            # If that fails too, let yt-dlp auto-select without format restrictions
+            ydl_opts = dict(ydl_opts)
+            del ydl_opts['format']
+            self._run(ydl_opts, url, info)
+    
+    def _resolve_output(self, task: DownloadTask, filename: str, recorded: Optional[str]) -> str:
+        """Locate the file a finished download produced."""
+        filename_without_ext = filename.rsplit('.', 1)[0]
+        if task.download_type == DownloadType.AUDIO:
+            audio_format = self._quality_manager.get_audio_format()
+            suffix = f".{audio_format}"
+            not_found = "Downloaded audio file not found"
+        else:
+            suffix = ""
+            not_found = "Downloaded file not found"
         
-        if progress_callback:
-            progress_callback(100)  # 100% after conversion
+        # Prefer the path yt-dlp reported for the finished file
+        if recorded and recorded.endswith(suffix) and os.path.exists(recorded):
+            return recorded
         
-        # Find the downloaded audio file
-        audio_format = self._quality_manager.get_audio_format()
-        expected_path = os.path.join(task.output_path, filename)
+        expected_path = _join(task.output_path, filename)
         if os.path.exists(expected_path):
             return expected_path
         
         # If exact path doesn't exist, find the actual downloaded file
-        for file in os.listdir(task.output_path):
-            if file.startswith(filename_without_ext) and file.endswith(f".{audio_format}"):
-                return os.path.join(task.output_path, file)
+        path = self._find_output(task.output_path, filename_without_ext, suffix)
+        if path is not None:
+            return path
         
-        raise RuntimeError("Downloaded audio file not found")
+        raise RuntimeError(not_found)
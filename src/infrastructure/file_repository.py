@@ -5,21 +5,29 @@ File repository implementation for file system operations.
 import os
 from pathlib import Path
 from ..repositories.interfaces import IFileRepository
+from ..config.constants import MAX_FILENAME_LENGTH
 from ..utils.file_formatter import FileNameFormatter
 
 
 class FileSystemRepository(IFileRepository):
-    """Implementation of file repository for file system operations."""
+    """Implementation of file repository for file system operations.
+    
+    ``fs`` provides the ``exists``/``getsize`` lookups and defaults to
+    ``os.path``.
+    """
+    
+    def __init__(self, fs=os.path):
+        self._fs = fs
     
     def file_exists(self, file_path: str) -> bool:
         """Check if file exists."""
-        return os.path.exists(file_path)
+        return self._fs.exists(file_path)
     
     def get_file_size(self, file_path: str) -> int:
         """Get file size in bytes."""
         if not self.file_exists(file_path):
             return 0
-        return os.path.getsize(file_path)
+        return self._fs.getsize(file_path)
     
     def create_directory(self, directory_path: str) -> bool:
         """Create directory if it doesn't exist."""
@@ -31,7 +39,8 @@ class FileSystemRepository(IFileRepository):
     
     def sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for filesystem compatibility."""
-        return FileNameFormatter._sanitize_filename(filename)
+        sanitized = FileNameFormatter._sanitize_filename(filename, "unknown_file")
+        return sanitized[:MAX_FILENAME_LENGTH].rstrip('. ')
     
     def format_video_filename(self, title: str, uploader: str = None) -> str:
         """Format video filename with [Channel] Title pattern."""
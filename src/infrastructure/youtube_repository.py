@@ -2,94 +2,321 @@
 YouTube video repository implementation using yt-dlp.
 """
 
-import yt_dlp
-from typing import List, Dict, Any
+import asyncio
+import re
+import threading
+import time
+from concurrent.futures import Executor
+from typing import AsyncIterator, Iterator, List, Dict, Any, Optional, Tuple
 from ..repositories.interfaces import IVideoRepository
 from ..domain.entities import VideoInfo, PlaylistInfo, ChannelInfo
 from ..domain.value_objects import YouTubeURL
-from ..config.constants import ERROR_VIDEO_NOT_FOUND, ERROR_PLAYLIST_NOT_FOUND
+from ..config.constants import (
+    ERROR_VIDEO_NOT_FOUND, ERROR_PLAYLIST_NOT_FOUND, MAX_CONCURRENT_EXTRACTIONS,
+    METADATA_SOCKET_TIMEOUT, SESSION_INFO_CACHE_TTL, SESSION_INFO_CACHE_SIZE
+)
+
+# yt_dlp is imported where it is used: the import takes hundreds of
+# milliseconds and many commands never reach yt-dlp
+
+# Channel root URLs (no tab selected), which yt-dlp resolves to a page
+# without entries
+_CHANNEL_ROOT_RE = re.compile(
+    r'^(https?://(?:www\.|m\.)?youtube\.com/(?:@|channel/|c/|user/)[^/?#]+)/?(?:[?#].*)?$'
+)
+
+
+def _entry_url(info: Dict[str, Any]) -> str:
+    """The page URL of an info dict or flat entry."""
+    return info.get('webpage_url') or info.get('url', '')
+
+
+def _channel_videos_url(url: str) -> str:
+    """Point a channel root URL at its videos tab; other URLs are unchanged."""
+    match = _CHANNEL_ROOT_RE.match(url)
+    return f"{match.group(1)}/videos" if match else url
+
+
+class _SessionCache:
+    """Bounded cache whose entries expire after ``ttl`` seconds.
+    
+    When full, the oldest entry is evicted. Safe to use from several
+    threads.
+    """
+    
+    def __init__(self, ttl: float, size: int):
+        self._ttl = ttl
+        self._size = size
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key) -> Any:
+        """Return the live value for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+    
+    def put(self, key, value):
+        """Store value for key, evicting the oldest entry when full."""
+        with self._lock:
+            if len(self._entries) >= self._size and key not in self._entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + self._ttl, value)
 
 
 class YouTubeVideoRepository(IVideoRepository):
     """Implementation of video repository using yt-dlp."""
     
-    def __init__(self):
+    def __init__(self, executor: Optional[Executor] = None):
+        # Blocking yt-dlp calls run here (None: the loop's default executor)
+        self._executor = executor
         self._ydl_opts = {
             'quiet': True,
             'no_warnings': True,
             'extract_flat': False,
+            'socket_timeout': METADATA_SOCKET_TIMEOUT,
+        }
+        # Metadata only: no signature decoding, DASH/HLS manifests or
+        # translated subtitles, none of which VideoInfo uses
+        fast_opts = {
+            **self._ydl_opts,
+            'youtube_include_dash_manifest': False,
+            'ignore_no_formats_error': True,
+            'extractor_args': {
+                'youtube': {
+                    'skip': ['dash', 'hls', 'translated_subs'],
+                    'player_skip': ['js'],
+                },
+            },
+        }
+        flat_opts = {
+            **self._ydl_opts,
+            'extract_flat': True,  # Only extract metadata, don't download
+        }
+        # Option sets by profile name; see _ydl
+        self._profiles: Dict[str, Dict[str, Any]] = {
+            'video': fast_opts,
+            'video_full': self._ydl_opts,
+            'flat': flat_opts,
+            'channel': {
+                **flat_opts,
+                'playlistend': 50,  # Limit to first 50 videos for performance
+                'ignoreerrors': True,  # Continue on errors
+            },
+            'channel_stream': {**flat_opts, 'ignoreerrors': True},
         }
+        # One YoutubeDL per profile and worker thread, kept between calls
+        self._sessions = threading.local()
+        # Recent extraction results, by (URL, profile); filled from the IO pool's threads
+        self._info_cache = _SessionCache(SESSION_INFO_CACHE_TTL, SESSION_INFO_CACHE_SIZE)
+        # Recent channel listings, by URL, so new uploads show up once they expire
+        self._channel_cache = _SessionCache(SESSION_INFO_CACHE_TTL, SESSION_INFO_CACHE_SIZE)
     
-    async def get_video_info(self, url: YouTubeURL) -> VideoInfo:
+    async def get_video_info(self, url: YouTubeURL, fast: bool = True) -> VideoInfo:
         """Get video information from YouTube URL."""
         try:
-            with yt_dlp.YoutubeDL(self._ydl_opts) as ydl:
-                info = ydl.extract_info(url.url, download=False)
-                
-                if not info:
-                    raise RuntimeError(ERROR_VIDEO_NOT_FOUND)
-                
-                return self._map_to_video_info(info)
-                
+            info = await self._run_io(self._extract, 'video' if fast else 'video_full', url.url)
+            
+            if not info:
+                raise RuntimeError(ERROR_VIDEO_NOT_FOUND)
+            
+            return self._map_to_video_info(info)
+            
         except Exception as e:
             raise RuntimeError(f"{ERROR_VIDEO_NOT_FOUND}: {str(e)}")
     
     async def get_playlist_info(self, url: YouTubeURL) -> PlaylistInfo:
         """Get playlist information from YouTube URL."""
         try:
-            ydl_opts = {
-                **self._ydl_opts,
-                'extract_flat': True,  # Only extract metadata, don't download
-            }
+            info = await self._run_io(self._extract, 'flat', url.url)
+            
+            if not info or 'entries' not in info:
+                raise RuntimeError(ERROR_PLAYLIST_NOT_FOUND)
+            
+            # Copy first: info may be the dict held in the session cache
+            info = {**info, 'entries': await self._hydrate_entries(info['entries'])}
+            return self._map_to_playlist_info(info, url.url)
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url.url, download=False)
-                
-                if not info or 'entries' not in info:
-                    raise RuntimeError(ERROR_PLAYLIST_NOT_FOUND)
-                
-                return self._map_to_playlist_info(info, url.url)
-                
         except Exception as e:
             raise RuntimeError(f"{ERROR_PLAYLIST_NOT_FOUND}: {str(e)}")
     
+    async def _hydrate_entries(self, entries: List[Optional[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Fully extract flat entries that came back without a title.
+        
+        Lookups run concurrently, at most MAX_CONCURRENT_EXTRACTIONS at a
+        time; an entry whose lookup fails is kept as it was.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTIONS)
+        
+        async def hydrate(entry: Dict[str, Any]) -> Dict[str, Any]:
+            entry_url = _entry_url(entry)
+            if entry.get('title') or not entry_url:
+                return entry
+            async with semaphore:
+                try:
+                    info = await self._run_io(self._extract, 'video', entry_url)
+                except Exception:
+                    return entry
+            return info or entry
+        
+        return await asyncio.gather(*(hydrate(entry) for entry in entries if entry))
+    
     async def get_channel_info(self, url: YouTubeURL) -> ChannelInfo:
         """Get channel information from YouTube URL."""
+        cached = self._channel_cache.get(url.url)
+        if cached is not None:
+            return cached
+        
         try:
-            ydl_opts = {
-                **self._ydl_opts,
-                'extract_flat': True,  # Only extract metadata, don't download
-                'playlistend': 50,  # Limit to first 50 videos for performance
-                'ignoreerrors': True,  # Continue on errors
-            }
+            info = await self._run_io(self._extract_channel, 'channel', url.url)
+            
+            if not info or 'entries' not in info:
+                raise RuntimeError("Channel not found or has no videos")
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url.url, download=False)
-                
-                if not info:
-                    raise RuntimeError("Channel not found")
-                
-                # Handle both channel pages and video listings
-                if 'entries' not in info:
-                    # This might be a channel page, try to get the videos tab
-                    channel_id = info.get('channel_id') or info.get('id')
-                    if channel_id:
-                        videos_url = f"https://www.youtube.com/channel/{channel_id}/videos"
-                        info = ydl.extract_info(videos_url, download=False)
-                
-                if not info or 'entries' not in info:
-                    raise RuntimeError("Channel not found or has no videos")
-                
-                return self._map_to_channel_info(info, url.url)
-                
+            channel_info = self._map_to_channel_info(info, url.url)
+            self._channel_cache.put(url.url, channel_info)
+            return channel_info
+            
+        except Exception as e:
+            raise RuntimeError(f"Error fetching channel info: {str(e)}")
+    
+    async def stream_channel_info(
+        self, url: YouTubeURL, limit: int = 50
+    ) -> Tuple[ChannelInfo, AsyncIterator[VideoInfo]]:
+        """Get channel information with its videos yielded as they are resolved.
+        
+        The returned ChannelInfo has an empty video list; up to ``limit``
+        videos come from the iterator, each as soon as yt-dlp produces it.
+        """
+        entries = self._channel_entries(self._profiles['channel_stream'], url.url)
+        try:
+            info = await self._run_io(next, entries)
         except Exception as e:
+            entries.close()
             raise RuntimeError(f"Error fetching channel info: {str(e)}")
+        
+        channel_info = ChannelInfo(
+            title=info.get('title', 'Unknown Channel'),
+            url=url.url,
+            videos=[],
+            uploader=info.get('uploader'),
+            subscriber_count=info.get('subscriber_count')
+        )
+        return channel_info, self._iter_videos(entries, limit)
+    
+    async def _iter_videos(self, entries: Iterator[Dict[str, Any]], limit: int) -> AsyncIterator[VideoInfo]:
+        """Resolve channel entries one at a time off the event loop."""
+        done = object()
+        count = 0
+        try:
+            while count < limit:
+                try:
+                    entry = await self._run_io(next, entries, done)
+                except Exception as e:
+                    raise RuntimeError(f"Error fetching channel info: {str(e)}")
+                if entry is done:
+                    return
+                if entry:  # Skip None entries
+                    count += 1
+                    yield self._map_to_channel_video(entry)
+        finally:
+            entries.close()
+    
+    @staticmethod
+    def _channel_entries(ydl_opts: Dict[str, Any], url: str) -> Iterator[Dict[str, Any]]:
+        """Yield a channel's top-level info, then its flat entries lazily.
+        
+        Extraction runs with process=False so YouTube's paged listings are
+        only fetched as entries are consumed. The listing keeps using its
+        YoutubeDL from whichever worker thread resumes it, so it gets its
+        own instance rather than a shared one.
+        """
+        import yt_dlp
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = YouTubeVideoRepository._extract_listing(ydl, url, process=False)
+            
+            if not info or 'entries' not in info:
+                raise RuntimeError("Channel not found or has no videos")
+            
+            yield info
+            yield from info['entries']
+    
+    async def _run_io(self, fn, *args):
+        """Run a blocking yt-dlp call off the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+    
+    def _ydl(self, profile: str):
+        """Return this thread's YoutubeDL for an option profile.
+        
+        Instances are reused across calls so extractor state (player code,
+        cookies, open connections) is set up once rather than per request.
+        YoutubeDL is not thread-safe, hence one per worker thread.
+        """
+        ydl = getattr(self._sessions, profile, None)
+        if ydl is None:
+            import yt_dlp
+            ydl = yt_dlp.YoutubeDL(self._profiles[profile])
+            setattr(self._sessions, profile, ydl)
+        return ydl
+    
+    def _extract(self, profile: str, url: str) -> Optional[Dict[str, Any]]:
+        """Extract metadata for a URL without downloading.
+        
+        Results are reused for SESSION_INFO_CACHE_TTL seconds, so looking
+        the same URL up again in one session skips the network.
+        """
+        key = (url, profile)
+        info = self._info_cache.get(key)
+        if info is not None:
+            return info
+        
+        info = self._ydl(profile).extract_info(url, download=False)
+        if info:
+            self._info_cache.put(key, info)
+        return info
+    
+    def _extract_channel(self, profile: str, url: str) -> Optional[Dict[str, Any]]:
+        """Extract a channel listing, following a channel page to its videos tab."""
+        return self._extract_listing(self._ydl(profile), url)
+    
+    @staticmethod
+    def _extract_listing(ydl, url: str, process: bool = True) -> Optional[Dict[str, Any]]:
+        """Extract a channel's videos with a single request where possible.
+        
+        Channel root URLs are rewritten to their videos tab up front; the
+        original URL and the channel ID lookup are only tried if that fails.
+        """
+        videos_url = _channel_videos_url(url)
+        if videos_url != url:
+            try:
+                info = ydl.extract_info(videos_url, download=False, process=process)
+            except Exception:
+                info = None
+            if info and 'entries' in info:
+                return info
+        
+        info = ydl.extract_info(url, download=False, process=process)
+        
+        if not info:
+            raise RuntimeError("Channel not found")
+        
+        # Handle both channel pages and video listings
+        if 'entries' not in info:
+            # This might be a channel page, try to get the videos tab
+            channel_id = info.get('channel_id') or info.get('id')
+            if channel_id:
+                videos_url = f"https://www.youtube.com/channel/{channel_id}/videos"
+                info = ydl.extract_info(videos_url, download=False, process=process)
+        
+        return info
     
     def _map_to_video_info(self, info: Dict[str, Any]) -> VideoInfo:
         """Map yt-dlp info to VideoInfo entity."""
         return VideoInfo(
             title=info.get('title', 'Unknown Title'),
-            url=info.get('webpage_url', info.get('url', '')),
+            url=_entry_url(info),
             duration=info.get('duration'),
             thumbnail=info.get('thumbnail'),
             uploader=info.get('uploader'),
@@ -98,17 +325,16 @@ class YouTubeVideoRepository(IVideoRepository):
     
     def _map_to_playlist_info(self, info: Dict[str, Any], url: str) -> PlaylistInfo:
         """Map yt-dlp info to PlaylistInfo entity."""
-        videos = []
-        
-        for entry in info.get('entries', []):
-            if entry:  # Skip None entries
-                video_info = VideoInfo(
-                    title=entry.get('title', 'Unknown Title'),
-                    url=entry.get('webpage_url', entry.get('url', '')),
-                    duration=entry.get('duration'),
-                    uploader=entry.get('uploader')
-                )
-                videos.append(video_info)
+        videos = [
+            VideoInfo(
+                title=entry.get('title', 'Unknown Title'),
+                url=_entry_url(entry),
+                duration=entry.get('duration'),
+                uploader=entry.get('uploader')
+            )
+            for entry in info.get('entries', [])
+            if entry  # Skip None entries
+        ]
         
         return PlaylistInfo(
             title=info.get('title', 'Unknown Playlist'),
@@ -118,23 +344,24 @@ class YouTubeVideoRepository(IVideoRepository):
             video_count=len(videos)
         )
     
+    def _map_to_channel_video(self, entry: Dict[str, Any]) -> VideoInfo:
+        """Map a flat channel entry to VideoInfo entity."""
+        return VideoInfo(
+            title=entry.get('title', 'Unknown Title'),
+            url=_entry_url(entry),
+            duration=entry.get('duration'),
+            uploader=entry.get('uploader'),
+            view_count=entry.get('view_count')
+        )
+    
     def _map_to_channel_info(self, info: Dict[str, Any], url: str) -> ChannelInfo:
         """Map yt-dlp info to ChannelInfo entity."""
-        videos = []
-        
         # Limit to first 50 videos to avoid overwhelming the user
-        entries = info.get('entries', [])[:50]
-        
-        for entry in entries:
-            if entry:  # Skip None entries
-                video_info = VideoInfo(
-                    title=entry.get('title', 'Unknown Title'),
-                    url=entry.get('webpage_url', entry.get('url', '')),
-                    duration=entry.get('duration'),
-                    uploader=entry.get('uploader'),
-                    view_count=entry.get('view_count')
-                )
-                videos.append(video_info)
+        videos = [
+            self._map_to_channel_video(entry)
+            for entry in info.get('entries', [])[:50]
+            if entry  # Skip None entries
+        ]
         
         return ChannelInfo(
             title=info.get('title', 'Unknown Channel'),
@@ -3,8 +3,8 @@ Repository interfaces for the YouTube Archiver application.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Callable
-from ..domain.entities import VideoInfo, PlaylistInfo, ChannelInfo, DownloadTask
+from typing import AsyncIterator, List, Optional, Callable, Tuple, Union
+from ..domain.entities import VideoInfo, PlaylistInfo, ChannelInfo, DownloadTask, DownloadType
 from ..domain.value_objects import YouTubeURL
 
 
@@ -12,8 +12,12 @@ class IVideoRepository(ABC):
     """Interface for video information repository."""
     
     @abstractmethod
-    async def get_video_info(self, url: YouTubeURL) -> VideoInfo:
-        """Get video information from URL."""
+    async def get_video_info(self, url: YouTubeURL, fast: bool = True) -> VideoInfo:
+        """Get video information from URL.
+        
+        With fast, only metadata is fetched; formats and streaming
+        manifests are skipped.
+        """
         pass
     
     @abstractmethod
@@ -25,6 +29,13 @@ class IVideoRepository(ABC):
     async def get_channel_info(self, url: YouTubeURL) -> ChannelInfo:
         """Get channel information from URL."""
         pass
+    
+    @abstractmethod
+    async def stream_channel_info(
+        self, url: YouTubeURL, limit: int
+    ) -> Tuple[ChannelInfo, AsyncIterator[VideoInfo]]:
+        """Get channel information with its videos yielded as they are resolved."""
+        pass
 
 
 class IDownloaderRepository(ABC):
@@ -47,6 +58,26 @@ class IDownloaderRepository(ABC):
     ) -> str:
         """Download and convert to audio file."""
         pass
+    
+    @abstractmethod
+    async def download_many(
+        self,
+        tasks: List[DownloadTask],
+        on_complete: Optional[Callable[[int, Union[str, Exception]], None]] = None
+    ) -> List[Union[str, Exception]]:
+        """Download several tasks in one session; each result is a path or the error raised."""
+        pass
+    
+    @abstractmethod
+    async def download_from_url(
+        self,
+        url: str,
+        download_type: DownloadType,
+        output_path: str,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> str:
+        """Fetch metadata and download in a single session."""
+        pass
 
 
 class IFileRepository(ABC):
@@ -2,11 +2,103 @@
 Use cases for the YouTube Archiver application.
 """
 
-from typing import List, Optional, Callable
+import asyncio
+from functools import partial
+from typing import AsyncIterator, Awaitable, List, Optional, Callable, Tuple
 from ..domain.entities import VideoInfo, PlaylistInfo, ChannelInfo, DownloadTask, DownloadType, DownloadStatus
-from ..domain.value_objects import YouTubeURL
+from ..domain.value_objects import make_youtube_url
 from ..repositories.interfaces import IVideoRepository, IDownloaderRepository, IFileRepository
-from ..config.constants import ERROR_INVALID_URL, ERROR_DOWNLOAD_FAILED, SUCCESS_DOWNLOAD_COMPLETE
+from ..config.constants import (
+    ERROR_INVALID_URL, ERROR_DOWNLOAD_FAILED, SUCCESS_DOWNLOAD_COMPLETE,
+    MAX_CONCURRENT_DOWNLOADS, RATE_LIMIT_RETRIES, RATE_LIMIT_BACKOFF
+)
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Check whether an error is an HTTP 429 rate-limit response."""
+    message = str(error)
+    return '429' in message or 'Too Many Requests' in message
+
+
+async def _with_backoff(call: Callable[[], Awaitable[str]], attempt: int = 0) -> str:
+    """Await call(), retrying with exponential backoff when rate limited.
+    
+    ``attempt`` is the number of rate-limited attempts already made, so a
+    retry of a failed batch item waits before its first call.
+    """
+    while True:
+        if attempt:
+            await asyncio.sleep(RATE_LIMIT_BACKOFF * 2 ** (attempt - 1))
+        try:
+            return await call()
+        except Exception as e:
+            if attempt == RATE_LIMIT_RETRIES or not _is_rate_limited(e):
+                raise
+            attempt += 1
+
+
+async def _download_videos(
+    downloader_repository: IDownloaderRepository,
+    videos: List[VideoInfo],
+    download_type: DownloadType,
+    output_path: str,
+    progress_callback: Optional[Callable[[int, int, str], None]],
+    max_concurrent: int
+) -> List[str]:
+    """Download videos concurrently, at most max_concurrent at a time.
+    
+    The videos are dealt round-robin into max_concurrent batches, each
+    downloaded in one session. Rate-limited videos are retried on their
+    own; other failures are reported and skipped. The returned paths keep
+    the order of the input list.
+    """
+    if download_type == DownloadType.AUDIO:
+        download = downloader_repository.download_audio
+    else:
+        download = downloader_repository.download_video
+    
+    tasks = [
+        DownloadTask(video_info=video_info, download_type=download_type, output_path=output_path)
+        for video_info in videos
+    ]
+    total_videos = len(tasks)
+    workers = max(min(max_concurrent, total_videos), 1)
+    results: List[Optional[str]] = [None] * total_videos
+    retries = []
+    completed = 0
+    
+    def finish(index: int, result):
+        nonlocal completed
+        if isinstance(result, Exception):
+            # Log error but continue with other videos
+            print(f"Failed to download {tasks[index].video_info.title}: {str(result)}")
+        else:
+            results[index] = result
+        
+        completed += 1
+        if progress_callback:
+            progress_callback(completed, total_videos, tasks[index].video_info.title)
+    
+    async def retry(index: int):
+        try:
+            result = await _with_backoff(lambda: download(tasks[index]), attempt=1)
+        except Exception as e:
+            result = e
+        finish(index, result)
+    
+    def batch_done(offset: int, index: int, result):
+        index = offset + index * workers
+        if isinstance(result, Exception) and _is_rate_limited(result):
+            retries.append(asyncio.ensure_future(retry(index)))
+        else:
+            finish(index, result)
+    
+    await asyncio.gather(*(
+        downloader_repository.download_many(tasks[offset::workers], partial(batch_done, offset))
+        for offset in range(workers)
+    ))
+    await asyncio.gather(*retries)
+    return [file_path for file_path in results if file_path is not None]
 
 
 class GetVideoInfoUseCase:
@@ -15,14 +107,18 @@ class GetVideoInfoUseCase:
     def __init__(self, video_repository: IVideoRepository):
         self._video_repository = video_repository
     
-    async def execute(self, url: str) -> VideoInfo:
-        """Execute the use case to get video information."""
+    async def execute(self, url: str, fast: bool = True) -> VideoInfo:
+        """Execute the use case to get video information.
+        
+        With fast (the default) only metadata is fetched, skipping the
+        format and signature work a download needs.
+        """
         try:
-            youtube_url = YouTubeURL(url)
+            youtube_url = make_youtube_url(url)
             
             # Check if this is a playlist URL being used with video command
             if youtube_url.is_playlist():
-                suggestion = "playlist" if "playlist" in url or "list=" in url else "playlist"
+                suggestion = "playlist"
                 if youtube_url.is_music_youtube():
                     raise ValueError(
                         f"This appears to be a playlist/album URL from YouTube Music. "
@@ -37,8 +133,8 @@ class GetVideoInfoUseCase:
                     )
             
             # Use normalized URL for better compatibility
-            normalized_url = YouTubeURL(youtube_url.normalize_url())
-            return await self._video_repository.get_video_info(normalized_url)
+            normalized_url = youtube_url.normalized()
+            return await self._video_repository.get_video_info(normalized_url, fast=fast)
         except ValueError as e:
             raise ValueError(f"{ERROR_INVALID_URL}: {str(e)}")
 
@@ -52,9 +148,9 @@ class GetPlaylistInfoUseCase:
     async def execute(self, url: str) -> PlaylistInfo:
         """Execute the use case to get playlist information."""
         try:
-            youtube_url = YouTubeURL(url)
+            youtube_url = make_youtube_url(url)
             # Use normalized URL for better compatibility
-            normalized_url = YouTubeURL(youtube_url.normalize_url())
+            normalized_url = youtube_url.normalized()
             return await self._video_repository.get_playlist_info(normalized_url)
         except ValueError as e:
             raise ValueError(f"{ERROR_INVALID_URL}: {str(e)}")
@@ -69,12 +165,21 @@ class GetChannelInfoUseCase:
     async def execute(self, url: str) -> ChannelInfo:
         """Execute the use case to get channel information."""
         try:
-            youtube_url = YouTubeURL(url)
+            youtube_url = make_youtube_url(url)
             # Use normalized URL for better compatibility
-            normalized_url = YouTubeURL(youtube_url.normalize_url())
+            normalized_url = youtube_url.normalized()
             return await self._video_repository.get_channel_info(normalized_url)
         except ValueError as e:
             raise ValueError(f"{ERROR_INVALID_URL}: {str(e)}")
+    
+    async def stream(self, url: str, limit: int = 50) -> Tuple[ChannelInfo, AsyncIterator[VideoInfo]]:
+        """Get channel information with up to limit videos streamed lazily."""
+        try:
+            youtube_url = make_youtube_url(url)
+            normalized_url = youtube_url.normalized()
+        except ValueError as e:
+            raise ValueError(f"{ERROR_INVALID_URL}: {str(e)}")
+        return await self._video_repository.stream_channel_info(normalized_url, limit)
 
 
 class DownloadVideoUseCase:
@@ -113,6 +218,22 @@ class DownloadVideoUseCase:
             return file_path
         except Exception as e:
             raise RuntimeError(f"{ERROR_DOWNLOAD_FAILED}: {str(e)}")
+    
+    async def execute_url(
+        self,
+        url: str,
+        output_path: str,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> str:
+        """Download video straight from a URL, fetching metadata in the same session."""
+        try:
+            normalized_url = make_youtube_url(url).normalize_url()
+            self._file_repository.create_directory(output_path)
+            return await self._downloader_repository.download_from_url(
+                normalized_url, DownloadType.VIDEO, output_path, progress_callback
+            )
+        except Exception as e:
+            raise RuntimeError(f"{ERROR_DOWNLOAD_FAILED}: {str(e)}")
 
 
 class DownloadAudioUseCase:
@@ -151,6 +272,22 @@ class DownloadAudioUseCase:
             return file_path
         except Exception as e:
             raise RuntimeError(f"{ERROR_DOWNLOAD_FAILED}: {str(e)}")
+    
+    async def execute_url(
+        self,
+        url: str,
+        output_path: str,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> str:
+        """Download audio straight from a URL, fetching metadata in the same session."""
+        try:
+            normalized_url = make_youtube_url(url).normalize_url()
+            self._file_repository.create_directory(output_path)
+            return await self._downloader_repository.download_from_url(
+                normalized_url, DownloadType.AUDIO, output_path, progress_callback
+            )
+        except Exception as e:
+            raise RuntimeError(f"{ERROR_DOWNLOAD_FAILED}: {str(e)}")
 
 
 class DownloadPlaylistUseCase:
@@ -160,11 +297,13 @@ class DownloadPlaylistUseCase:
         self,
         video_repository: IVideoRepository,
         downloader_repository: IDownloaderRepository,
-        file_repository: IFileRepository
+        file_repository: IFileRepository,
+        max_concurrent: int = MAX_CONCURRENT_DOWNLOADS
     ):
         self._video_repository = video_repository
         self._downloader_repository = downloader_repository
         self._file_repository = file_repository
+        self._max_concurrent = max_concurrent
     
     async def execute(
         self,
@@ -175,36 +314,13 @@ class DownloadPlaylistUseCase:
     ) -> List[str]:
         """Execute the use case to download entire playlist."""
         try:
-            youtube_url = YouTubeURL(playlist_url)
+            youtube_url = make_youtube_url(playlist_url)
             playlist_info = await self._video_repository.get_playlist_info(youtube_url)
             
-            downloaded_files = []
-            total_videos = len(playlist_info.videos)
-            
-            for index, video_info in enumerate(playlist_info.videos):
-                try:
-                    if progress_callback:
-                        progress_callback(index + 1, total_videos, video_info.title)
-                    
-                    task = DownloadTask(
-                        video_info=video_info,
-                        download_type=download_type,
-                        output_path=output_path
-                    )
-                    
-                    if download_type == DownloadType.AUDIO:
-                        file_path = await self._downloader_repository.download_audio(task)
-                    else:
-                        file_path = await self._downloader_repository.download_video(task)
-                    
-                    downloaded_files.append(file_path)
-                    
-                except Exception as e:
-                    # Log error but continue with next video
-                    print(f"Failed to download {video_info.title}: {str(e)}")
-                    continue
-            
-            return downloaded_files
+            return await _download_videos(
+                self._downloader_repository, playlist_info.videos, download_type,
+                output_path, progress_callback, self._max_concurrent
+            )
             
         except ValueError as e:
             raise ValueError(f"{ERROR_INVALID_URL}: {str(e)}")
@@ -219,11 +335,13 @@ class DownloadChannelUseCase:
         self,
         video_repository: IVideoRepository,
         downloader_repository: IDownloaderRepository,
-        file_repository: IFileRepository
+        file_repository: IFileRepository,
+        max_concurrent: int = MAX_CONCURRENT_DOWNLOADS
     ):
         self._video_repository = video_repository
         self._downloader_repository = downloader_repository
         self._file_repository = file_repository
+        self._max_concurrent = max_concurrent
     
     async def execute(
         self,
@@ -235,44 +353,22 @@ class DownloadChannelUseCase:
     ) -> List[str]:
         """Execute the use case to download channel videos."""
         try:
-            youtube_url = YouTubeURL(channel_url)
+            youtube_url = make_youtube_url(channel_url)
             channel_info = await self._video_repository.get_channel_info(youtube_url)
             
-            # Filter videos by selected indices if provided
+            # Filter videos by selected indices if provided, touching only
+            # the selected entries (kept in channel order)
             videos_to_download = channel_info.videos
             if selected_indices:
                 videos_to_download = [
-                    video for i, video in enumerate(channel_info.videos)
-                    if i in selected_indices
+                    videos_to_download[i] for i in sorted(set(selected_indices))
+                    if 0 <= i < len(videos_to_download)
                 ]
             
-            downloaded_files = []
-            total_videos = len(videos_to_download)
-            
-            for index, video_info in enumerate(videos_to_download):
-                try:
-                    if progress_callback:
-                        progress_callback(index + 1, total_videos, video_info.title)
-                    
-                    task = DownloadTask(
-                        video_info=video_info,
-                        download_type=download_type,
-                        output_path=output_path
-                    )
-                    
-                    if download_type == DownloadType.AUDIO:
-                        file_path = await self._downloader_repository.download_audio(task)
-                    else:
-                        file_path = await self._downloader_repository.download_video(task)
-                    
-                    downloaded_files.append(file_path)
-                    
-                except Exception as e:
-                    # Log error but continue with next video
-                    print(f"Failed to download {video_info.title}: {str(e)}")
-                    continue
-            
-            return downloaded_files
+            return await _download_videos(
+                self._downloader_repository, videos_to_download, download_type,
+                output_path, progress_callback, self._max_concurrent
+            )
             
         except ValueError as e:
             raise ValueError(f"{ERROR_INVALID_URL}: {str(e)}")
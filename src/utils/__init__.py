@@ -2,6 +2,11 @@
 Utilities package initialization.
 """
 
-from .quality_manager import QualityManager, DownloadResume, get_video_format_options, get_audio_format_options
+from .quality_manager import (
+    QualityManager, DownloadResume, get_quality_manager, get_video_format_options, get_audio_format_options
+)
 
-__all__ = ['QualityManager', 'DownloadResume', 'get_video_format_options', 'get_audio_format_options']
+__all__ = [
+    'QualityManager', 'DownloadResume', 'get_quality_manager',
+    'get_video_format_options', 'get_audio_format_options'
+]
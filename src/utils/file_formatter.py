@@ -2,11 +2,15 @@
 Utilities for file naming and formatting.
 """
 
-import re
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Characters that are invalid in file names on some platforms, plus ASCII
+# control characters, all mapped to "_"
+_INVALID_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*' + ''.join(map(chr, range(32))), '_'))
+
 
 class FileNameFormatter:
     """Handles file naming conventions and formatting."""
@@ -46,29 +50,33 @@ class FileNameFormatter:
         return f"{filename}{extension}"
     
     @staticmethod
-    def _sanitize_filename(filename: str) -> str:
+    @lru_cache(maxsize=256)
+    def _sanitize_filename(filename: str, fallback: str = "untitled") -> str:
         """
         Sanitize filename for filesystem compatibility.
         
+        Results are cached, since the same uploader is sanitized once per
+        video when formatting a playlist or channel.
+        
         Args:
             filename: Original filename
+            fallback: Name to use when nothing is left after sanitizing
             
         Returns:
             Sanitized filename
         """
-        # Remove or replace invalid characters
-        invalid_chars = r'[<>:"/\\|?*\x00-\x1f]'
-        filename = re.sub(invalid_chars, '_', filename)
+        # Replace invalid characters (single C-level pass)
+        filename = filename.translate(_INVALID_CHARS)
         
-        # Remove multiple spaces and trim
-        filename = re.sub(r'\s+', ' ', filename).strip()
+        # Collapse runs of whitespace and trim
+        filename = ' '.join(filename.split())
         
         # Remove leading/trailing dots and spaces
         filename = filename.strip('. ')
         
         # Handle empty filename
         if not filename:
-            filename = "untitled"
+            filename = fallback
         
         return filename
     
@@ -77,6 +85,12 @@ class FileNameFormatter:
         """
         Get unique filename by appending counter if file exists.
         
+        The directory is listed once and candidates are checked against
+        that listing rather than stat-ing each one. The listing is compared
+        case-insensitively, and only names it matches are confirmed with
+        os.path.exists, so case-insensitive filesystems (the macOS and
+        Windows defaults) see "Video.mp4" and "video.mp4" as one file.
+        
         Args:
             directory: Target directory
             filename: Desired filename
@@ -84,20 +98,24 @@ class FileNameFormatter:
         Returns:
             Unique filename
         """
-        base_path = Path(directory)
-        file_path = base_path / filename
+        try:
+            with os.scandir(directory) as entries:
+                existing = {entry.name.casefold() for entry in entries}
+        except FileNotFoundError:
+            return filename
+        
+        def taken(name: str) -> bool:
+            return name.casefold() in existing and os.path.exists(os.path.join(directory, name))
         
-        if not file_path.exists():
+        if not taken(filename):
             return filename
         
         # Split filename and extension
+        file_path = Path(filename)
         stem = file_path.stem
         suffix = file_path.suffix
         
         counter = 1
-        while True:
-            new_filename = f"{stem}_{counter}{suffix}"
-            new_path = base_path / new_filename
-            if not new_path.exists():
-                return new_filename
+        while taken(f"{stem}_{counter}{suffix}"):
             counter += 1
+        return f"{stem}_{counter}{suffix}"
@@ -0,0 +1,55 @@
+"""
+JSON file helpers with optional orjson acceleration.
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Files larger than this are parsed straight from a memory map
+_MMAP_THRESHOLD = 1 << 20
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON document from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize object to UTF-8 encoded JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file in one call.
+    
+    With orjson, large files are parsed from a read-only memory map
+    instead of being copied into a bytes object first.
+    """
+    path = Path(path)
+    if orjson is not None and path.stat().st_size > _MMAP_THRESHOLD:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+    return loads(path.read_bytes())
+
+
+def write_json(path: Union[str, Path], obj: Any, indent: bool = True) -> None:
+    """Serialize object and atomically replace the JSON file with it."""
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    tmp_path.write_bytes(dumps(obj, indent))
+    os.replace(tmp_path, path)
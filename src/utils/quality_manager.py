@@ -2,29 +2,61 @@
 Quality settings and download resume functionality.
 """
 
-import json
+import atexit
 import os
+import queue
+import threading
+import time
+import weakref
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
-from ..config.constants import AUDIO_QUALITY, VIDEO_QUALITY, AUDIO_FORMAT, DEFAULT_DOWNLOAD_PATH
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Tuple
+from .json_io import read_json, write_json
+from ..config.constants import AUDIO_QUALITY, VIDEO_QUALITY, AUDIO_FORMAT, get_default_download_path
+
+
+@lru_cache(maxsize=None)
+def _nerucord_dir() -> Path:
+    """The per-user ~/.nerucord directory, resolved once per process."""
+    return Path.home() / '.nerucord'
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path):
+    """Create a directory once per process."""
+    path.mkdir(exist_ok=True)
 
 
 class QualityManager:
-    """Manages quality settings and user preferences."""
+    """Manages quality settings and user preferences.
+    
+    The config file is only located and read when a setting is first
+    requested; each setting is then cached on the instance.
+    """
+    
+    _SETTINGS = ('audio_quality', 'video_quality', 'audio_format', 'output_dir')
     
     def __init__(self):
-        self.config_file = Path.home() / '.nerucord' / 'config.json'
-        self._config = self._load_config()
+        self._config: Optional[Dict[str, Any]] = None
+    
+    @cached_property
+    def config_file(self) -> Path:
+        """Path of the user's config file."""
+        return _nerucord_dir() / 'config.json'
+    
+    def _get(self, key: str, default: Any) -> Any:
+        """Read one setting, loading the config on first use."""
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config.get(key, default)
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        return self._get_default_config()
+        try:
+            return read_json(self.config_file)
+        except (OSError, ValueError):  # Includes a missing file
+            return self._get_default_config()
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration."""
@@ -32,58 +64,192 @@ class QualityManager:
             'audio_quality': AUDIO_QUALITY,
             'video_quality': VIDEO_QUALITY,
             'audio_format': AUDIO_FORMAT,
-            'output_dir': DEFAULT_DOWNLOAD_PATH
+            'output_dir': get_default_download_path()
         }
     
+    def reload(self):
+        """Drop the loaded config and cached settings; the file is read again on next use."""
+        self._config = None
+        for name in self._SETTINGS:
+            vars(self).pop(name, None)
+    
+    @cached_property
+    def audio_quality(self) -> str:
+        """Configured audio quality."""
+        return self._get('audio_quality', AUDIO_QUALITY)
+    
+    @cached_property
+    def video_quality(self) -> str:
+        """Configured video quality."""
+        return self._get('video_quality', VIDEO_QUALITY)
+    
+    @cached_property
+    def audio_format(self) -> str:
+        """Configured audio format."""
+        return self._get('audio_format', AUDIO_FORMAT)
+    
+    @cached_property
+    def output_dir(self) -> str:
+        """Configured output directory."""
+        return self._get('output_dir', get_default_download_path())
+    
     def get_audio_quality(self) -> str:
         """Get configured audio quality."""
-        return self._config.get('audio_quality', AUDIO_QUALITY)
+        return self.audio_quality
     
     def get_video_quality(self) -> str:
         """Get configured video quality."""
-        return self._config.get('video_quality', VIDEO_QUALITY)
+        return self.video_quality
     
     def get_audio_format(self) -> str:
         """Get configured audio format."""
-        return self._config.get('audio_format', AUDIO_FORMAT)
+        return self.audio_format
     
     def get_output_dir(self) -> str:
         """Get configured output directory."""
-        return self._config.get('output_dir', DEFAULT_DOWNLOAD_PATH)
+        return self.output_dir
+
+
+# DownloadResume instances whose unsaved changes are written at exit
+_open_resumes: "weakref.WeakSet[DownloadResume]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_resumes():
+    """Flush every open download history once, at interpreter exit."""
+    for resume in list(_open_resumes):
+        resume.flush()
 
 
 class DownloadResume:
-    """Manages download resume functionality."""
+    """Manages download resume functionality.
+    
+    Records are held in dicts keyed by (url, output_path) for constant-time
+    lookups; the file keeps the original lists of records, each with a
+    ``timestamp`` in seconds since the epoch (ISO strings in older files). Writes are
+    coalesced: changes reach the file at most every _FLUSH_INTERVAL
+    seconds or _FLUSH_PENDING changes, on flush(), and at exit. Writes
+    happen on a background thread, so marking never waits on the disk.
+    Nothing is read until the history is first used.
+    """
+    
+    _SECTIONS = ('completed', 'failed', 'in_progress')
+    _FLUSH_INTERVAL = 2.0  # seconds
+    _FLUSH_PENDING = 50  # unsaved changes
     
     def __init__(self):
-        self.resume_file = Path.home() / '.nerucord' / 'downloads.json'
-        self.resume_file.parent.mkdir(exist_ok=True)
-        self._downloads = self._load_downloads()
+        self._completed: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None
+        self._failed: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None
+        self._in_progress: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None
+        self._pending = 0
+        self._last_flush = float('-inf')  # the first change is written at once
+        # Snapshots waiting for the writer thread, started on first write
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        _open_resumes.add(self)
+    
+    @cached_property
+    def resume_file(self) -> Path:
+        """Path of the download history file."""
+        return _nerucord_dir() / 'downloads.json'
+    
+    def _ensure_loaded(self):
+        """Load the download history on first use."""
+        if self._completed is None:
+            self._completed, self._failed, self._in_progress = self._load_downloads()
     
-    def _load_downloads(self) -> Dict[str, Any]:
-        """Load download history from file."""
-        if self.resume_file.exists():
+    def _load_downloads(self) -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], ...]:
+        """Load download history from file, indexed by (url, output_path).
+        
+        A file that cannot be parsed is renamed to
+        downloads.json.corrupt.<timestamp> so it is kept for inspection
+        and not parsed again on every start.
+        """
+        try:
+            data = read_json(self.resume_file)
+            return tuple(
+                {(d['url'], d['output_path']): d for d in data.get(section, [])}
+                for section in self._SECTIONS
+            )
+        except OSError:  # Includes a missing file
+            pass
+        except (ValueError, KeyError, TypeError, AttributeError):
+            self._set_aside_corrupt()
+        return {}, {}, {}
+    
+    def _set_aside_corrupt(self):
+        """Move an unparsable history file out of the way."""
+        corrupt_file = self.resume_file.with_name(
+            f"{self.resume_file.name}.corrupt.{int(time.time())}"
+        )
+        try:
+            self.resume_file.replace(corrupt_file)
+        except OSError:
+            pass
+    
+    def _save_downloads(self):
+        """Record a change, queueing a write if one is due."""
+        self._pending += 1
+        if (self._pending >= self._FLUSH_PENDING
+                or time.monotonic() - self._last_flush >= self._FLUSH_INTERVAL):
+            self._queue_write()
+    
+    def _queue_write(self):
+        """Hand a snapshot of the history to the writer thread."""
+        if not self._pending:
+            return
+        # Records are replaced rather than mutated, so copying the lists
+        # is enough for a consistent snapshot
+        self._queue.put({
+            'completed': list(self._completed.values()),
+            'failed': list(self._failed.values()),
+            'in_progress': list(self._in_progress.values()),
+        })
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._write_loop, name='nerucord-resume-writer', daemon=True
+            )
+            self._writer.start()
+    
+    def _write_loop(self):
+        """Write queued snapshots, skipping any superseded by a newer one.
+        
+        A failed write is dropped rather than ending the thread, which
+        would leave flush() waiting forever.
+        """
+        while True:
+            data = self._queue.get()
+            taken = 1
+            while True:
+                try:
+                    data = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
             try:
-                with open(self.resume_file, 'r') as f:
-                    return json.load(f)
-            except:
+                _ensure_dir(self.resume_file.parent)
+                write_json(self.resume_file, data, indent=False)
+            except Exception:
                 pass
-        return {'completed': [], 'failed': [], 'in_progress': []}
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
     
-    def _save_downloads(self):
-        """Save download history to file."""
-        with open(self.resume_file, 'w') as f:
-            json.dump(self._downloads, f, indent=2)
+    def flush(self):
+        """Write any unsaved changes and wait until they are on disk."""
+        self._queue_write()
+        self._queue.join()
     
     def is_downloaded(self, url: str, output_path: str) -> bool:
         """Check if URL has been successfully downloaded."""
-        for download in self._downloads['completed']:
-            if download['url'] == url and download['output_path'] == output_path:
-                return True
-        return False
+        self._ensure_loaded()
+        return (url, output_path) in self._completed
     
     def mark_completed(self, url: str, output_path: str, file_path: str):
         """Mark download as completed."""
+        self._ensure_loaded()
         download_record = {
             'url': url,
             'output_path': output_path,
@@ -91,80 +257,86 @@ class DownloadResume:
             'timestamp': self._get_timestamp()
         }
         
-        # Remove from in_progress if exists
-        self._downloads['in_progress'] = [
-            d for d in self._downloads['in_progress'] 
-            if not (d['url'] == url and d['output_path'] == output_path)
-        ]
-        
-        # Add to completed
-        self._downloads['completed'].append(download_record)
+        # Move from in_progress (if there) to completed
+        key = (url, output_path)
+        self._in_progress.pop(key, None)
+        self._completed[key] = download_record
         self._save_downloads()
     
     def mark_failed(self, url: str, output_path: str, error: str):
-        """Mark download as failed."""
+        """Mark download as failed.
+        
+        ``error`` is stored as text, so an exception can be passed as is.
+        """
+        self._ensure_loaded()
         download_record = {
             'url': url,
             'output_path': output_path,
-            'error': error,
+            'error': str(error),
             'timestamp': self._get_timestamp()
         }
         
-        # Remove from in_progress if exists
-        self._downloads['in_progress'] = [
-            d for d in self._downloads['in_progress'] 
-            if not (d['url'] == url and d['output_path'] == output_path)
-        ]
-        
-        # Add to failed
-        self._downloads['failed'].append(download_record)
+        # Move from in_progress (if there) to failed
+        key = (url, output_path)
+        self._in_progress.pop(key, None)
+        self._failed[key] = download_record
         self._save_downloads()
     
     def mark_in_progress(self, url: str, output_path: str):
         """Mark download as in progress."""
-        download_record = {
+        self._ensure_loaded()
+        key = (url, output_path)
+        
+        # Check if already in progress
+        if key in self._in_progress:
+            return
+        
+        self._in_progress[key] = {
             'url': url,
             'output_path': output_path,
             'timestamp': self._get_timestamp()
         }
-        
-        # Check if already in progress
-        for download in self._downloads['in_progress']:
-            if download['url'] == url and download['output_path'] == output_path:
-                return
-        
-        self._downloads['in_progress'].append(download_record)
         self._save_downloads()
     
     def get_failed_downloads(self) -> list:
         """Get list of failed downloads."""
-        return self._downloads['failed']
+        self._ensure_loaded()
+        return list(self._failed.values())
     
     def clear_failed(self):
         """Clear failed downloads list."""
-        self._downloads['failed'] = []
+        self._ensure_loaded()
+        self._failed.clear()
         self._save_downloads()
     
-    def _get_timestamp(self) -> str:
-        """Get current timestamp."""
-        from datetime import datetime
-        return datetime.now().isoformat()
+    def _get_timestamp(self) -> float:
+        """Get current timestamp in seconds since the epoch."""
+        return time.time()
+
+
+@lru_cache(maxsize=None)
+def get_quality_manager() -> QualityManager:
+    """The process-wide QualityManager, so the config is read only once."""
+    return QualityManager()
+
+
+# Simplified format selection that works better with YouTube's current format structure
+_VIDEO_FORMATS = MappingProxyType({
+    '240p': 'bestvideo[height<=240]+bestaudio/worst',
+    '360p': 'bestvideo[height<=360]+bestaudio/best',
+    '480p': 'bestvideo[height<=480]+bestaudio/best', 
+    '720p': 'bestvideo[height<=720]+bestaudio/best',
+    '1080p': 'bestvideo[height<=1080]+bestaudio/best',
+    '1440p': 'bestvideo[height<=1440]+bestaudio/best',
+    '2160p': 'bestvideo[height<=2160]+bestaudio/best'
+})
+_DEFAULT_VIDEO_FORMAT = _VIDEO_FORMATS['720p']
 
 
 def get_video_format_options(quality: str) -> str:
     """Get yt-dlp format string for video quality with robust fallback options."""
-    # Simplified format selection that works better with YouTube's current format structure
-    quality_map = {
-        '240p': 'bestvideo[height<=240]+bestaudio/worst',
-        '360p': 'bestvideo[height<=360]+bestaudio/best',
-        '480p': 'bestvideo[height<=480]+bestaudio/best', 
-        '720p': 'bestvideo[height<=720]+bestaudio/best',
-        '1080p': 'bestvideo[height<=1080]+bestaudio/best',
-        '1440p': 'bestvideo[height<=1440]+bestaudio/best',
-        '2160p': 'bestvideo[height<=2160]+bestaudio/best'
-    }
     # Default to 720p
-    return quality_map.get(quality, 'bestvideo[height<=720]+bestaudio/best')
+    return _VIDEO_FORMATS.get(quality, _DEFAULT_VIDEO_FORMAT)
 
 
 def get_audio_format_options(quality: str, format: str) -> Dict[str, Any]:
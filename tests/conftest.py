@@ -5,9 +5,18 @@ Test configuration for pytest.
 import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock
+from pytest_asyncio import is_async_test
 
 
-@pytest.fixture
+def pytest_collection_modifyitems(items):
+    """Run every async test on the one session-wide event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
 def mock_video_info():
     """Fixture for mock video info."""
     from src.domain.entities import VideoInfo
@@ -20,7 +29,7 @@ def mock_video_info():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_playlist_info(mock_video_info):
     """Fixture for mock playlist info."""
     from src.domain.entities import PlaylistInfo
@@ -32,7 +41,7 @@ def mock_playlist_info(mock_video_info):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_youtube_url():
     """Fixture for mock YouTube URL."""
     from src.domain.value_objects import YouTubeURL
@@ -61,11 +70,64 @@ def mock_video_repository():
     return mock
 
 
+class StubDownloaderRepository:
+    """Downloader that returns canned results and records each call.
+    
+    ``results`` maps a method name to a value, an exception to raise, a
+    callable given the call's arguments, or a list consumed one per call.
+    """
+    
+    def __init__(self):
+        self.results = {
+            'download_video': "/path/to/video.mp4",
+            'download_audio': "/path/to/audio.mp3",
+            'download_from_url': "/path/to/download",
+        }
+        self.calls = []
+    
+    def calls_to(self, name):
+        """Return the argument tuples of every call to one method."""
+        return [args for called, args in self.calls if called == name]
+    
+    async def _call(self, name, *args):
+        self.calls.append((name, args))
+        result = self.results[name]
+        if isinstance(result, list):
+            result = result.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        if callable(result):
+            result = result(*args)
+            if asyncio.iscoroutine(result):
+                result = await result
+        return result
+    
+    async def download_video(self, task, progress_callback=None):
+        return await self._call('download_video', task, progress_callback)
+    
+    async def download_audio(self, task, progress_callback=None):
+        return await self._call('download_audio', task, progress_callback)
+    
+    async def download_from_url(self, url, download_type, output_path, progress_callback=None):
+        return await self._call('download_from_url', url, download_type, output_path, progress_callback)
+    
+    async def download_many(self, tasks, on_complete=None):
+        # Download one task at a time through the single-task stubs
+        from src.domain.entities import DownloadType
+        results = []
+        for index, task in enumerate(tasks):
+            download = self.download_audio if task.download_type == DownloadType.AUDIO else self.download_video
+            try:
+                result = await download(task)
+            except Exception as e:
+                result = e
+            results.append(result)
+            if on_complete:
+                on_complete(index, result)
+        return results
+
+
 @pytest.fixture
 def mock_downloader_repository():
-    """Fixture for mock downloader repository."""
-    from src.repositories.interfaces import IDownloaderRepository
-    mock = Mock(spec=IDownloaderRepository)
-    mock.download_video = AsyncMock(return_value="/path/to/video.mp4")
-    mock.download_audio = AsyncMock(return_value="/path/to/audio.mp3")
-    return mock
+    """Fixture for stub downloader repository."""
+    return StubDownloaderRepository()
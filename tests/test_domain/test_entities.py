@@ -32,6 +32,39 @@ class TestVideoInfo:
         """Test that empty title raises ValueError."""
         with pytest.raises(ValueError, match="Title cannot be empty"):
             VideoInfo(title="", url="https://youtube.com/watch?v=test")
+    
+    def test_video_info_formatted_fields(self):
+        """Test formatted duration and view count."""
+        video = VideoInfo(
+            title="Test Video",
+            url="https://youtube.com/watch?v=test",
+            duration=185,
+            view_count=1234567
+        )
+        
+        assert video.duration_fmt == "3:05"
+        assert video.view_count_fmt == "1,234,567"
+    
+    def test_video_info_formatted_fields_unknown(self):
+        """Test formatted fields are empty when values are missing."""
+        video = VideoInfo(title="Test", url="https://youtube.com/watch?v=test")
+        
+        assert video.duration_fmt == ""
+        assert video.view_count_fmt == ""
+    
+    def test_video_info_coerces_float_values(self):
+        """Test float values from flat extraction are stored as ints."""
+        video = VideoInfo(
+            title="Test",
+            url="https://youtube.com/watch?v=test",
+            duration=185.0,
+            view_count=1500.0
+        )
+        
+        assert video.duration == 185
+        assert video.view_count == 1500
+        assert video.duration_fmt == "3:05"
+        assert video.view_count_fmt == "1,500"
 
 
 class TestPlaylistInfo:
@@ -3,7 +3,7 @@ Tests for domain value objects.
 """
 
 import pytest
-from src.domain.value_objects import YouTubeURL, FilePath, Quality
+from src.domain.value_objects import YouTubeURL, FilePath, Quality, make_youtube_url
 
 
 class TestYouTubeURL:
@@ -101,6 +101,10 @@ class TestYouTubeURL:
             (
                 "https://youtube.com/watch?v=test",
                 "https://youtube.com/watch?v=test"
+            ),
+            (
+                "https://youtube.com/watch?v=asi=x&t=30&si=abc",
+                "https://youtube.com/watch?v=asi=x&t=30"
             )
         ]
         
@@ -108,6 +112,48 @@ class TestYouTubeURL:
             youtube_url = YouTubeURL(original)
             normalized = youtube_url.normalize_url()
             assert normalized == expected, f"Failed for {original}: got {normalized}, expected {expected}"
+    
+    def test_normalized_returns_self_when_unchanged(self):
+        """Test that normalized() only builds a new URL when something was stripped."""
+        clean = YouTubeURL("https://youtube.com/watch?v=dQw4w9WgXcQ")
+        tracked = YouTubeURL("https://youtube.com/watch?v=dQw4w9WgXcQ&si=abc")
+        
+        assert clean.normalized() is clean
+        assert tracked.normalized() == clean
+        assert tracked.normalized() is tracked.normalized()
+    
+    def test_cached_classification_keeps_value_semantics(self):
+        """Test that memoized predicates do not affect equality or hashing."""
+        first = YouTubeURL("https://youtube.com/playlist?list=PLtest&si=abc")
+        second = YouTubeURL("https://youtube.com/playlist?list=PLtest&si=abc")
+        
+        assert first == second
+        assert hash(first) == hash(second)
+        assert repr(first) == "YouTubeURL(url='https://youtube.com/playlist?list=PLtest&si=abc')"
+        assert first.is_playlist() is True
+        assert first.is_channel() is False
+        assert first.normalize_url() == "https://youtube.com/playlist?list=PLtest"
+    
+    def test_video_id(self):
+        """Test video ID extraction from the common URL forms."""
+        for url in [
+            "https://youtube.com/watch?v=dQw4w9WgXcQ&si=abc",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://music.youtube.com/watch?v=dQw4w9WgXcQ&list=PLtest",
+        ]:
+            assert YouTubeURL(url).video_id == "dQw4w9WgXcQ", f"Failed for {url}"
+        
+        assert YouTubeURL("https://youtube.com/playlist?list=PLtest").video_id is None
+        assert YouTubeURL("https://youtube.com/watch?v=tooLongToBeAnId").video_id is None
+    
+    def test_make_youtube_url_reuses_instances(self):
+        """Test that the factory returns one shared instance per URL."""
+        url = "https://youtube.com/watch?v=factory123"
+        
+        assert make_youtube_url(url) is make_youtube_url(url)
+        assert make_youtube_url(url) == YouTubeURL(url)
+        with pytest.raises(ValueError):
+            make_youtube_url("https://vimeo.com/123456")
 
 
 class TestFilePath:
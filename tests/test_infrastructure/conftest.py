@@ -0,0 +1,13 @@
+"""
+Shared fixtures for infrastructure tests.
+"""
+
+import pytest
+from types import SimpleNamespace
+
+
+@pytest.fixture
+def fake_fs():
+    """In-memory ``{path: size}`` table with the os.path lookups a repository needs."""
+    files = {}
+    return SimpleNamespace(files=files, exists=files.__contains__, getsize=files.__getitem__)
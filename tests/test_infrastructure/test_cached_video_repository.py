@@ -0,0 +1,35 @@
+"""
+Tests for the disk-cached video repository.
+"""
+
+import pytest
+from src.infrastructure import cached_video_repository
+from src.infrastructure.cached_video_repository import CachedVideoRepository
+
+
+class TestCachedVideoRepository:
+    """Test cases for CachedVideoRepository."""
+    
+    async def test_repeat_lookup_uses_cache(self, tmp_path, mock_video_repository, mock_video_info, mock_youtube_url):
+        """Test that a second lookup of the same URL is served from disk."""
+        pytest.importorskip("diskcache")
+        mock_video_repository.get_video_info.return_value = mock_video_info
+        repo = CachedVideoRepository(mock_video_repository, str(tmp_path))
+        
+        first = await repo.get_video_info(mock_youtube_url)
+        second = await CachedVideoRepository(mock_video_repository, str(tmp_path)).get_video_info(mock_youtube_url)
+        
+        assert first == second == mock_video_info
+        mock_video_repository.get_video_info.assert_awaited_once_with(mock_youtube_url)
+    
+    async def test_without_diskcache_passes_through(self, tmp_path, monkeypatch, mock_video_repository, mock_playlist_info, mock_youtube_url):
+        """Test that every call reaches the wrapped repository without diskcache."""
+        monkeypatch.setattr(cached_video_repository, "Cache", None)
+        mock_video_repository.get_playlist_info.return_value = mock_playlist_info
+        repo = CachedVideoRepository(mock_video_repository, str(tmp_path))
+        
+        await repo.get_playlist_info(mock_youtube_url)
+        result = await repo.get_playlist_info(mock_youtube_url)
+        
+        assert result == mock_playlist_info
+        assert mock_video_repository.get_playlist_info.await_count == 2
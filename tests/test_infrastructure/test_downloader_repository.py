@@ -0,0 +1,97 @@
+"""
+Tests for the yt-dlp downloader repository.
+"""
+
+import asyncio
+import threading
+import yt_dlp
+from unittest.mock import patch
+from src.domain.entities import DownloadTask, DownloadType, VideoInfo
+from src.infrastructure.downloader_repository import YTDLPDownloaderRepository, _on_loop
+from src.infrastructure.file_repository import FileSystemRepository
+
+
+class FakeYoutubeDL(yt_dlp.YoutubeDL):
+    """YoutubeDL that writes an empty file instead of downloading."""
+    
+    instances = 0
+    
+    def __init__(self, params=None):
+        FakeYoutubeDL.instances += 1
+        super().__init__(params)
+    
+    def download(self, url_list):
+        if 'unavailable' in url_list[0]:
+            raise yt_dlp.utils.DownloadError('Video unavailable')
+        path = self.params['outtmpl']['default'].replace('%(ext)s', 'mp4')
+        open(path, 'w').close()
+        for hook in self.params['progress_hooks']:
+            hook({'status': 'downloading', 'downloaded_bytes': 1, 'total_bytes': 2})
+            hook({'status': 'finished', 'filename': path, 'info_dict': {}})
+
+
+class TestYTDLPDownloaderRepository:
+    """Test cases for YTDLPDownloaderRepository."""
+    
+    async def test_download_many_shares_one_session(self, tmp_path):
+        """Test that a batch reuses one YoutubeDL and reports every task."""
+        tasks = [
+            DownloadTask(
+                video_info=VideoInfo(title=f"Video {i}", url=f"https://youtu.be/{video_id}", uploader="Channel"),
+                download_type=DownloadType.VIDEO,
+                output_path=str(tmp_path)
+            )
+            for i, video_id in enumerate(["first", "unavailable", "third"])
+        ]
+        completed = []
+        FakeYoutubeDL.instances = 0
+        
+        with patch('yt_dlp.YoutubeDL', FakeYoutubeDL):
+            results = await YTDLPDownloaderRepository(FileSystemRepository()).download_many(
+                tasks, lambda index, result: completed.append(index)
+            )
+        
+        assert FakeYoutubeDL.instances == 1
+        assert results[0] == str(tmp_path / "[Channel] Video 0.mp4")
+        assert isinstance(results[1], yt_dlp.utils.DownloadError)
+        assert results[2] == str(tmp_path / "[Channel] Video 2.mp4")
+        assert completed == [0, 1, 2]
+    
+    async def test_download_video_reports_progress_on_loop_thread(self, tmp_path):
+        """Test that yt-dlp progress hooks reach the callback on the event loop thread."""
+        task = DownloadTask(
+            video_info=VideoInfo(title="Video", url="https://youtu.be/video", uploader="Channel"),
+            download_type=DownloadType.VIDEO,
+            output_path=str(tmp_path)
+        )
+        calls = []
+        
+        with patch('yt_dlp.YoutubeDL', FakeYoutubeDL):
+            path = await YTDLPDownloaderRepository(FileSystemRepository()).download_video(
+                task, lambda progress: calls.append((progress, threading.get_ident()))
+            )
+        
+        assert path == str(tmp_path / "[Channel] Video.mp4")
+        assert calls == [(50.0, threading.get_ident())]
+    
+    async def test_progress_updates_are_throttled(self):
+        """Test that sub-percent updates arriving together are dropped."""
+        received = []
+        on_progress = _on_loop(received.append)
+        
+        for progress in (10.0, 10.2, 10.9, 11.0, 11.5, 50.0):
+            on_progress(progress)
+        await asyncio.sleep(0)
+        
+        assert received == [10.0, 11.0, 50.0]
+    
+    async def test_final_progress_update_is_never_dropped(self):
+        """Test that 100% reaches the callback even right after a close update."""
+        received = []
+        on_progress = _on_loop(received.append)
+        
+        for progress in (99.4, 99.6, 100.0):
+            on_progress(progress)
+        await asyncio.sleep(0)
+        
+        assert received == [99.4, 100.0]
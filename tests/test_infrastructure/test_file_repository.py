@@ -3,72 +3,99 @@ Tests for infrastructure implementations.
 """
 
 import pytest
-import os
-from unittest.mock import patch, Mock
+from pathlib import Path
 from src.infrastructure.file_repository import FileSystemRepository
+from src.utils.file_formatter import FileNameFormatter
 
 
+_INVALID_NAME = "file<name>:with\"invalid|chars"
+_LONG_NAME = "a" * 250
+_LONG_NAME_WITH_TAIL = "a" * 199 + " .tail"
+
+
+@pytest.fixture(scope="class")
+def repo():
+    """One stateless FileSystemRepository shared by a test class."""
+    return FileSystemRepository()
+
+
+@pytest.mark.xdist_group(name="file_repository")
 class TestFileSystemRepository:
     """Test cases for FileSystemRepository."""
     
-    def test_file_exists_true(self):
+    def test_file_exists_true(self, fake_fs):
         """Test file_exists returns True for existing file."""
-        repo = FileSystemRepository()
-        
-        with patch('os.path.exists', return_value=True):
-            assert repo.file_exists("/path/to/file.txt") is True
+        fake_fs.files["/path/to/file.txt"] = 1024
+        assert FileSystemRepository(fs=fake_fs).file_exists("/path/to/file.txt") is True
     
-    def test_file_exists_false(self):
+    def test_file_exists_false(self, fake_fs):
         """Test file_exists returns False for non-existing file."""
-        repo = FileSystemRepository()
-        
-        with patch('os.path.exists', return_value=False):
-            assert repo.file_exists("/path/to/file.txt") is False
+        assert FileSystemRepository(fs=fake_fs).file_exists("/path/to/file.txt") is False
     
-    def test_get_file_size_existing_file(self):
+    def test_get_file_size_existing_file(self, fake_fs):
         """Test get_file_size for existing file."""
-        repo = FileSystemRepository()
-        
-        with patch('os.path.exists', return_value=True), \
-             patch('os.path.getsize', return_value=1024):
-            assert repo.get_file_size("/path/to/file.txt") == 1024
+        fake_fs.files["/path/to/file.txt"] = 1024
+        assert FileSystemRepository(fs=fake_fs).get_file_size("/path/to/file.txt") == 1024
     
-    def test_get_file_size_non_existing_file(self):
+    def test_get_file_size_non_existing_file(self, fake_fs):
         """Test get_file_size for non-existing file."""
-        repo = FileSystemRepository()
-        
-        with patch('os.path.exists', return_value=False):
-            assert repo.get_file_size("/path/to/file.txt") == 0
+        assert FileSystemRepository(fs=fake_fs).get_file_size("/path/to/file.txt") == 0
     
-    def test_create_directory_success(self):
+    def test_create_directory_success(self, repo, monkeypatch):
         """Test successful directory creation."""
-        repo = FileSystemRepository()
-        
-        with patch('pathlib.Path.mkdir'):
-            assert repo.create_directory("/path/to/directory") is True
+        monkeypatch.setattr(Path, 'mkdir', lambda self, **kwargs: None)
+        assert repo.create_directory("/path/to/directory") is True
     
-    def test_create_directory_failure(self):
+    def test_create_directory_failure(self, repo, monkeypatch):
         """Test directory creation failure."""
-        repo = FileSystemRepository()
+        def mkdir(self, **kwargs):
+            raise PermissionError("Permission denied")
         
-        with patch('pathlib.Path.mkdir', side_effect=Exception("Permission denied")):
-            assert repo.create_directory("/path/to/directory") is False
+        monkeypatch.setattr(Path, 'mkdir', mkdir)
+        assert repo.create_directory("/path/to/directory") is False
     
-    def test_sanitize_filename(self):
+    @pytest.mark.parametrize("raw,expected", [
+        (_INVALID_NAME, "file_name__with_invalid_chars"),
+        ("", "unknown_file"),
+        ("   ", "unknown_file"),
+        ("  .filename.  ", "filename"),
+    ])
+    def test_sanitize_filename(self, repo, raw, expected):
         """Test filename sanitization."""
-        repo = FileSystemRepository()
+        assert repo.sanitize_filename(raw) == expected
+    
+    @pytest.mark.parametrize("raw", [_LONG_NAME, _LONG_NAME_WITH_TAIL])
+    def test_sanitize_filename_limits_length(self, repo, raw):
+        """Test that sanitized names are cut to the length limit."""
+        sanitized = repo.sanitize_filename(raw)
+        assert len(sanitized) <= 200
+        assert not sanitized.endswith(('.', ' '))
+    
+    def test_sanitize_filename_is_pure(self, repo):
+        """Test that repeated sanitization is served from the cache unchanged."""
+        first = repo.sanitize_filename(_INVALID_NAME)
+        hits = FileNameFormatter._sanitize_filename.cache_info().hits
         
-        # Test invalid characters removal
-        assert repo.sanitize_filename("file<name>:with\"invalid|chars") == "file_name__with_invalid_chars"
+        assert repo.sanitize_filename(_INVALID_NAME) == first
+        assert FileNameFormatter._sanitize_filename.cache_info().hits == hits + 1
+    
+    def test_get_unique_filename(self, repo, tmp_path):
+        """Test that the lowest free counter is appended to taken names."""
+        for name in ("video.mp4", "video_1.mp4", "video_3.mp4"):
+            (tmp_path / name).touch()
         
-        # Test length limitation
-        long_name = "a" * 250
-        sanitized = repo.sanitize_filename(long_name)
-        assert len(sanitized) <= 200
+        assert repo.get_unique_filename(str(tmp_path), "other.mp4") == "other.mp4"
+        assert repo.get_unique_filename(str(tmp_path), "video.mp4") == "video_2.mp4"
+        assert repo.get_unique_filename(str(tmp_path / "missing"), "video.mp4") == "video.mp4"
+    
+    def test_get_unique_filename_follows_filesystem_case_rules(self, repo, tmp_path, monkeypatch):
+        """Test that names differing only in case clash only where the filesystem says so."""
+        (tmp_path / "Video.mp4").touch()
         
-        # Test empty filename
-        assert repo.sanitize_filename("") == "unknown_file"
-        assert repo.sanitize_filename("   ") == "unknown_file"
+        # Case-sensitive filesystem: "video.mp4" does not exist
+        monkeypatch.setattr('src.utils.file_formatter.os.path.exists', lambda path: path.endswith("Video.mp4"))
+        assert repo.get_unique_filename(str(tmp_path), "video.mp4") == "video.mp4"
         
-        # Test leading/trailing spaces and dots
-        assert repo.sanitize_filename("  .filename.  ") == "filename"
+        # Case-insensitive filesystem: "video.mp4" is the existing file
+        monkeypatch.setattr('src.utils.file_formatter.os.path.exists', lambda path: True)
+        assert repo.get_unique_filename(str(tmp_path), "video.mp4") == "video_1.mp4"
@@ -0,0 +1,190 @@
+"""
+Tests for the yt-dlp video repository.
+"""
+
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from src.domain.value_objects import YouTubeURL
+from src.infrastructure.youtube_repository import YouTubeVideoRepository
+
+
+class FakeYoutubeDL:
+    """YoutubeDL stand-in that records instances and extracted URLs."""
+    
+    instances = 0
+    extracted = []
+    
+    def __init__(self, params=None):
+        FakeYoutubeDL.instances += 1
+    
+    def extract_info(self, url, download=True, process=True):
+        FakeYoutubeDL.extracted.append(url)
+        return {
+            'title': 'Test Channel',
+            'webpage_url': url,
+            'entries': [{'title': 'Video', 'url': 'https://youtu.be/video'}]
+        }
+
+
+class TestYouTubeVideoRepository:
+    """Test cases for YouTubeVideoRepository."""
+    
+    async def test_get_video_info_extracts_on_executor(self, mock_youtube_url):
+        """Test that the blocking extraction runs on the given executor."""
+        def extract(ydl_opts, url):
+            return {
+                'title': threading.current_thread().name,
+                'webpage_url': url,
+                'duration': 180
+            }
+        
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='test-io') as executor:
+            repo = YouTubeVideoRepository(executor)
+            with patch.object(YouTubeVideoRepository, '_extract', staticmethod(extract)):
+                video_info = await repo.get_video_info(mock_youtube_url)
+        
+        assert video_info.title.startswith('test-io')
+        assert video_info.url == mock_youtube_url.url
+        assert video_info.duration == 180
+    
+    async def test_get_video_info_wraps_errors(self, mock_youtube_url):
+        """Test that extraction failures surface as RuntimeError."""
+        with patch.object(YouTubeVideoRepository, '_extract', staticmethod(lambda ydl_opts, url: None)):
+            with pytest.raises(RuntimeError, match="Video not found"):
+                await YouTubeVideoRepository().get_video_info(mock_youtube_url)
+    
+    async def test_get_video_info_fast_mode_skips_formats(self, mock_youtube_url):
+        """Test that fast lookups use lean options and full lookups do not."""
+        repo = YouTubeVideoRepository()
+        profiles = []
+        
+        def extract(profile, url):
+            profiles.append(repo._profiles[profile])
+            return {'title': 'Test Video', 'webpage_url': url}
+        
+        with patch.object(repo, '_extract', extract):
+            await repo.get_video_info(mock_youtube_url)
+            await repo.get_video_info(mock_youtube_url, fast=False)
+        
+        fast, full = profiles
+        assert fast['extractor_args']['youtube']['player_skip'] == ['js']
+        assert fast['youtube_include_dash_manifest'] is False
+        assert 'extractor_args' not in full
+    
+    async def test_extractions_reuse_one_youtubedl_per_thread(self, mock_youtube_url):
+        """Test that repeated lookups on one worker thread share a YoutubeDL."""
+        FakeYoutubeDL.instances = 0
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            repo = YouTubeVideoRepository(executor)
+            with patch('yt_dlp.YoutubeDL', FakeYoutubeDL):
+                for _ in range(3):
+                    await repo.get_video_info(mock_youtube_url)
+                await repo.get_playlist_info(mock_youtube_url)
+        
+        # One instance for full extraction, one for flat listings
+        assert FakeYoutubeDL.instances == 2
+    
+    async def test_repeated_lookups_reuse_extraction(self, mock_youtube_url):
+        """Test that looking the same URL up again skips the network."""
+        FakeYoutubeDL.extracted = []
+        repo = YouTubeVideoRepository()
+        
+        with patch('yt_dlp.YoutubeDL', FakeYoutubeDL):
+            first = await repo.get_video_info(mock_youtube_url)
+            second = await repo.get_video_info(mock_youtube_url)
+            await repo.get_video_info(mock_youtube_url, fast=False)
+        
+        assert first == second
+        assert FakeYoutubeDL.extracted == [mock_youtube_url.url, mock_youtube_url.url]
+    
+    async def test_get_playlist_info_hydrates_untitled_entries(self):
+        """Test that only flat entries without a title are extracted again."""
+        playlist_url = YouTubeURL("https://youtube.com/playlist?list=PLtest")
+        extracted = []
+        
+        def extract(ydl_opts, url):
+            extracted.append(url)
+            if url == playlist_url.url:
+                return {
+                    'title': 'Test Playlist',
+                    'entries': [
+                        {'title': 'Flat', 'url': 'https://youtu.be/flat'},
+                        {'url': 'https://youtu.be/bare'},
+                        None,
+                    ]
+                }
+            return {'title': 'Hydrated', 'webpage_url': url, 'duration': 60}
+        
+        with patch.object(YouTubeVideoRepository, '_extract', staticmethod(extract)):
+            playlist_info = await YouTubeVideoRepository().get_playlist_info(playlist_url)
+        
+        assert [video.title for video in playlist_info.videos] == ['Flat', 'Hydrated']
+        assert playlist_info.videos[1].duration == 60
+        assert extracted == [playlist_url.url, 'https://youtu.be/bare']
+    
+    async def test_get_playlist_info_leaves_cached_listing_unhydrated(self):
+        """Test that hydrating entries does not rewrite the cached flat listing."""
+        playlist_url = YouTubeURL("https://youtube.com/playlist?list=PLtest")
+        listing = {'title': 'Test Playlist', 'entries': [{'url': 'https://youtu.be/bare'}]}
+        
+        def extract(profile, url):
+            if url == playlist_url.url:
+                return listing
+            return {'title': 'Hydrated', 'webpage_url': url}
+        
+        repo = YouTubeVideoRepository()
+        with patch.object(repo, '_extract', extract):
+            playlist_info = await repo.get_playlist_info(playlist_url)
+        
+        assert [video.title for video in playlist_info.videos] == ['Hydrated']
+        assert listing['entries'] == [{'url': 'https://youtu.be/bare'}]
+    
+    async def test_stream_channel_info_yields_up_to_limit(self, mock_youtube_url):
+        """Test that channel videos stream lazily and stop at the limit."""
+        consumed = []
+        
+        def channel_entries(ydl_opts, url):
+            yield {'title': 'Test Channel', 'subscriber_count': 1000}
+            for n in range(10):
+                consumed.append(n)
+                yield None if n == 1 else {'title': f'Video {n}', 'url': f'https://youtu.be/{n}'}
+        
+        with patch.object(YouTubeVideoRepository, '_channel_entries', staticmethod(channel_entries)):
+            channel_info, videos = await YouTubeVideoRepository().stream_channel_info(mock_youtube_url, 3)
+            titles = [video.title async for video in videos]
+        
+        assert channel_info.title == 'Test Channel'
+        assert channel_info.subscriber_count == 1000
+        assert titles == ['Video 0', 'Video 2', 'Video 3']
+        assert consumed == [0, 1, 2, 3]
+    
+    async def test_get_channel_info_extracts_videos_tab_once(self):
+        """Test that a channel root is fetched as its videos tab, once per session."""
+        channel_url = YouTubeURL("https://www.youtube.com/@channel")
+        FakeYoutubeDL.extracted = []
+        
+        repo = YouTubeVideoRepository()
+        with patch('yt_dlp.YoutubeDL', FakeYoutubeDL):
+            first = await repo.get_channel_info(channel_url)
+            second = await repo.get_channel_info(channel_url)
+        
+        assert FakeYoutubeDL.extracted == ["https://www.youtube.com/@channel/videos"]
+        assert second is first
+        assert [video.title for video in first.videos] == ['Video']
+    
+    async def test_get_channel_info_refetches_after_expiry(self):
+        """Test that a cached channel listing is fetched again once it expires."""
+        channel_url = YouTubeURL("https://www.youtube.com/@channel")
+        FakeYoutubeDL.extracted = []
+        
+        repo = YouTubeVideoRepository()
+        repo._channel_cache._ttl = -1  # Every listing is stored already expired
+        with patch('yt_dlp.YoutubeDL', FakeYoutubeDL):
+            first = await repo.get_channel_info(channel_url)
+            second = await repo.get_channel_info(channel_url)
+        
+        assert second is not first
+        assert len(FakeYoutubeDL.extracted) == 2
@@ -2,40 +2,55 @@
 Tests for use cases.
 """
 
+import asyncio
+import re
 import pytest
 from unittest.mock import AsyncMock
 from src.use_cases.download_use_cases import (
     GetVideoInfoUseCase,
     GetPlaylistInfoUseCase,
     DownloadVideoUseCase,
-    DownloadAudioUseCase
+    DownloadAudioUseCase,
+    DownloadPlaylistUseCase,
+    DownloadChannelUseCase
 )
-from src.domain.entities import DownloadType
+from src.domain.entities import ChannelInfo, DownloadType, PlaylistInfo, VideoInfo
 
 
-class TestGetVideoInfoUseCase:
-    """Test cases for GetVideoInfoUseCase."""
+_INVALID_URL_RE = re.compile("Invalid YouTube URL")
+_DOWNLOAD_FAILED = "Download failed for the provided URL"
+
+
+@pytest.mark.parametrize("use_case_cls,method,url,expected_fixture", [
+    (GetVideoInfoUseCase, "get_video_info", "https://youtube.com/watch?v=test123", "mock_video_info"),
+    (GetPlaylistInfoUseCase, "get_playlist_info", "https://youtube.com/playlist?list=test123", "mock_playlist_info"),
+], ids=["video", "playlist"])
+class TestInfoUseCases:
+    """Test cases shared by GetVideoInfoUseCase and GetPlaylistInfoUseCase."""
     
-    @pytest.mark.asyncio
-    async def test_execute_success(self, mock_video_repository, mock_video_info):
-        """Test successful video info retrieval."""
-        mock_video_repository.get_video_info.return_value = mock_video_info
-        use_case = GetVideoInfoUseCase(mock_video_repository)
+    async def test_execute_success(
+        self, request, mock_video_repository, use_case_cls, method, url, expected_fixture
+    ):
+        """Test successful info retrieval."""
+        expected = request.getfixturevalue(expected_fixture)
+        getattr(mock_video_repository, method).return_value = expected
         
-        result = await use_case.execute("https://youtube.com/watch?v=test123")
+        result = await use_case_cls(mock_video_repository).execute(url)
         
-        assert result == mock_video_info
-        mock_video_repository.get_video_info.assert_called_once()
+        assert result == expected
+        getattr(mock_video_repository, method).assert_called_once()
     
-    @pytest.mark.asyncio
-    async def test_execute_invalid_url_raises_error(self, mock_video_repository):
+    async def test_execute_invalid_url_raises_error(
+        self, mock_video_repository, use_case_cls, method, url, expected_fixture
+    ):
         """Test that invalid URL raises ValueError."""
-        use_case = GetVideoInfoUseCase(mock_video_repository)
-        
-        with pytest.raises(ValueError, match="Invalid YouTube URL"):
-            await use_case.execute("invalid_url")
+        with pytest.raises(ValueError, match=_INVALID_URL_RE):
+            await use_case_cls(mock_video_repository).execute("invalid_url")
+
+
+class TestGetVideoInfoUseCase:
+    """Test cases for GetVideoInfoUseCase."""
     
-    @pytest.mark.asyncio
     async def test_execute_playlist_url_raises_helpful_error(self, mock_video_repository):
         """Test that playlist URL with video command raises helpful error."""
         use_case = GetVideoInfoUseCase(mock_video_repository)
@@ -53,100 +68,197 @@ class TestGetVideoInfoUseCase:
             await use_case.execute("https://music.youtube.com/album/MPREb_1234567890")
 
 
-class TestGetPlaylistInfoUseCase:
-    """Test cases for GetPlaylistInfoUseCase."""
+@pytest.mark.parametrize("use_case_cls,method,expected_path", [
+    (DownloadVideoUseCase, "download_video", "/downloads/video.mp4"),
+    (DownloadAudioUseCase, "download_audio", "/downloads/audio.mp3"),
+], ids=["video", "audio"])
+class TestDownloadSingleUseCases:
+    """Test cases shared by DownloadVideoUseCase and DownloadAudioUseCase."""
     
-    @pytest.mark.asyncio
-    async def test_execute_success(self, mock_video_repository, mock_playlist_info):
-        """Test successful playlist info retrieval."""
-        mock_video_repository.get_playlist_info.return_value = mock_playlist_info
-        use_case = GetPlaylistInfoUseCase(mock_video_repository)
+    async def test_execute_success(
+        self,
+        mock_downloader_repository,
+        mock_file_repository,
+        mock_video_info,
+        use_case_cls,
+        method,
+        expected_path
+    ):
+        """Test successful download."""
+        mock_downloader_repository.results[method] = expected_path
         
-        result = await use_case.execute("https://youtube.com/playlist?list=test123")
+        use_case = use_case_cls(mock_downloader_repository, mock_file_repository)
         
-        assert result == mock_playlist_info
-        mock_video_repository.get_playlist_info.assert_called_once()
+        result = await use_case.execute(mock_video_info, "/downloads")
+        
+        assert result == expected_path
+        mock_file_repository.create_directory.assert_called_once_with("/downloads")
+        assert len(mock_downloader_repository.calls_to(method)) == 1
     
-    @pytest.mark.asyncio
-    async def test_execute_invalid_url_raises_error(self, mock_video_repository):
-        """Test that invalid URL raises ValueError."""
-        use_case = GetPlaylistInfoUseCase(mock_video_repository)
+    async def test_execute_download_failure_raises_error(
+        self,
+        mock_downloader_repository,
+        mock_file_repository,
+        mock_video_info,
+        use_case_cls,
+        method,
+        expected_path
+    ):
+        """Test that download failure raises RuntimeError."""
+        mock_downloader_repository.results[method] = Exception("Download failed")
         
-        with pytest.raises(ValueError, match="Invalid YouTube URL"):
-            await use_case.execute("invalid_url")
+        use_case = use_case_cls(mock_downloader_repository, mock_file_repository)
+        
+        with pytest.raises(RuntimeError) as exc_info:
+            await use_case.execute(mock_video_info, "/downloads")
+        assert str(exc_info.value).startswith(_DOWNLOAD_FAILED)
 
 
 class TestDownloadVideoUseCase:
     """Test cases for DownloadVideoUseCase."""
     
-    @pytest.mark.asyncio
-    async def test_execute_success(
+    async def test_execute_url_success(
         self, 
         mock_downloader_repository, 
-        mock_file_repository, 
-        mock_video_info
+        mock_file_repository
     ):
-        """Test successful video download."""
-        expected_path = "/downloads/video.mp4"
-        mock_downloader_repository.download_video.return_value = expected_path
+        """Test single-session download straight from a URL."""
+        mock_downloader_repository.results['download_from_url'] = "/downloads/video.mp4"
         
         use_case = DownloadVideoUseCase(mock_downloader_repository, mock_file_repository)
         
-        result = await use_case.execute(mock_video_info, "/downloads")
+        result = await use_case.execute_url("https://youtu.be/test123", "/downloads")
         
-        assert result == expected_path
+        assert result == "/downloads/video.mp4"
         mock_file_repository.create_directory.assert_called_once_with("/downloads")
-        mock_downloader_repository.download_video.assert_called_once()
+        assert mock_downloader_repository.calls_to('download_from_url') == [
+            ("https://youtu.be/test123", DownloadType.VIDEO, "/downloads", None)
+        ]
+
+
+class TestDownloadAudioUseCase:
+    """Test cases for DownloadAudioUseCase."""
     
-    @pytest.mark.asyncio
-    async def test_execute_download_failure_raises_error(
+    async def test_execute_url_invalid_url_raises_error(
         self, 
         mock_downloader_repository, 
-        mock_file_repository, 
-        mock_video_info
+        mock_file_repository
     ):
-        """Test that download failure raises RuntimeError."""
-        mock_downloader_repository.download_video.side_effect = Exception("Download failed")
-        
-        use_case = DownloadVideoUseCase(mock_downloader_repository, mock_file_repository)
+        """Test that an invalid URL raises RuntimeError without downloading."""
+        use_case = DownloadAudioUseCase(mock_downloader_repository, mock_file_repository)
         
-        with pytest.raises(RuntimeError, match="Download failed for the provided URL"):
-            await use_case.execute(mock_video_info, "/downloads")
+        with pytest.raises(RuntimeError) as exc_info:
+            await use_case.execute_url("invalid_url", "/downloads")
+        assert str(exc_info.value).startswith(_DOWNLOAD_FAILED)
+        assert mock_downloader_repository.calls_to('download_from_url') == []
 
 
-class TestDownloadAudioUseCase:
-    """Test cases for DownloadAudioUseCase."""
+class TestDownloadPlaylistUseCase:
+    """Test cases for DownloadPlaylistUseCase."""
     
-    @pytest.mark.asyncio
-    async def test_execute_success(
-        self, 
-        mock_downloader_repository, 
-        mock_file_repository, 
-        mock_video_info
+    @staticmethod
+    def _playlist(count):
+        videos = [
+            VideoInfo(title=f"Video {i}", url=f"https://youtube.com/watch?v=v{i}")
+            for i in range(count)
+        ]
+        return PlaylistInfo(
+            title="Test Playlist",
+            url="https://youtube.com/playlist?list=test123",
+            videos=videos
+        )
+    
+    async def test_execute_downloads_concurrently_in_order(
+        self,
+        mock_video_repository,
+        mock_downloader_repository,
+        mock_file_repository
     ):
-        """Test successful audio download."""
-        expected_path = "/downloads/audio.mp3"
-        mock_downloader_repository.download_audio.return_value = expected_path
+        """Test videos download concurrently up to the limit and keep playlist order."""
+        mock_video_repository.get_playlist_info.return_value = self._playlist(5)
+        running = 0
+        peak = 0
         
-        use_case = DownloadAudioUseCase(mock_downloader_repository, mock_file_repository)
+        async def download_audio(task, progress_callback):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return f"/downloads/{task.video_info.title}.mp3"
         
-        result = await use_case.execute(mock_video_info, "/downloads")
+        mock_downloader_repository.results['download_audio'] = download_audio
+        progress = []
+        use_case = DownloadPlaylistUseCase(
+            mock_video_repository, mock_downloader_repository, mock_file_repository,
+            max_concurrent=2
+        )
         
-        assert result == expected_path
-        mock_file_repository.create_directory.assert_called_once_with("/downloads")
-        mock_downloader_repository.download_audio.assert_called_once()
+        result = await use_case.execute(
+            "https://youtube.com/playlist?list=test123", DownloadType.AUDIO, "/downloads",
+            lambda current, total, title: progress.append((current, total))
+        )
+        
+        assert result == [f"/downloads/Video {i}.mp3" for i in range(5)]
+        assert peak == 2
+        assert [current for current, _ in progress] == [1, 2, 3, 4, 5]
     
-    @pytest.mark.asyncio
-    async def test_execute_download_failure_raises_error(
-        self, 
-        mock_downloader_repository, 
-        mock_file_repository, 
-        mock_video_info
+    async def test_execute_retries_rate_limited_downloads(
+        self,
+        mocker,
+        mock_video_repository,
+        mock_downloader_repository,
+        mock_file_repository
     ):
-        """Test that download failure raises RuntimeError."""
-        mock_downloader_repository.download_audio.side_effect = Exception("Download failed")
+        """Test that HTTP 429 errors are retried and other failures skipped."""
+        sleep = mocker.patch("src.use_cases.download_use_cases.asyncio.sleep", AsyncMock())
+        mock_video_repository.get_playlist_info.return_value = self._playlist(2)
+        mock_downloader_repository.results['download_video'] = [
+            Exception("HTTP Error 429: Too Many Requests"),
+            Exception("Video unavailable"),
+            "/downloads/video.mp4",
+        ]
+        use_case = DownloadPlaylistUseCase(
+            mock_video_repository, mock_downloader_repository, mock_file_repository,
+            max_concurrent=1
+        )
         
-        use_case = DownloadAudioUseCase(mock_downloader_repository, mock_file_repository)
+        result = await use_case.execute(
+            "https://youtube.com/playlist?list=test123", DownloadType.VIDEO, "/downloads"
+        )
         
-        with pytest.raises(RuntimeError, match="Download failed for the provided URL"):
-            await use_case.execute(mock_video_info, "/downloads")
+        assert result == ["/downloads/video.mp4"]
+        assert len(mock_downloader_repository.calls_to('download_video')) == 3
+        sleep.assert_awaited_once()
+
+
+class TestDownloadChannelUseCase:
+    """Test cases for DownloadChannelUseCase."""
+    
+    async def test_execute_downloads_selected_videos_in_channel_order(
+        self,
+        mock_video_repository,
+        mock_downloader_repository,
+        mock_file_repository
+    ):
+        """Test that only selected, in-range indices are downloaded, in channel order."""
+        mock_video_repository.get_channel_info = AsyncMock(return_value=ChannelInfo(
+            title="Test Channel",
+            url="https://youtube.com/@test",
+            videos=[
+                VideoInfo(title=f"Video {i}", url=f"https://youtube.com/watch?v=v{i}")
+                for i in range(5)
+            ]
+        ))
+        mock_downloader_repository.results['download_video'] = (
+            lambda task, progress_callback: f"/downloads/{task.video_info.title}.mp4"
+        )
+        use_case = DownloadChannelUseCase(
+            mock_video_repository, mock_downloader_repository, mock_file_repository
+        )
+        
+        result = await use_case.execute(
+            "https://youtube.com/@test", DownloadType.VIDEO, "/downloads", [3, 0, 3, 9]
+        )
+        
+        assert result == ["/downloads/Video 0.mp4", "/downloads/Video 3.mp4"]
@@ -0,0 +1,36 @@
+"""
+Shared fixtures for utility tests.
+"""
+
+import pytest
+from unittest.mock import patch
+from src.utils.quality_manager import QualityManager, DownloadResume
+
+
+@pytest.fixture(autouse=True)
+def nerucord_dir(tmp_path, monkeypatch):
+    """Point ~/.nerucord at a temporary directory so tests never touch the real one."""
+    monkeypatch.setattr('src.utils.quality_manager._nerucord_dir', lambda: tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(scope="module")
+def default_qm():
+    """QualityManager loaded with no config file, shared across a module."""
+    with patch('src.utils.quality_manager.read_json', side_effect=FileNotFoundError):
+        qm = QualityManager()
+        for setting in QualityManager._SETTINGS:
+            getattr(qm, setting)
+    return qm
+
+
+@pytest.fixture(scope="module")
+def empty_resume():
+    """DownloadResume loaded with no history file, shared across a module.
+    
+    Only for tests that do not mark downloads.
+    """
+    with patch('src.utils.quality_manager.read_json', side_effect=FileNotFoundError):
+        dr = DownloadResume()
+        dr._ensure_loaded()
+    return dr
@@ -0,0 +1,23 @@
+"""
+Tests for JSON file helpers.
+"""
+
+import pytest
+from unittest.mock import patch
+from src.utils import json_io
+from src.utils.json_io import read_json, write_json
+
+
+class TestJsonIO:
+    """Test cases for read_json and write_json."""
+    
+    @pytest.mark.parametrize("threshold", [1 << 20, 0])
+    def test_round_trip(self, tmp_path, threshold):
+        """Test that files read back the same, whether read whole or memory-mapped."""
+        path = tmp_path / "downloads.json"
+        data = {'completed': [{'url': f"https://youtu.be/{i}", 'title': "Vidéo"} for i in range(100)]}
+        
+        write_json(path, data, indent=False)
+        with patch.object(json_io, '_MMAP_THRESHOLD', threshold):
+            assert read_json(path) == data
+        assert not (tmp_path / "downloads.json.tmp").exists()
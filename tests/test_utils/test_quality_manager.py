@@ -3,107 +3,221 @@ Tests for utility functions.
 """
 
 import pytest
-import json
 import tempfile
+import threading
 from pathlib import Path
-from unittest.mock import patch, mock_open
-from src.utils.quality_manager import QualityManager, DownloadResume, get_video_format_options, get_audio_format_options
+from src.utils.quality_manager import (
+    QualityManager, DownloadResume, get_quality_manager, get_video_format_options, get_audio_format_options
+)
 
 
+_CUSTOM_CONFIGS = (
+    {'audio_quality': '320', 'audio_format': 'flac', 'video_quality': '1080p', 'output_dir': '/custom/path'},
+    {'audio_quality': '128', 'audio_format': 'm4a', 'video_quality': '480p', 'output_dir': '/other/path'},
+)
+
+
+_VIDEO_CASES = (
+    ('720p', 'bestvideo[height<=720]+bestaudio/best'),
+    ('1080p', 'bestvideo[height<=1080]+bestaudio/best'),
+    ('240p', 'bestvideo[height<=240]+bestaudio/worst'),
+    ('unknown', 'bestvideo[height<=720]+bestaudio/best'),  # default
+)
+
+_AUDIO_CASES = (
+    ('320', 'mp3'),
+    ('128', 'flac'),
+)
+
+
+@pytest.mark.xdist_group(name="quality_manager")
 class TestQualityManager:
     """Test cases for QualityManager."""
     
-    def test_default_config(self):
+    def test_default_config(self, default_qm):
         """Test default configuration values."""
-        with patch('pathlib.Path.exists', return_value=False):
-            qm = QualityManager()
-            assert qm.get_audio_quality() == "192"
-            assert qm.get_audio_format() == "mp3"
-            assert qm.get_video_quality() == "720p"
-            # Output dir should end with NeruCord (platform-specific path)
-            assert qm.get_output_dir().endswith("NeruCord")
+        assert default_qm.get_audio_quality() == "192"
+        assert default_qm.get_audio_format() == "mp3"
+        assert default_qm.get_video_quality() == "720p"
+        # Output dir should end with NeruCord (platform-specific path)
+        assert default_qm.get_output_dir().endswith("NeruCord")
     
-    def test_load_custom_config(self):
+    def test_config_is_loaded_on_first_use(self, mocker):
+        """Test that construction does not touch the home directory."""
+        mocker.patch('pathlib.Path.home', side_effect=AssertionError("home resolved"))
+        
+        QualityManager()
+        DownloadResume()
+    
+    def test_reload_rereads_config(self, mocker):
+        """Test that cached settings are dropped by reload()."""
+        mocker.patch('src.utils.quality_manager.read_json', side_effect=[
+            {'audio_quality': '128'}, {'audio_quality': '320'}
+        ])
+        
+        qm = QualityManager()
+        assert qm.get_audio_quality() == "128"
+        assert qm.audio_quality == "128"
+        
+        qm.reload()
+        assert qm.get_audio_quality() == "320"
+    
+    def test_get_quality_manager_is_shared(self):
+        """Test that the factory returns one process-wide instance."""
+        assert get_quality_manager() is get_quality_manager()
+        assert isinstance(get_quality_manager(), QualityManager)
+    
+    @pytest.mark.parametrize("config_data", _CUSTOM_CONFIGS)
+    def test_load_custom_config(self, mocker, config_data):
         """Test loading custom configuration."""
-        config_data = {
-            'audio_quality': '320',
-            'audio_format': 'flac',
-            'video_quality': '1080p',
-            'output_dir': '/custom/path'
-        }
+        mocker.patch('src.utils.quality_manager.read_json', return_value=config_data)
         
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('builtins.open', mock_open(read_data=json.dumps(config_data))):
-            qm = QualityManager()
-            assert qm.get_audio_quality() == "320"
-            assert qm.get_audio_format() == "flac"
-            assert qm.get_video_quality() == "1080p"
-            assert qm.get_output_dir() == "/custom/path"
+        qm = QualityManager()
+        assert qm.get_audio_quality() == config_data['audio_quality']
+        assert qm.get_audio_format() == config_data['audio_format']
+        assert qm.get_video_quality() == config_data['video_quality']
+        assert qm.get_output_dir() == config_data['output_dir']
 
 
+@pytest.mark.xdist_group(name="quality_manager")
 class TestDownloadResume:
     """Test cases for DownloadResume."""
     
-    def test_empty_downloads_file(self):
+    def test_empty_downloads_file(self, empty_resume):
         """Test behavior with empty downloads file."""
-        with patch('pathlib.Path.exists', return_value=False):
-            dr = DownloadResume()
-            assert not dr.is_downloaded("test_url", "/path")
-            assert dr.get_failed_downloads() == []
+        assert not empty_resume.is_downloaded("test_url", "/path")
+        assert empty_resume.get_failed_downloads() == []
     
-    def test_mark_completed(self):
+    def test_mark_completed(self, mocker):
         """Test marking download as completed."""
-        with patch('pathlib.Path.exists', return_value=False), \
-             patch('builtins.open', mock_open()) as mock_file:
-            dr = DownloadResume()
-            dr.mark_completed("test_url", "/path", "/file.mp4")
-            
-            # Check that file was written
-            mock_file.assert_called()
-            assert not dr.is_downloaded("other_url", "/path")
+        mocker.patch('src.utils.quality_manager.read_json', side_effect=FileNotFoundError)
+        mock_write = mocker.patch('src.utils.quality_manager.write_json')
+        
+        dr = DownloadResume()
+        dr.mark_completed("test_url", "/path", "/file.mp4")
+        dr.flush()
+        
+        # Check that file was written
+        mock_write.assert_called()
+        assert not dr.is_downloaded("other_url", "/path")
     
-    def test_mark_failed(self):
+    def test_mark_failed(self, mocker):
         """Test marking download as failed."""
-        with patch('pathlib.Path.exists', return_value=False), \
-             patch('builtins.open', mock_open()) as mock_file:
-            dr = DownloadResume()
-            dr.mark_failed("test_url", "/path", "Error message")
-            
-            # Check that file was written
-            mock_file.assert_called()
-            failed = dr.get_failed_downloads()
-            assert len(failed) == 1
-            assert failed[0]['url'] == "test_url"
-            assert failed[0]['error'] == "Error message"
+        mocker.patch('src.utils.quality_manager.read_json', side_effect=FileNotFoundError)
+        mock_write = mocker.patch('src.utils.quality_manager.write_json')
+        
+        dr = DownloadResume()
+        dr.mark_failed("test_url", "/path", "Error message")
+        dr.flush()
+        
+        # Check that file was written
+        mock_write.assert_called()
+        failed = dr.get_failed_downloads()
+        assert len(failed) == 1
+        assert failed[0]['url'] == "test_url"
+        assert failed[0]['error'] == "Error message"
+        assert isinstance(failed[0]['timestamp'], float)
+    
+    def test_writes_are_coalesced_until_flush(self, mocker):
+        """Test that marks shortly after a write are held until flush()."""
+        writers = []
+        mocker.patch('src.utils.quality_manager.read_json', side_effect=FileNotFoundError)
+        mock_write = mocker.patch(
+            'src.utils.quality_manager.write_json',
+            side_effect=lambda *args, **kwargs: writers.append(threading.current_thread())
+        )
+        
+        dr = DownloadResume()
+        dr.mark_in_progress("test_url", "/path")
+        dr._queue.join()
+        dr.mark_completed("test_url", "/path", "/file.mp4")
+        dr.mark_failed("other_url", "/path", "Error")
+        assert mock_write.call_count == 1
+        
+        dr.flush()
+        dr.flush()
+        assert mock_write.call_count == 2
+        assert threading.current_thread() not in writers
     
-    def test_clear_failed(self):
+    def test_failed_write_does_not_wedge_flush(self, mocker):
+        """Test that flush() still returns after a write raised."""
+        mocker.patch('src.utils.quality_manager.read_json', side_effect=FileNotFoundError)
+        mock_write = mocker.patch(
+            'src.utils.quality_manager.write_json', side_effect=[TypeError("not serializable"), None]
+        )
+        
+        dr = DownloadResume()
+        
+        def mark_and_flush():
+            dr.mark_failed("test_url", "/path", ValueError("boom"))
+            dr.flush()
+            dr.mark_completed("other_url", "/path", "/file.mp4")
+            dr.flush()
+        
+        flusher = threading.Thread(target=mark_and_flush, daemon=True)
+        flusher.start()
+        flusher.join(timeout=5)
+        
+        assert not flusher.is_alive()
+        assert mock_write.call_count == 2
+        assert dr.get_failed_downloads()[0]['error'] == "boom"
+    
+    def test_load_indexes_existing_history(self, mocker):
+        """Test that records loaded from file are found and moved by key."""
+        history = {
+            'completed': [{'url': 'done_url', 'output_path': '/path', 'file_path': '/done.mp4'}],
+            'failed': [],
+            'in_progress': [{'url': 'test_url', 'output_path': '/path'}]
+        }
+        
+        mocker.patch('src.utils.quality_manager.read_json', return_value=history)
+        mocker.patch('src.utils.quality_manager.write_json')
+        
+        dr = DownloadResume()
+        assert dr.is_downloaded("done_url", "/path")
+        assert not dr.is_downloaded("done_url", "/other")
+        
+        dr.mark_completed("test_url", "/path", "/file.mp4")
+        dr.flush()
+        assert dr.is_downloaded("test_url", "/path")
+        assert dr._in_progress == {}
+    
+    def test_corrupt_history_is_set_aside(self, tmp_path):
+        """Test that an unparsable history file is renamed, not re-read."""
+        resume_file = tmp_path / "downloads.json"
+        resume_file.write_text("{not json")
+        dr = DownloadResume()
+        dr.resume_file = resume_file
+        
+        assert not dr.is_downloaded("test_url", "/path")
+        assert not resume_file.exists()
+        assert [p.name.split('.corrupt.')[0] for p in tmp_path.iterdir()] == ["downloads.json"]
+    
+    def test_clear_failed(self, mocker):
         """Test clearing failed downloads."""
-        with patch('pathlib.Path.exists', return_value=False), \
-             patch('builtins.open', mock_open()) as mock_file:
-            dr = DownloadResume()
-            dr.mark_failed("test_url", "/path", "Error")
-            dr.clear_failed()
-            
-            assert dr.get_failed_downloads() == []
+        mocker.patch('src.utils.quality_manager.read_json', side_effect=FileNotFoundError)
+        mocker.patch('src.utils.quality_manager.write_json')
+        
+        dr = DownloadResume()
+        dr.mark_failed("test_url", "/path", "Error")
+        dr.clear_failed()
+        dr.flush()
+        
+        assert dr.get_failed_downloads() == []
 
 
 class TestFormatOptions:
     """Test cases for format option functions."""
     
-    def test_get_video_format_options(self):
+    @pytest.mark.parametrize("quality,expected", _VIDEO_CASES)
+    def test_get_video_format_options(self, quality, expected):
         """Test video format options generation."""
-        assert get_video_format_options('720p') == 'bestvideo[height<=720]+bestaudio/best'
-        assert get_video_format_options('1080p') == 'bestvideo[height<=1080]+bestaudio/best'
-        assert get_video_format_options('240p') == 'bestvideo[height<=240]+bestaudio/worst'
-        assert get_video_format_options('unknown') == 'bestvideo[height<=720]+bestaudio/best'  # default
+        assert get_video_format_options(quality) == expected
     
-    def test_get_audio_format_options(self):
+    @pytest.mark.parametrize("quality,codec", _AUDIO_CASES)
+    def test_get_audio_format_options(self, quality, codec):
         """Test audio format options generation."""
-        options = get_audio_format_options('320', 'mp3')
+        options = get_audio_format_options(quality, codec)
         assert options['key'] == 'FFmpegExtractAudio'
-        assert options['preferredcodec'] == 'mp3'
-        assert options['preferredquality'] == '320'
-        
-        options = get_audio_format_options('128', 'flac')
-        assert options['preferredcodec'] == 'flac'
-        assert options['preferredquality'] == '128'
+        assert options['preferredcodec'] == codec
+        assert options['preferredquality'] == quality